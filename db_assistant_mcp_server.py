@@ -4,48 +4,44 @@ DB Assistant Amazon Q CLI MCP 서버
 """
 
 import asyncio
+import inspect
+import itertools
 import json
 import os
 import re
 import subprocess
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import sys
 
 import boto3
+import urllib3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# verify=False 클라이언트의 InsecureRequestWarning은 프로세스 시작 시 한 번만 비활성화
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
 try:
     import mysql.connector
+    import mysql.connector.pooling
     from mysql.connector import Error as MySQLError
 except ImportError:
     mysql = None
     MySQLError = Exception
 
-# 분석 관련 라이브러리
+# 분석 관련 라이브러리 (pandas/sklearn/matplotlib은 import 비용이 커서 첫 분석 시점에 로드)
 ANALYSIS_AVAILABLE = False
 CHART_AVAILABLE = False
-try:
-    import pandas as pd
-    import numpy as np
-    import sqlparse
-    import matplotlib
-
-    matplotlib.use("Agg")  # GUI 없는 환경에서 사용
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from sklearn.model_selection import train_test_split
-    from sklearn.preprocessing import PolynomialFeatures
-    from sklearn.linear_model import LinearRegression
-    from sklearn.metrics import mean_squared_error, r2_score
-    from sklearn.impute import SimpleImputer
-
-    ANALYSIS_AVAILABLE = True
-    CHART_AVAILABLE = True
-except ImportError:
-    sqlparse = None
+_analysis_libs_loaded = False
+pd = np = plt = mdates = None
+train_test_split = PolynomialFeatures = LinearRegression = None
+mean_squared_error = r2_score = SimpleImputer = None
+
 
 from mcp.server.models import InitializationOptions
 import mcp.types as types
@@ -72,6 +68,17 @@ from utils.constants import (
     QUERY_RESULTS_BUCKET,
     QUERY_RESULTS_DEV_BUCKET,
     BEDROCK_AGENT_BUCKET,
+    MYSQL_POOL_SIZE,
+    MYSQL_MAX_POOLS,
+    SQL_VALIDATION_CONCURRENCY,
+    LAMBDA_CALL_CONCURRENCY,
+    SECRET_LIST_DISPLAY_LIMIT,
+    SECRET_CACHE_TTL_SECONDS,
+    SCHEMA_CACHE_TTL_SECONDS,
+    SCHEMA_CACHE_MAX_ENTRIES,
+    CLUSTER_LIST_CACHE_TTL_SECONDS,
+    CLUSTER_MEMBERS_CACHE_TTL_SECONDS,
+    DATABASE_LIST_CACHE_TTL_SECONDS,
 )
 from utils.parsers import (
     parse_table_name,
@@ -82,6 +89,8 @@ from utils.parsers import (
     extract_sql_type,
     sanitize_sql,
     is_valid_sql_identifier,
+    SQL_KEYWORDS_NOT_TABLE,
+    MYSQL_KEYWORDS_NOT_TABLE,
 )
 from utils.formatters import (
     format_bytes,
@@ -91,6 +100,17 @@ from utils.formatters import (
     format_timestamp,
     format_sql_for_display,
     format_metric_value,
+    escape_html,
+)
+from utils.report_templates import (
+    CONSOLIDATED_REPORT_HTML,
+    CONSOLIDATED_REPORT_ROW,
+    CONSOLIDATED_VALIDATION_FILE_SECTION,
+    CONSOLIDATED_VALIDATION_REPORT_HEAD,
+    CONSOLIDATED_VALIDATION_REPORT_TAIL,
+    SQL_VALIDATION_REPORT_HEAD,
+    SQL_VALIDATION_REPORT_MIDDLE,
+    SQL_VALIDATION_REPORT_TAIL,
 )
 
 # 모듈 import (리팩토링)
@@ -98,11 +118,207 @@ from modules.lambda_client import LambdaClient  # Week 1
 from modules.cloudwatch_manager import CloudWatchManager  # Week 2
 from modules.report_generator import ReportGenerator  # Week 3
 from modules.sql_parser import SQLParser  # Week 4 Phase 2
+from modules.shared_types import ColumnMeta, IndexMeta
 
 # 로깅 설정 및 전역 변수는 utils 모듈에서 import됨
 # create_session_log, debug_log 함수는 utils/logging_utils.py에서 제공
 # 디렉토리 경로 상수들은 utils/constants.py에서 제공
 
+# DDL 타입 감지용 접두어 테이블 (선행 공백 이후 최대 32자만 대문자로 비교)
+_DDL_TYPE_PREFIXES = (
+    ("CREATE TABLE", "CREATE_TABLE"),
+    ("ALTER TABLE", "ALTER_TABLE"),
+    ("DROP TABLE", "DROP_TABLE"),
+    ("CREATE INDEX", "CREATE_INDEX"),
+    ("DROP INDEX", "DROP_INDEX"),
+    ("INSERT", "INSERT"),
+    ("UPDATE", "UPDATE"),
+    ("DELETE", "DELETE"),
+    ("SELECT", "SELECT"),
+)
+_DDL_TYPE_SCAN_LENGTH = 32
+_SQL_WHITESPACE = " \t\r\n"
+
+# 심각한 오류 이슈 판별용 정규식 (validate_ddl/generate_html_report 공용, 한 번만 컴파일)
+_SEVERE_ISSUE_RE = re.compile(r"오류:|실패|존재하지 않")
+
+# Claude 응답의 실패 판정용 정규식 (응답 문자열을 한 번만 스캔)
+_CLAUDE_ERROR_RE = re.compile(r"오류:|존재하지 않")
+
+# 에러 로그/이벤트 메시지 키워드 판별용 정규식 (키워드별 반복 스캔 대신 한 번에 검색)
+_ERROR_LOG_KEYWORD_RE = re.compile(
+    r"error|warning|critical|failed|crash|exception|fatal|corruption", re.IGNORECASE
+)
+_HIGH_SEVERITY_EVENT_RE = re.compile(r"failed|error|critical|fatal|crash|corruption")
+_MEDIUM_SEVERITY_EVENT_RE = re.compile(r"warning|slow|timeout|retry|restart|reboot")
+
+# DML 구문의 FROM/JOIN/INTO 절에서 참조하는 테이블 이름 (lookahead로 겹치는 매칭까지 수집)
+_TABLE_REFERENCE_RE = re.compile(r"(?=\b(?:FROM|JOIN|INTO)\s+`?(\w+))", re.IGNORECASE)
+
+# 개별 검증 보고서 HTML/파일명 파싱용 정규식 (보고서 파일마다 반복 사용하므로 한 번만 컴파일)
+_REPORT_FILENAME_TIMESTAMP_RE = re.compile(r"(.+?)_\d{8}_\d{6}$")
+_REPORT_SQL_TYPE_RE = re.compile(r"<h4>🔧 SQL 타입</h4>\s*<p>([^<]+)</p>")
+_REPORT_SQL_CODE_RE = re.compile(r'<div class="sql-code"[^>]*>(.*?)</div>', re.DOTALL)
+
+# 데이터 손실 가능성이 있는 (기존 타입, 신규 타입) 변경 쌍 - validate_column_type_change에서 O(1) 조회
+_INCOMPATIBLE_TYPE_CHANGES = frozenset(
+    (from_type, to_type)
+    for from_types, to_types in (
+        # 문자열 -> 숫자
+        (("VARCHAR", "CHAR", "TEXT"), ("INT", "BIGINT", "DECIMAL", "FLOAT", "DOUBLE")),
+        # 숫자 -> 문자열 (일반적으로 안전하지만 데이터 손실 가능)
+        (("INT", "BIGINT", "DECIMAL", "FLOAT", "DOUBLE"), ("VARCHAR", "CHAR")),
+        # 날짜/시간 타입 변경
+        (("DATE", "DATETIME", "TIMESTAMP"), ("INT", "VARCHAR", "CHAR")),
+    )
+    for from_type in from_types
+    for to_type in to_types
+)
+_CHAR_TYPES = frozenset({"VARCHAR", "CHAR"})
+
+# 메트릭 그룹 (아웃라이어 탐지에서 컬럼마다 리스트 리터럴을 순차 비교하던 것을 set 조회로 대체)
+_DBLOAD_METRICS = frozenset({"DBLoad", "DBLoadCPU", "DBLoadNonCPU"})
+_LATENCY_METRICS = frozenset({"ReadLatency", "WriteLatency"})
+
+# get_performance_metrics의 metric_type 값별 조회 섹션
+_QUERY_METRIC_TYPES = frozenset({"all", "query"})
+_CONNECTION_METRIC_TYPES = frozenset({"all", "connection"})
+
+# 클러스터 메트릭 표에 표시하는 주요 메트릭 (메트릭 이름, 표시 이름, 단위)
+_CLUSTER_SUMMARY_METRICS = (
+    ("CPUUtilization", "CPU 사용률", "%"),
+    ("FreeableMemory", "사용 가능한 메모리", "MB"),
+    ("ReadIOPS", "읽기 IOPS", "IOPS"),
+    ("WriteIOPS", "쓰기 IOPS", "IOPS"),
+    ("DatabaseConnections", "데이터베이스 연결 수", "개"),
+    ("AuroraReplicaLag", "Aurora 복제 지연", "ms"),
+)
+
+# SQL 타입 -> 검증 분류 (타입별 리스트 순차 검색 대신 한 번의 dict 조회)
+_SQL_TYPE_CATEGORY = {
+    **dict.fromkeys(
+        ("CREATE_TABLE", "ALTER_TABLE", "CREATE_INDEX", "DROP_TABLE", "DROP_INDEX"), "ddl"
+    ),
+    **dict.fromkeys(("SELECT", "UPDATE", "DELETE", "INSERT"), "dql"),
+    **dict.fromkeys(("SHOW", "SET", "USE"), "skip"),  # 검증하지 않는 SQL 타입
+}
+
+# 사용자 데이터베이스 목록 조회 (시스템 DB 제외를 서버에서 처리하여 Python 필터링 생략)
+_USER_DATABASES_SQL = (
+    "SELECT SCHEMA_NAME FROM information_schema.SCHEMATA "
+    "WHERE SCHEMA_NAME NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys') "
+    "ORDER BY SCHEMA_NAME"
+)
+
+# 재사용 AWS 클라이언트 공용 설정 (HTTP keep-alive 연결 풀, 재시도는 botocore 기본값 유지 -
+# Bedrock 등은 스로틀링이 잦으므로 재시도 횟수를 줄이지 않음)
+_AWS_CLIENT_CONFIG = Config(max_pool_connections=10)
+
+# RDS 클라이언트 설정 (조회 API 실패 시 빠르게 반환하도록 표준 모드 2회 시도)
+_RDS_CLIENT_CONFIG = Config(
+    max_pool_connections=10,
+    retries={"max_attempts": 2, "mode": "standard"},
+)
+
+# 인스턴스 클래스별 vCPU 수 (get_dynamic_dbload_threshold 조회용)
+_INSTANCE_CLASS_VCPUS = {
+    # t3/t4g 시리즈
+    "t3.micro": 2,
+    "t3.small": 2,
+    "t3.medium": 2,
+    "t3.large": 2,
+    "t3.xlarge": 4,
+    "t3.2xlarge": 8,
+    "t4g.micro": 2,
+    "t4g.small": 2,
+    "t4g.medium": 2,
+    "t4g.large": 2,
+    "t4g.xlarge": 4,
+    "t4g.2xlarge": 8,
+    # r5/r6i 시리즈
+    "r5.large": 2,
+    "r5.xlarge": 4,
+    "r5.2xlarge": 8,
+    "r5.4xlarge": 16,
+    "r5.8xlarge": 32,
+    "r5.12xlarge": 48,
+    "r5.16xlarge": 64,
+    "r5.24xlarge": 96,
+    "r6i.large": 2,
+    "r6i.xlarge": 4,
+    "r6i.2xlarge": 8,
+    "r6i.4xlarge": 16,
+    "r6i.8xlarge": 32,
+    "r6i.12xlarge": 48,
+    "r6i.16xlarge": 64,
+    "r6i.24xlarge": 96,
+    "r6i.32xlarge": 128,
+    # m5/m6i 시리즈
+    "m5.large": 2,
+    "m5.xlarge": 4,
+    "m5.2xlarge": 8,
+    "m5.4xlarge": 16,
+    "m5.8xlarge": 32,
+    "m5.12xlarge": 48,
+    "m5.16xlarge": 64,
+    "m5.24xlarge": 96,
+    "m6i.large": 2,
+    "m6i.xlarge": 4,
+    "m6i.2xlarge": 8,
+    "m6i.4xlarge": 16,
+    "m6i.8xlarge": 32,
+    "m6i.12xlarge": 48,
+    "m6i.16xlarge": 64,
+    "m6i.24xlarge": 96,
+    "m6i.32xlarge": 128,
+}
+
+# 클러스터 권장사항 우선순위별 제목 색상
+_PRIORITY_COLORS = {
+    "높음": "#dc3545",
+    "중간": "#ffc107",
+    "낮음": "#28a745",
+}
+
+# 보고서 상태별 (배지 색상, 아이콘)
+_STATUS_STYLE = {
+    "PASS": ("#28a745", "✅"),
+    "FAIL": ("#dc3545", "❌"),
+}
+
+
+def _load_analysis_libs() -> bool:
+    """분석 라이브러리 지연 로드 (최초 1회만 import 시도)"""
+    global ANALYSIS_AVAILABLE, CHART_AVAILABLE, _analysis_libs_loaded
+    global pd, np, plt, mdates
+    global train_test_split, PolynomialFeatures, LinearRegression
+    global mean_squared_error, r2_score, SimpleImputer
+
+    if _analysis_libs_loaded:
+        return ANALYSIS_AVAILABLE
+    _analysis_libs_loaded = True
+
+    try:
+        import pandas as pd
+        import numpy as np
+        import matplotlib
+
+        matplotlib.use("Agg")  # GUI 없는 환경에서 사용
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import PolynomialFeatures
+        from sklearn.linear_model import LinearRegression
+        from sklearn.metrics import mean_squared_error, r2_score
+        from sklearn.impute import SimpleImputer
+
+        ANALYSIS_AVAILABLE = True
+        CHART_AVAILABLE = True
+    except ImportError:
+        logger.warning("분석 라이브러리를 불러올 수 없습니다 (pandas/numpy/sklearn/matplotlib)")
+
+    return ANALYSIS_AVAILABLE
+
 
 class DBAssistantMCPServer:
     def __init__(self):
@@ -141,6 +357,43 @@ class DBAssistantMCPServer:
         self.shared_cursor = None
         self.tunnel_used = False
 
+        # MySQL 연결 풀 (접속 대상별로 재사용하여 핸드셰이크 비용 절감)
+        # LRU 순서 유지 {(host, port, user, database): (password, pool)}
+        self._mysql_pools = OrderedDict()
+        # to_thread 작업자들이 같은 대상의 풀을 중복 생성하지 않도록 풀 생성/교체는 잠금 하에서 수행
+        self._mysql_pool_lock = threading.Lock()
+        # 풀 이름은 교체/제거 후에도 겹치지 않도록 단조 증가 번호 사용
+        self._mysql_pool_seq = itertools.count()
+
+        # boto3 세션 및 Secrets Manager 클라이언트 (호출마다 재생성하지 않고 재사용)
+        self._boto_session = boto3.session.Session()
+        self._sm_client = self._boto_session.client(
+            service_name="secretsmanager",
+            region_name="ap-northeast-2",
+            verify=False,
+            config=_AWS_CLIENT_CONFIG,
+        )
+        # 리전/인증서 검증 여부별 Secrets Manager 클라이언트 캐시 (기본 리전 비검증 클라이언트는 위 클라이언트 공유)
+        self._sm_clients = {("ap-northeast-2", False): self._sm_client}
+        # 서비스/리전별 AWS 클라이언트 캐시 (자격 증명 확인/엔드포인트 설정을 호출마다 반복하지 않고
+        # 클라이언트의 HTTP 연결 풀을 재사용) {(service_name, region): client}
+        self._aws_clients = {}
+        # 공유 boto3 세션은 스레드 안전하지 않으므로 클라이언트 생성은 잠금 하에서만 수행
+        # (asyncio.to_thread 작업자에서 캐시되지 않은 리전 클라이언트를 동시에 만들 수 있음)
+        self._aws_client_lock = threading.Lock()
+        # 검증용 Lambda 동시 호출 제한 (여러 파일을 동시에 검증해도 전체 호출 수가 풀 크기를 넘지 않음)
+        self._lambda_call_semaphore = asyncio.Semaphore(LAMBDA_CALL_CONCURRENCY)
+        # 파싱된 Secret 캐시 {secret_name: (조회 시각, db_config dict)}
+        self._secret_cache = {}
+        # 스키마 정보 LRU+TTL 캐시 {(secret_name, database): (조회 시각, 스키마 지문, schema_info)}
+        self._schema_cache = OrderedDict()
+        # 클러스터 구성 인스턴스 캐시 {(region, cluster_id): (조회 시각, [instance_id, ...])}
+        self._cluster_members_cache = {}
+        # 호스트로 찾은 클러스터 상세 캐시 {(region, host): (조회 시각, cluster dict | None)}
+        self._cluster_by_host_cache = {}
+        # 사용자 데이터베이스 목록 캐시 {database_secret: (조회 시각, [database, ...])}
+        self._user_databases_cache = {}
+
         # 성능 임계값 설정 (utils/constants.py에서 가져옴)
         self.PERFORMANCE_THRESHOLDS = PERFORMANCE_THRESHOLDS
 
@@ -148,6 +401,8 @@ class DBAssistantMCPServer:
         self.cloudwatch = None
         # CloudWatch 메트릭 설정 (utils/constants.py에서 가져옴)
         self.default_metrics = DEFAULT_METRICS
+        # 동적 DBLoad 임계값 계산용 인스턴스 클래스 (collect_db_metrics 실행 시 동기화)
+        self.current_instance_class = "r5.large"
 
         # 기본 리전 설정 (utils/constants.py에서 가져옴)
         self.default_region = self.get_default_region()
@@ -180,11 +435,54 @@ class DBAssistantMCPServer:
         self.sql_parser = SQLParser()
         logger.info("SQL Parser 초기화 완료")
 
+    def _get_secrets_client(self, region: str, verify: bool = True):
+        """리전별 Secrets Manager 클라이언트를 한 번만 생성하여 재사용
+
+        인증서 검증 여부를 캐시 키에 포함하여, 기존에 검증을 끈 호출 지점만 verify=False 클라이언트를 사용한다.
+        """
+        key = (region, verify)
+        client = self._sm_clients.get(key)
+        if client is None:
+            with self._aws_client_lock:
+                client = self._sm_clients.get(key)
+                if client is None:
+                    client = self._boto_session.client(
+                        service_name="secretsmanager",
+                        region_name=region,
+                        verify=verify,
+                        config=_AWS_CLIENT_CONFIG,
+                    )
+                    self._sm_clients[key] = client
+        return client
+
+    def _get_aws_client(self, service_name: str, region: str):
+        """서비스/리전별 AWS 클라이언트를 한 번만 생성하여 재사용"""
+        key = (service_name, region)
+        client = self._aws_clients.get(key)
+        if client is None:
+            with self._aws_client_lock:
+                client = self._aws_clients.get(key)
+                if client is None:
+                    client = self._boto_session.client(
+                        service_name,
+                        region_name=region,
+                        config=(
+                            _RDS_CLIENT_CONFIG
+                            if service_name == "rds"
+                            else _AWS_CLIENT_CONFIG
+                        ),
+                    )
+                    self._aws_clients[key] = client
+        return client
+
+    def _get_rds_client(self, region: str):
+        """리전별 RDS 클라이언트를 한 번만 생성하여 재사용"""
+        return self._get_aws_client("rds", region)
+
     def get_default_region(self) -> str:
         """현재 AWS 프로파일의 기본 리전 가져오기"""
         try:
-            session = boto3.Session()
-            return session.region_name or DEFAULT_REGION
+            return self._boto_session.region_name or DEFAULT_REGION
         except Exception:
             return DEFAULT_REGION
 
@@ -209,26 +507,21 @@ class DBAssistantMCPServer:
         """Knowledge Base에서 관련 정보 조회"""
         try:
             # SQL 타입에 따른 쿼리 조정
-            ddl_types = [
-                "CREATE_TABLE",
-                "ALTER_TABLE",
-                "CREATE_INDEX",
-                "DROP_TABLE",
-                "DROP_INDEX",
-            ]
-            dql_types = ["SELECT", "UPDATE", "DELETE", "INSERT"]
+            sql_category = _SQL_TYPE_CATEGORY.get(sql_type)
 
-            if sql_type in ddl_types:
+            if sql_category == "ddl":
                 # DDL인 경우 데이터베이스 도메인 관리 규칙 조회
                 kb_query = f"데이터베이스 도메인 관리 규칙 {query}"
-            elif sql_type in dql_types:
+            elif sql_category == "dql":
                 # DQL인 경우 Aurora MySQL 최적화 가이드 조회
                 kb_query = f"Aurora MySQL 최적화 가이드 {query}"
             else:
                 # 기본적으로 도메인 관리 규칙 조회
                 kb_query = f"데이터베이스 도메인 관리 규칙 {query}"
 
-            response = self.bedrock_agent_client.retrieve(
+            # 블로킹 boto3 호출은 스레드에서 실행 (스키마 조회 등과 동시에 진행 가능)
+            response = await asyncio.to_thread(
+                self.bedrock_agent_client.retrieve,
                 knowledgeBaseId=self.knowledge_base_id,
                 retrievalQuery={"text": kb_query},
                 retrievalConfiguration={
@@ -302,6 +595,68 @@ class DBAssistantMCPServer:
 
         return f"✅ 기본 리전이 변경되었습니다!\n\n이전: {old_region}\n현재: {self.default_region}\n\n💡 이제 모든 AWS 서비스 호출과 시간 변환이 새 리전 기준으로 작동합니다."
 
+    def _describe_aurora_mysql_clusters(self, region: str) -> List[Dict[str, Any]]:
+        """리전의 사용 가능한 Aurora MySQL 클러스터 목록 조회 (블로킹 - 스레드에서 호출)"""
+        paginator = self._get_rds_client(region).get_paginator("describe_db_clusters")
+        # 엔진은 서버측 필터로 좁히고, 조건에 맞는 클러스터만 골라낸 뒤 필요한 필드를 매핑
+        candidates = (
+            cluster
+            for page in paginator.paginate(
+                Filters=[{"Name": "engine", "Values": ["aurora-mysql"]}]
+            )
+            for cluster in page["DBClusters"]
+            if cluster["Engine"] == "aurora-mysql" and cluster["Status"] == "available"
+        )
+        return [
+            {
+                "identifier": c["DBClusterIdentifier"],
+                "engine_version": c["EngineVersion"],
+                "endpoint": c.get("Endpoint", "N/A"),
+                "status": c["Status"],
+                "database_name": c.get("DatabaseName", "N/A"),
+            }
+            for c in candidates
+        ]
+
+    async def list_aurora_mysql_clusters(
+        self, regions: Optional[List[str]] = None
+    ) -> str:
+        """여러 리전의 Aurora MySQL 클러스터 목록 조회
+
+        리전별 RDS 조회를 스레드에서 동시에 수행하므로 전체 소요 시간은
+        리전 수의 합이 아니라 가장 느린 리전의 응답 시간에 가깝다.
+        """
+        regions = list(dict.fromkeys(regions or [self.default_region]))
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._describe_aurora_mysql_clusters, region)
+                for region in regions
+            ),
+            return_exceptions=True,
+        )
+
+        result_parts = ["🗄️ **Aurora MySQL 클러스터 목록**\n"]
+        total_clusters = 0
+        for region, clusters in zip(regions, results):
+            result_parts.append(f"\n📍 **{region}**\n")
+            if isinstance(clusters, Exception):
+                result_parts.append(f"❌ 조회 실패: {str(clusters)}\n")
+                continue
+            if not clusters:
+                result_parts.append("- 사용 가능한 클러스터가 없습니다.\n")
+                continue
+            total_clusters += len(clusters)
+            result_parts.extend(
+                f"- {c['identifier']} (버전: {c['engine_version']}, DB: {c['database_name']})\n"
+                f"  엔드포인트: {c['endpoint']}\n"
+                for c in clusters
+            )
+
+        result_parts.append(
+            f"\n총 {len(regions)}개 리전에서 {total_clusters}개의 클러스터를 찾았습니다."
+        )
+        return "".join(result_parts)
+
     async def get_secret(self, secret_name):
         """Secrets Manager에서 DB 연결 정보 가져오기 (Lambda 사용)"""
         try:
@@ -322,14 +677,21 @@ class DBAssistantMCPServer:
             logger.error(f"Secret 조회 실패: {e}")
             raise e
 
-    async def get_secrets_by_keyword(self, keyword=""):
-        """키워드로 Secret 목록 가져오기 (Lambda 사용)"""
+    async def get_secrets_by_keyword(self, keyword="", limit: Optional[int] = None):
+        """키워드로 Secret 목록 가져오기 (Lambda 사용)
+
+        limit이 지정되면 Lambda가 해당 개수에 도달하는 즉시 페이지네이션을 중단한다.
+        """
         try:
-            # Lambda 함수 호출
-            result = await self._call_lambda('list-secrets', {
+            payload = {
                 'keyword': keyword,
                 'region': 'ap-northeast-2'
-            })
+            }
+            if limit:
+                payload['limit'] = limit
+
+            # Lambda 함수 호출
+            result = await self._call_lambda('list-secrets', payload)
 
             if result.get('success'):
                 return result.get('secrets', [])
@@ -343,8 +705,13 @@ class DBAssistantMCPServer:
             return []
 
     def setup_ssh_tunnel(self, db_host: str, region: str = "ap-northeast-2") -> bool:
-        """SSH 터널 설정 (EC2에서는 사용 안 함 - VPC 직접 연결)"""
-        logger.info("EC2 VPC 환경: SSH 터널링 건너뛰기")
+        """SSH 터널 설정 (EC2에서는 사용 안 함 - VPC 직접 연결)
+
+        외부 ssh 프로세스 실행이나 고정 대기(sleep) 없이 즉시 반환한다.
+        터널이 다시 필요해지면 프로세스 내 포워더로 구현하고, 채널 준비 완료 시점에
+        반환하도록 하여 고정 대기 시간을 두지 않는다.
+        """
+        logger.debug("EC2 VPC 환경: SSH 터널링 건너뛰기")
         return False  # 항상 False 반환하여 직접 연결 사용
 
     def cleanup_ssh_tunnel(self):
@@ -457,20 +824,19 @@ class DBAssistantMCPServer:
         """개별 쿼리 검증 테스트 함수 (Lambda 기반)"""
         try:
             # SQL 파일 읽기
-            sql_file_path = os.path.join("sql", filename)
-            if not os.path.exists(sql_file_path):
+            sql_file_path = Path("sql") / filename
+            # 파일 읽기는 스레드에서 수행하여 이벤트 루프를 막지 않음
+            try:
+                sql_content = await asyncio.to_thread(
+                    sql_file_path.read_text, encoding="utf-8"
+                )
+            except FileNotFoundError:
                 return f"❌ SQL 파일을 찾을 수 없습니다: {filename}"
 
-            with open(sql_file_path, "r", encoding="utf-8") as f:
-                sql_content = f.read()
-
             logger.info(f"개별 쿼리 검증 시작 (Lambda 기반): {filename}")
 
-            # SQL을 개별 쿼리로 분리
-            if sqlparse:
-                statements = sqlparse.split(sql_content)
-            else:
-                statements = [stmt.strip() for stmt in sql_content.split(";") if stmt.strip()]
+            # SQL을 개별 쿼리로 분리 (동일 내용은 파서 캐시 재사용)
+            statements = self.sql_parser.split_statements(sql_content)
 
             logger.info(f"총 {len(statements)}개의 쿼리로 분리")
 
@@ -579,26 +945,8 @@ class DBAssistantMCPServer:
         create_matches = re.findall(create_pattern, sql_clean, re.IGNORECASE)
 
         # 유효한 테이블명만 필터링 (SQL 키워드 제외)
-        sql_keywords = {
-            "and",
-            "or",
-            "not",
-            "in",
-            "on",
-            "as",
-            "is",
-            "if",
-            "by",
-            "to",
-            "from",
-            "where",
-            "select",
-            "insert",
-            "update",
-            "delete",
-        }
         for table in create_matches:
-            if table.lower() not in sql_keywords and len(table) > 1:
+            if table.lower() not in SQL_KEYWORDS_NOT_TABLE and len(table) > 1:
                 tables.add(table)
 
         return list(tables)
@@ -682,66 +1030,12 @@ class DBAssistantMCPServer:
         # WITH절의 CTE 테이블들 추출
         cte_tables = set(self.extract_cte_tables(sql_content))
 
-        # MySQL 키워드들 (테이블명이 아닌 것들)
-        mysql_keywords = {
-            "CURRENT_TIMESTAMP",
-            "NOW",
-            "NULL",
-            "TRUE",
-            "FALSE",
-            "DEFAULT",
-            "AUTO_INCREMENT",
-            "PRIMARY",
-            "KEY",
-            "UNIQUE",
-            "INDEX",
-            "FOREIGN",
-            "REFERENCES",
-            "ON",
-            "DELETE",
-            "UPDATE",
-            "CASCADE",
-            "SET",
-            "RESTRICT",
-            "NO",
-            "ACTION",
-            "CHECK",
-            "CONSTRAINT",
-            "ENUM",
-            "VARCHAR",
-            "INT",
-            "DECIMAL",
-            "DATETIME",
-            "TIMESTAMP",
-            "TEXT",
-            "BOOLEAN",
-            "TINYINT",
-            "SMALLINT",
-            "MEDIUMINT",
-            "BIGINT",
-            "FLOAT",
-            "DOUBLE",
-            "CHAR",
-            "BINARY",
-            "VARBINARY",
-            "BLOB",
-            "TINYBLOB",
-            "MEDIUMBLOB",
-            "LONGBLOB",
-            "TINYTEXT",
-            "MEDIUMTEXT",
-            "LONGTEXT",
-            "DATE",
-            "TIME",
-            "YEAR",
-        }
-
         # CREATE TABLE 패턴 - 스키마 정보 포함 처리
         create_pattern = r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(?:([a-zA-Z_][a-zA-Z0-9_]*)\.)??`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\("
         create_matches = re.findall(create_pattern, sql_clean, re.IGNORECASE)
         for schema, table in create_matches:
             full_table_name = f"{schema}.{table}" if schema else table
-            if table.upper() not in mysql_keywords:
+            if table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
                 tables.add(full_table_name)
 
         # ALTER TABLE 패턴 - 스키마 정보 포함 처리
@@ -749,7 +1043,7 @@ class DBAssistantMCPServer:
         alter_matches = re.findall(alter_pattern, sql_clean, re.IGNORECASE)
         for schema, table in alter_matches:
             full_table_name = f"{schema}.{table}" if schema else table
-            if table.upper() not in mysql_keywords:
+            if table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
                 tables.add(full_table_name)
 
         # DROP TABLE 패턴 - 스키마 정보 포함 처리
@@ -757,7 +1051,7 @@ class DBAssistantMCPServer:
         drop_matches = re.findall(drop_pattern, sql_clean, re.IGNORECASE)
         for schema, table in drop_matches:
             full_table_name = f"{schema}.{table}" if schema else table
-            if table.upper() not in mysql_keywords:
+            if table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
                 tables.add(full_table_name)
 
         # FROM 패턴 (SELECT, DELETE) - 스키마 정보 포함 처리
@@ -765,7 +1059,7 @@ class DBAssistantMCPServer:
         from_matches = re.findall(from_pattern, sql_clean, re.IGNORECASE)
         for schema, table in from_matches:
             full_table_name = f"{schema}.{table}" if schema else table
-            if table not in cte_tables and table.upper() not in mysql_keywords:
+            if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
                 tables.add(full_table_name)
 
         # JOIN 패턴 - 스키마 정보 포함 처리
@@ -773,7 +1067,7 @@ class DBAssistantMCPServer:
         join_matches = re.findall(join_pattern, sql_clean, re.IGNORECASE)
         for schema, table in join_matches:
             full_table_name = f"{schema}.{table}" if schema else table
-            if table not in cte_tables and table.upper() not in mysql_keywords:
+            if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
                 tables.add(full_table_name)
 
         # UPDATE 패턴 - 스키마 정보 포함 처리
@@ -781,7 +1075,7 @@ class DBAssistantMCPServer:
         update_matches = re.findall(update_pattern, sql_clean, re.IGNORECASE)
         for schema, table in update_matches:
             full_table_name = f"{schema}.{table}" if schema else table
-            if table not in cte_tables and table.upper() not in mysql_keywords:
+            if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
                 tables.add(full_table_name)
 
         # INSERT INTO 패턴 - 스키마 정보 포함 처리
@@ -789,7 +1083,7 @@ class DBAssistantMCPServer:
         insert_matches = re.findall(insert_pattern, sql_clean, re.IGNORECASE)
         for schema, table in insert_matches:
             full_table_name = f"{schema}.{table}" if schema else table
-            if table not in cte_tables and table.upper() not in mysql_keywords:
+            if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
                 tables.add(full_table_name)
 
         return list(tables)
@@ -849,16 +1143,8 @@ class DBAssistantMCPServer:
                 "mysql-connector-python이 설치되지 않았습니다. pip install mysql-connector-python을 실행해주세요."
             )
 
-        # Secret에서 DB 연결 정보 가져오기
-        session = boto3.session.Session()
-        client = session.client(
-            service_name="secretsmanager",
-            region_name="ap-northeast-2",
-            verify=False,
-        )
-        get_secret_value_response = client.get_secret_value(SecretId=database_secret)
-        secret = get_secret_value_response["SecretString"]
-        db_config = json.loads(secret)
+        # Secret에서 DB 연결 정보 가져오기 (파싱된 dict 캐시 사용)
+        db_config = self._get_db_config(database_secret)
 
         connection_config = None
         tunnel_used = False
@@ -910,9 +1196,122 @@ class DBAssistantMCPServer:
                 "connection_timeout": 10,
             }
 
-        connection = mysql.connector.connect(**connection_config)
+        connection = self._get_pooled_connection(connection_config)
         return connection, tunnel_used
 
+    def _get_db_config(self, database_secret: str) -> dict:
+        """Secret의 DB 접속 정보를 파싱된 dict로 반환 (TTL 동안 캐시)"""
+        cached = self._secret_cache.get(database_secret)
+        if cached and time.monotonic() - cached[0] < SECRET_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        get_secret_value_response = self._sm_client.get_secret_value(
+            SecretId=database_secret
+        )
+        db_config = json.loads(get_secret_value_response["SecretString"])
+        self._secret_cache[database_secret] = (time.monotonic(), db_config)
+        return db_config
+
+    def _get_cluster_member_ids(self, region: str, cluster_id: str) -> list:
+        """클러스터 구성 인스턴스 ID 목록 반환 (TTL 동안 캐시)"""
+        cache_key = (region, cluster_id)
+        cached = self._cluster_members_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CLUSTER_MEMBERS_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        response = self._get_rds_client(region).describe_db_clusters(
+            DBClusterIdentifier=cluster_id
+        )
+        member_ids = [
+            member["DBInstanceIdentifier"]
+            for member in response["DBClusters"][0]["DBClusterMembers"]
+        ]
+        self._cluster_members_cache[cache_key] = (time.monotonic(), member_ids)
+        return member_ids
+
+    def _find_cluster_by_host(self, region: str, host: str) -> Optional[dict]:
+        """접속 호스트와 엔드포인트가 일치하는 클러스터 상세 반환 (짧은 TTL 동안 캐시)
+
+        클러스터 목록을 페이지 단위로 조회하며 매칭하고, 찾으면 나머지 페이지는 조회하지 않는다.
+        """
+        cache_key = (region, host)
+        cached = self._cluster_by_host_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < CLUSTER_LIST_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        cluster_info = None
+        paginator = self._get_rds_client(region).get_paginator("describe_db_clusters")
+        for page in paginator.paginate():
+            for cluster in page["DBClusters"]:
+                endpoint = cluster.get("Endpoint", "")
+                if endpoint in host or host in endpoint:
+                    cluster_info = cluster
+                    break
+            if cluster_info is not None:
+                break
+
+        self._cluster_by_host_cache[cache_key] = (time.monotonic(), cluster_info)
+        return cluster_info
+
+    @staticmethod
+    def _close_mysql_pool(pool) -> None:
+        """풀에 남아 있는 유휴 연결 종료 (사용 중인 연결은 반환 시점에 정리됨)"""
+        try:
+            pool._remove_connections()
+        except Exception as e:
+            logger.warning(f"MySQL 연결 풀 정리 실패: {e}")
+
+    def close_mysql_pools(self) -> None:
+        """모든 MySQL 연결 풀의 유휴 연결 종료 (서버 종료 시 호출)"""
+        with self._mysql_pool_lock:
+            pools = [pool for _, pool in self._mysql_pools.values()]
+            self._mysql_pools.clear()
+        for pool in pools:
+            self._close_mysql_pool(pool)
+
+    def _get_pooled_connection(self, connection_config: dict):
+        """접속 대상별 MySQL 연결 풀에서 연결 가져오기
+
+        풀에서 받은 연결의 close()는 실제 종료 대신 풀로 반환된다.
+        풀이 고갈되었거나 풀 생성에 실패하면 직접 연결로 대체한다.
+        """
+        pool_key = (
+            connection_config.get("host"),
+            connection_config.get("port"),
+            connection_config.get("user"),
+            connection_config.get("database"),
+        )
+        password = connection_config.get("password")
+        try:
+            with self._mysql_pool_lock:
+                cached = self._mysql_pools.get(pool_key)
+                # Secret 교체로 비밀번호가 바뀌면 이전 자격 증명으로 재연결하는 기존 풀은 닫고 새로 생성
+                if cached is not None and cached[0] != password:
+                    logger.info(f"DB 자격 증명 변경 감지, MySQL 연결 풀 재생성: {pool_key[0]}:{pool_key[1]}")
+                    del self._mysql_pools[pool_key]
+                    self._close_mysql_pool(cached[1])
+                    cached = None
+                if cached is None:
+                    pool = mysql.connector.pooling.MySQLConnectionPool(
+                        pool_name=f"db_assistant_{next(self._mysql_pool_seq)}",
+                        pool_size=MYSQL_POOL_SIZE,
+                        **connection_config,
+                    )
+                    self._mysql_pools[pool_key] = (password, pool)
+                    logger.info(f"MySQL 연결 풀 생성: {pool_key[0]}:{pool_key[1]}")
+                    # 최대 풀 수 초과 시 가장 오래 사용하지 않은 풀의 유휴 연결 종료
+                    if len(self._mysql_pools) > MYSQL_MAX_POOLS:
+                        evicted_key, (_, evicted_pool) = self._mysql_pools.popitem(last=False)
+                        self._close_mysql_pool(evicted_pool)
+                        logger.info(f"MySQL 연결 풀 정리: {evicted_key[0]}:{evicted_key[1]}")
+                else:
+                    pool = cached[1]
+                    self._mysql_pools.move_to_end(pool_key)
+            return pool.get_connection()
+        except mysql.connector.errors.PoolError as e:
+            logger.warning(f"MySQL 연결 풀 사용 불가, 직접 연결로 대체: {e}")
+            return mysql.connector.connect(**connection_config)
+
     def setup_shared_connection(
         self,
         database_secret: str,
@@ -983,10 +1382,38 @@ class DBAssistantMCPServer:
             return None
         return self.shared_cursor
 
+    @staticmethod
+    def _scan_sql_files() -> List[Path]:
+        """sql 디렉토리의 .sql 파일 목록 (glob의 패턴 매칭 대신 scandir 한 번으로 수집)"""
+        sql_files = []
+        with os.scandir(SQL_DIR) as it:
+            for entry in it:
+                if entry.name.lower().endswith(".sql") and entry.is_file():
+                    sql_files.append(Path(entry.path))
+        return sql_files
+
+    @staticmethod
+    def _scan_recent_reports(since: float) -> List[Path]:
+        """since(epoch 초) 이후 수정된 validation_report_*.html 목록을 수정 시각 순으로 반환
+
+        scandir의 DirEntry가 캐시한 stat을 필터와 정렬에 함께 사용하여 파일별 stat 호출을 한 번으로 줄인다.
+        """
+        recent = []
+        with os.scandir(OUTPUT_DIR) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith("validation_report_") and name.endswith(".html")):
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > since:
+                    recent.append((mtime, Path(entry.path)))
+        recent.sort(key=lambda item: item[0])
+        return [path for _, path in recent]
+
     async def list_sql_files(self) -> str:
         """SQL 파일 목록 조회"""
         try:
-            sql_files = list(SQL_DIR.glob("*.sql"))
+            sql_files = await asyncio.to_thread(self._scan_sql_files)
             if not sql_files:
                 return "sql 디렉토리에 SQL 파일이 없습니다."
 
@@ -998,7 +1425,10 @@ class DBAssistantMCPServer:
     async def list_database_secrets(self, keyword: str = "") -> str:
         """데이터베이스 시크릿 목록 조회"""
         try:
-            secrets = await self.get_secrets_by_keyword(keyword)
+            # 목록 표시용이므로 최대 개수에 도달하면 조회 중단
+            secrets = await self.get_secrets_by_keyword(
+                keyword, limit=SECRET_LIST_DISPLAY_LIMIT
+            )
             if not secrets:
                 return (
                     f"'{keyword}' 키워드로 찾은 시크릿이 없습니다."
@@ -1007,7 +1437,10 @@ class DBAssistantMCPServer:
                 )
 
             secret_list = "\n".join([f"- {secret}" for secret in secrets])
-            return f"데이터베이스 시크릿 목록:\n{secret_list}"
+            result = f"데이터베이스 시크릿 목록:\n{secret_list}"
+            if len(secrets) >= SECRET_LIST_DISPLAY_LIMIT:
+                result += f"\n\n💡 최대 {SECRET_LIST_DISPLAY_LIMIT}개까지 표시됩니다. 키워드로 범위를 좁혀주세요."
+            return result
         except Exception as e:
             return f"시크릿 목록 조회 실패: {str(e)}"
 
@@ -1016,28 +1449,30 @@ class DBAssistantMCPServer:
     ) -> str:
         """데이터베이스 연결 테스트"""
         try:
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, self.selected_database, use_ssh_tunnel
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, self.selected_database, use_ssh_tunnel
             )
 
             if connection.is_connected():
                 db_info = connection.get_server_info()
-                cursor = connection.cursor()
-                cursor.execute("SELECT DATABASE()")
-                current_db = cursor.fetchone()[0]
-
-                # SHOW DATABASES 실행
-                cursor.execute("SHOW DATABASES")
-                databases = [db[0] for db in cursor.fetchall()]
-
-                # 현재 DB의 테이블 목록
-                tables = []
-                if current_db:
-                    cursor.execute("SHOW TABLES")
-                    tables = [table[0] for table in cursor.fetchall()]
-
-                cursor.close()
-                connection.close()
+                # 예외가 나도 커서/연결이 반환되도록 보장 (SSH 터널은 아래 except에서 정리)
+                try:
+                    # 결과 집합을 한 번에 버퍼링하여 fetch마다 소켓 읽기가 발생하지 않도록 함
+                    with connection.cursor(buffered=True) as cursor:
+                        cursor.execute("SELECT DATABASE()")
+                        current_db = cursor.fetchone()[0]
+
+                        # SHOW DATABASES 실행
+                        cursor.execute("SHOW DATABASES")
+                        databases = [db[0] for db in cursor.fetchall()]
+
+                        # 현재 DB의 테이블 목록
+                        tables = []
+                        if current_db:
+                            cursor.execute("SHOW TABLES")
+                            tables = [table[0] for table in cursor.fetchall()]
+                finally:
+                    connection.close()
 
                 result = f"""✅ 데이터베이스 연결 성공!
 
@@ -1088,18 +1523,8 @@ class DBAssistantMCPServer:
             if mysql is None:
                 raise Exception("mysql-connector-python이 설치되지 않았습니다.")
 
-            # Secret에서 DB 연결 정보 가져오기
-            session = boto3.session.Session()
-            client = session.client(
-                service_name="secretsmanager",
-                region_name="ap-northeast-2",
-                verify=False,
-            )
-            get_secret_value_response = client.get_secret_value(
-                SecretId=database_secret
-            )
-            secret = get_secret_value_response["SecretString"]
-            db_config = json.loads(secret)
+            # Secret에서 DB 연결 정보 가져오기 (파싱된 dict 캐시 사용)
+            db_config = await asyncio.to_thread(self._get_db_config, database_secret)
 
             connection_config = None
             tunnel_used = False
@@ -1125,50 +1550,53 @@ class DBAssistantMCPServer:
                 }
 
             # 데이터베이스 없이 연결
-            connection = mysql.connector.connect(**connection_config)
-            cursor = connection.cursor()
-
-            # 데이터베이스 목록 조회
-            cursor.execute("SHOW DATABASES")
-            databases = [
-                db[0]
-                for db in cursor.fetchall()
-                if db[0]
-                not in ["information_schema", "performance_schema", "mysql", "sys"]
-            ]
-
-            cursor.close()
-            connection.close()
+            connection = await asyncio.to_thread(
+                self._get_pooled_connection, connection_config
+            )
 
-            if tunnel_used:
-                self.cleanup_ssh_tunnel()
+            # 예외가 나도 커서/연결이 반환되고 SSH 터널이 정리되도록 보장
+            try:
+                with connection.cursor() as cursor:
+                    # 데이터베이스 목록 조회 (시스템 DB는 쿼리에서 제외)
+                    cursor.execute(_USER_DATABASES_SQL)
+                    databases = [db[0] for db in cursor.fetchall()]
+            finally:
+                connection.close()
+                if tunnel_used:
+                    self.cleanup_ssh_tunnel()
 
-            result = "📋 사용 가능한 데이터베이스 목록:\n\n"
-            for i, db in enumerate(databases, 1):
-                result += f"{i}. {db}\n"
-            result += f"\n총 {len(databases)}개의 데이터베이스가 있습니다."
-            result += "\n\n💡 특정 데이터베이스를 선택하려면 번호나 이름을 사용하세요."
+            # 직후 select_database에서 목록을 다시 조회하지 않도록 캐시
+            self._user_databases_cache[database_secret] = (time.monotonic(), databases)
 
-            return result
+            return self._format_database_list(databases)
 
         except Exception as e:
             return f"❌ 데이터베이스 목록 조회 실패: {str(e)}"
 
+    @staticmethod
+    def _format_database_list(databases: List[str]) -> str:
+        """데이터베이스 목록 출력 문자열 생성"""
+        result_parts = ["📋 사용 가능한 데이터베이스 목록:\n\n"]
+        result_parts.extend(f"{i}. {db}\n" for i, db in enumerate(databases, 1))
+        result_parts.append(f"\n총 {len(databases)}개의 데이터베이스가 있습니다.")
+        result_parts.append("\n\n💡 특정 데이터베이스를 선택하려면 번호나 이름을 사용하세요.")
+        return "".join(result_parts)
+
     async def select_database(
         self, database_secret: str, database_selection: str, use_ssh_tunnel: bool = False  # EC2에서는 VPC 직접 연결
     ) -> str:
         """데이터베이스 선택 (USE 명령어 실행)"""
         try:
-            # 먼저 데이터베이스 목록을 가져와서 유효성 검증
-            db_list_result = await self.list_databases(database_secret, use_ssh_tunnel)
-
-            # 데이터베이스 목록에서 실제 DB 이름들 추출
-            lines = db_list_result.split("\n")
-            databases = []
-            for line in lines:
-                if line.strip() and line[0].isdigit() and ". " in line:
-                    db_name = line.split(". ", 1)[1]
-                    databases.append(db_name)
+            # 먼저 데이터베이스 목록을 가져와서 유효성 검증 (직전 목록 조회 결과가 유효하면 재사용)
+            cached = self._user_databases_cache.get(database_secret)
+            if cached and time.monotonic() - cached[0] < DATABASE_LIST_CACHE_TTL_SECONDS:
+                databases = cached[1]
+                db_list_result = self._format_database_list(databases)
+            else:
+                db_list_result = await self.list_databases(database_secret, use_ssh_tunnel)
+                # 조회 실패 시 캐시에는 만료된 이전 목록이 남아 있으므로 이번 호출에서 갱신된 경우에만 사용
+                refreshed = self._user_databases_cache.get(database_secret)
+                databases = refreshed[1] if refreshed is not cached else []
 
             selected_db = None
 
@@ -1186,37 +1614,40 @@ class DBAssistantMCPServer:
                 else:
                     return f"❌ '{database_selection}' 데이터베이스를 찾을 수 없습니다.\n\n{db_list_result}"
 
-            # 선택된 데이터베이스로 USE 명령어 실행
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, None, use_ssh_tunnel
+            # 선택된 데이터베이스 존재 여부 확인
+            # (풀 연결에 USE를 실행하면 반환 후에도 기본 스키마가 바뀐 채 재사용되므로 조회로만 확인)
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, None, use_ssh_tunnel
             )
 
-            if connection.is_connected():
-                cursor = connection.cursor()
-
-                # USE 명령어 실행
-                cursor.execute(f"USE `{selected_db}`")
-
-                # 현재 데이터베이스 확인
-                cursor.execute("SELECT DATABASE()")
-                current_db = cursor.fetchone()[0]
+            # 예외/연결 실패 시에도 연결이 반환되고 SSH 터널이 정리되도록 보장
+            try:
+                if not connection.is_connected():
+                    return f"❌ 데이터베이스 연결 실패"
 
-                cursor.close()
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT SCHEMA_NAME FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = %s",
+                        (selected_db,),
+                    )
+                    row = cursor.fetchone()
+            finally:
                 connection.close()
+                if tunnel_used:
+                    self.cleanup_ssh_tunnel()
 
-                # 선택된 데이터베이스 저장
-                self.selected_database = selected_db
+            if row is None:
+                return f"❌ '{selected_db}' 데이터베이스를 찾을 수 없습니다.\n\n{db_list_result}"
+            current_db = row[0]
 
-                result = f"✅ 데이터베이스 '{selected_db}' 선택 완료!\n\n"
-                result += f"🔗 현재 활성 데이터베이스: {current_db}\n"
-                result += f"💡 이제 이 데이터베이스에 대해 스키마 분석이나 SQL 검증을 수행할 수 있습니다."
+            # 선택된 데이터베이스 저장
+            self.selected_database = selected_db
 
-                if tunnel_used:
-                    self.cleanup_ssh_tunnel()
+            result = f"✅ 데이터베이스 '{selected_db}' 선택 완료!\n\n"
+            result += f"🔗 현재 활성 데이터베이스: {current_db}\n"
+            result += f"💡 이제 이 데이터베이스에 대해 스키마 분석이나 SQL 검증을 수행할 수 있습니다."
 
-                return result
-            else:
-                return f"❌ 데이터베이스 연결 실패"
+            return result
 
         except Exception as e:
             logger.error(f"데이터베이스 선택 오류: {e}")
@@ -1226,8 +1657,8 @@ class DBAssistantMCPServer:
         """현재 스키마 요약 정보 반환"""
         try:
             # 직접 데이터베이스 연결해서 스키마 정보 조회
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, self.selected_database
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, self.selected_database
             )
             cursor = connection.cursor()
 
@@ -1248,9 +1679,31 @@ class DBAssistantMCPServer:
 
             tables_info = cursor.fetchall()
 
-            summary = f"""📊 데이터베이스 스키마 요약 (DB: {current_db})
+            # 테이블별 컬럼/인덱스 수는 테이블마다 조회하지 않고 스키마 전체를 한 번에 집계
+            cursor.execute(
+                """
+                SELECT table_name, COUNT(*) FROM information_schema.columns
+                WHERE table_schema = DATABASE()
+                GROUP BY table_name
+            """
+            )
+            column_counts = dict(cursor.fetchall())
+
+            cursor.execute(
+                """
+                SELECT table_name, COUNT(DISTINCT index_name) FROM information_schema.statistics
+                WHERE table_schema = DATABASE()
+                GROUP BY table_name
+            """
+            )
+            index_counts = dict(cursor.fetchall())
+
+            # 테이블 수만큼 += 로 문자열을 복사하지 않도록 조각을 모아 한 번에 결합
+            summary_parts = [
+                f"""📊 데이터베이스 스키마 요약 (DB: {current_db})
 
 📋 **테이블 목록** ({len(tables_info)}개):"""
+            ]
 
             for table_info in tables_info:
                 table_name = table_info[0]
@@ -1259,33 +1712,18 @@ class DBAssistantMCPServer:
                 rows = table_info[3] or 0
                 comment = table_info[6] or ""
 
-                # 컬럼 수 조회
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) FROM information_schema.columns 
-                    WHERE table_schema = DATABASE() AND table_name = %s
-                """,
-                    (table_name,),
-                )
-                column_count = cursor.fetchone()[0]
-
-                # 인덱스 수 조회
-                cursor.execute(
-                    """
-                    SELECT COUNT(DISTINCT index_name) FROM information_schema.statistics 
-                    WHERE table_schema = DATABASE() AND table_name = %s
-                """,
-                    (table_name,),
-                )
-                index_count = cursor.fetchone()[0]
+                column_count = column_counts.get(table_name, 0)
+                index_count = index_counts.get(table_name, 0)
 
-                summary += f"""
+                summary_parts.append(
+                    f"""
   🔹 **{table_name}** ({engine})
      - 컬럼: {column_count}개, 인덱스: {index_count}개
      - 예상 행 수: {rows:,}"""
+                )
 
                 if comment:
-                    summary += f"\n     - 설명: {comment}"
+                    summary_parts.append(f"\n     - 설명: {comment}")
 
             cursor.close()
             connection.close()
@@ -1293,7 +1731,7 @@ class DBAssistantMCPServer:
             if tunnel_used:
                 self.cleanup_ssh_tunnel()
 
-            return summary
+            return "".join(summary_parts)
 
         except Exception as e:
             return f"❌ 스키마 요약 생성 실패: {str(e)}"
@@ -1301,8 +1739,8 @@ class DBAssistantMCPServer:
     async def get_table_schema(self, database_secret: str, table_name: str) -> str:
         """특정 테이블의 상세 스키마 정보 조회"""
         try:
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, self.selected_database
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, self.selected_database
             )
             cursor = connection.cursor()
 
@@ -1332,32 +1770,33 @@ class DBAssistantMCPServer:
 
             columns = cursor.fetchall()
 
-            result = f"📋 **테이블 '{table_name}' 스키마 정보**\n\n"
-            result += f"📊 **컬럼 목록** ({len(columns)}개):\n"
+            result_parts = [
+                f"📋 **테이블 '{table_name}' 스키마 정보**\n\n",
+                f"📊 **컬럼 목록** ({len(columns)}개):\n",
+            ]
+            append = result_parts.append
 
             for col in columns:
                 col_name, data_type, is_nullable, default_val, comment, key, extra = col
 
-                result += f"\n🔹 **{col_name}**\n"
-                result += f"   - 타입: {data_type}\n"
-                result += (
-                    f"   - NULL 허용: {'예' if is_nullable == 'YES' else '아니오'}\n"
-                )
+                append(f"\n🔹 **{col_name}**\n")
+                append(f"   - 타입: {data_type}\n")
+                append(f"   - NULL 허용: {'예' if is_nullable == 'YES' else '아니오'}\n")
 
                 if default_val is not None:
-                    result += f"   - 기본값: {default_val}\n"
+                    append(f"   - 기본값: {default_val}\n")
 
                 if key:
                     key_type = {"PRI": "기본키", "UNI": "고유키", "MUL": "인덱스"}.get(
                         key, key
                     )
-                    result += f"   - 키 타입: {key_type}\n"
+                    append(f"   - 키 타입: {key_type}\n")
 
                 if extra:
-                    result += f"   - 추가 속성: {extra}\n"
+                    append(f"   - 추가 속성: {extra}\n")
 
                 if comment:
-                    result += f"   - 설명: {comment}\n"
+                    append(f"   - 설명: {comment}\n")
 
             cursor.close()
             connection.close()
@@ -1365,7 +1804,7 @@ class DBAssistantMCPServer:
             if tunnel_used:
                 self.cleanup_ssh_tunnel()
 
-            return result
+            return "".join(result_parts)
 
         except Exception as e:
             return f"❌ 테이블 스키마 조회 실패: {str(e)}"
@@ -1376,8 +1815,8 @@ class DBAssistantMCPServer:
         """자연어 쿼리를 SQL로 변환하고 실행"""
         try:
             # 데이터베이스 연결
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, self.selected_database
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, self.selected_database
             )
             cursor = connection.cursor()
 
@@ -1385,18 +1824,20 @@ class DBAssistantMCPServer:
             cursor.execute("SHOW TABLES")
             tables = [table[0] for table in cursor.fetchall()]
 
-            schema_info = {}
-            for table in tables:
-                cursor.execute(
-                    f"""
-                    SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY, EXTRA, COLUMN_COMMENT
-                    FROM information_schema.columns 
-                    WHERE table_schema = DATABASE() AND table_name = '{table}'
-                    ORDER BY ORDINAL_POSITION
+            # 테이블마다 같은 쿼리를 반복 실행하는 대신 스키마 전체 컬럼을 한 번에 조회해 테이블별로 분류
+            schema_info = {table: [] for table in tables}
+            cursor.execute(
                 """
-                )
-                columns = cursor.fetchall()
-                schema_info[table] = columns
+                SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY, EXTRA, COLUMN_COMMENT
+                FROM information_schema.columns 
+                WHERE table_schema = DATABASE()
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """
+            )
+            for row in cursor.fetchall():
+                columns = schema_info.get(row[0])
+                if columns is not None:
+                    columns.append(row[1:])
 
             # Claude에게 SQL 생성 요청
             sql_query = await self.generate_sql_with_claude(
@@ -1466,16 +1907,20 @@ class DBAssistantMCPServer:
         """Claude를 사용하여 자연어를 SQL로 변환"""
         try:
             # 스키마 정보를 문자열로 변환
-            schema_text = "데이터베이스 스키마 정보:\n\n"
+            # 전체 테이블/컬럼 수만큼 += 하지 않고 조각을 모아 한 번에 결합
+            schema_parts = ["데이터베이스 스키마 정보:\n\n"]
             for table_name, columns in schema_info.items():
-                schema_text += f"테이블: {table_name}\n"
+                schema_parts.append(f"테이블: {table_name}\n")
                 for col in columns:
                     col_name, data_type, is_nullable, key, extra, comment = col
                     key_info = f" [{key}]" if key else ""
                     extra_info = f" {extra}" if extra else ""
                     comment_info = f" -- {comment}" if comment else ""
-                    schema_text += f"  - {col_name}: {data_type}{key_info}{extra_info}{comment_info}\n"
-                schema_text += "\n"
+                    schema_parts.append(
+                        f"  - {col_name}: {data_type}{key_info}{extra_info}{comment_info}\n"
+                    )
+                schema_parts.append("\n")
+            schema_text = "".join(schema_parts)
 
             prompt = f"""당신은 Aurora MySQL 8.0 전문가입니다. 주어진 스키마 정보를 바탕으로 자연어 질문을 정확한 SQL 쿼리로 변환해주세요.
 
@@ -1492,8 +1937,8 @@ class DBAssistantMCPServer:
 
 SQL 쿼리:"""
 
-            # Claude 호출
-            bedrock_client = boto3.client("bedrock-runtime", region_name="us-west-2")
+            # Claude 호출 (초기화 시 생성한 us-west-2 Bedrock 클라이언트 재사용)
+            bedrock_client = self.bedrock_client
 
             body = {
                 "anthropic_version": "bedrock-2023-05-31",
@@ -1524,8 +1969,8 @@ SQL 쿼리:"""
     async def get_table_index(self, database_secret: str, table_name: str) -> str:
         """특정 테이블의 인덱스 정보 조회"""
         try:
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, self.selected_database
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, self.selected_database
             )
             cursor = connection.cursor()
 
@@ -1565,10 +2010,7 @@ SQL 쿼리:"""
                 # 인덱스별로 그룹화
                 index_groups = {}
                 for idx in indexes:
-                    idx_name = idx[0]
-                    if idx_name not in index_groups:
-                        index_groups[idx_name] = []
-                    index_groups[idx_name].append(idx)
+                    index_groups.setdefault(idx[0], []).append(idx)
 
                 result += f"📊 **인덱스 목록** ({len(index_groups)}개):\n"
 
@@ -1604,70 +2046,72 @@ SQL 쿼리:"""
     ) -> str:
         """데이터베이스 성능 메트릭 조회"""
         try:
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, self.selected_database
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, self.selected_database
             )
-            cursor = connection.cursor()
-
-            result = f"📊 **데이터베이스 성능 메트릭**\n\n"
 
-            if metric_type in ["all", "query"]:
-                # 쿼리 성능 통계
-                cursor.execute(
-                    """
-                    SELECT 
-                        DIGEST_TEXT as query_pattern,
-                        COUNT_STAR as exec_count,
-                        ROUND(AVG_TIMER_WAIT/1000000000000, 6) as avg_time_sec,
-                        ROUND(MAX_TIMER_WAIT/1000000000000, 6) as max_time_sec,
-                        ROUND(SUM_TIMER_WAIT/1000000000000, 6) as total_time_sec
-                    FROM performance_schema.events_statements_summary_by_digest 
-                    WHERE DIGEST_TEXT IS NOT NULL
-                    ORDER BY AVG_TIMER_WAIT DESC 
-                    LIMIT 5
-                """
-                )
+            result_parts = ["📊 **데이터베이스 성능 메트릭**\n\n"]
 
-                query_stats = cursor.fetchall()
-                if query_stats:
-                    result += "🔍 **느린 쿼리 TOP 5:**\n"
-                    for i, (
-                        pattern,
-                        count,
-                        avg_time,
-                        max_time,
-                        total_time,
-                    ) in enumerate(query_stats, 1):
-                        pattern_short = (
-                            (pattern[:60] + "...") if len(pattern) > 60 else pattern
+            # 예외가 나도 커서/연결이 반환되고 SSH 터널이 정리되도록 보장
+            try:
+                with connection.cursor() as cursor:
+                    if metric_type in _QUERY_METRIC_TYPES:
+                        # 쿼리 성능 통계
+                        cursor.execute(
+                            """
+                            SELECT 
+                                DIGEST_TEXT as query_pattern,
+                                COUNT_STAR as exec_count,
+                                ROUND(AVG_TIMER_WAIT/1000000000000, 6) as avg_time_sec,
+                                ROUND(MAX_TIMER_WAIT/1000000000000, 6) as max_time_sec,
+                                ROUND(SUM_TIMER_WAIT/1000000000000, 6) as total_time_sec
+                            FROM performance_schema.events_statements_summary_by_digest 
+                            WHERE DIGEST_TEXT IS NOT NULL
+                            ORDER BY AVG_TIMER_WAIT DESC 
+                            LIMIT 5
+                        """
                         )
-                        result += f"{i}. {pattern_short}\n"
-                        result += f"   - 실행횟수: {count:,}, 평균시간: {avg_time:.3f}초, 최대시간: {max_time:.3f}초\n\n"
-
-            if metric_type in ["all", "connection"]:
-                # 연결 통계
-                cursor.execute(
-                    """
-                    SELECT 
-                        COUNT(*) as total_connections,
-                        SUM(CASE WHEN COMMAND != 'Sleep' THEN 1 ELSE 0 END) as active_connections
-                    FROM information_schema.processlist
-                """
-                )
 
-                conn_stats = cursor.fetchone()
-                if conn_stats:
-                    result += f"🔗 **연결 통계:**\n"
-                    result += f"- 총 연결: {conn_stats[0]}개\n"
-                    result += f"- 활성 연결: {conn_stats[1]}개\n\n"
+                        query_stats = cursor.fetchall()
+                        if query_stats:
+                            result_parts.append("🔍 **느린 쿼리 TOP 5:**\n")
+                            for i, (
+                                pattern,
+                                count,
+                                avg_time,
+                                max_time,
+                                total_time,
+                            ) in enumerate(query_stats, 1):
+                                pattern_short = (
+                                    (pattern[:60] + "...") if len(pattern) > 60 else pattern
+                                )
+                                result_parts.append(f"{i}. {pattern_short}\n")
+                                result_parts.append(
+                                    f"   - 실행횟수: {count:,}, 평균시간: {avg_time:.3f}초, 최대시간: {max_time:.3f}초\n\n"
+                                )
 
-            cursor.close()
-            connection.close()
+                    if metric_type in _CONNECTION_METRIC_TYPES:
+                        # 연결 통계
+                        cursor.execute(
+                            """
+                            SELECT 
+                                COUNT(*) as total_connections,
+                                SUM(CASE WHEN COMMAND != 'Sleep' THEN 1 ELSE 0 END) as active_connections
+                            FROM information_schema.processlist
+                        """
+                        )
 
-            if tunnel_used:
-                self.cleanup_ssh_tunnel()
+                        conn_stats = cursor.fetchone()
+                        if conn_stats:
+                            result_parts.append("🔗 **연결 통계:**\n")
+                            result_parts.append(f"- 총 연결: {conn_stats[0]}개\n")
+                            result_parts.append(f"- 활성 연결: {conn_stats[1]}개\n\n")
+            finally:
+                connection.close()
+                if tunnel_used:
+                    self.cleanup_ssh_tunnel()
 
-            return result
+            return "".join(result_parts)
 
         except Exception as e:
             return f"❌ 성능 메트릭 조회 실패: {str(e)}"
@@ -1680,12 +2124,15 @@ SQL 쿼리:"""
         """특정 SQL 파일 검증"""
         try:
             sql_file_path = SQL_DIR / filename
-            if not sql_file_path.exists():
+            # 파일 읽기는 스레드에서 수행하여 이벤트 루프를 막지 않음
+            # (exists() 선확인 없이 바로 읽어 stat 호출을 줄이고 확인-사용 간 경쟁 조건 제거)
+            try:
+                ddl_content = await asyncio.to_thread(
+                    sql_file_path.read_text, encoding="utf-8"
+                )
+            except FileNotFoundError:
                 return f"SQL 파일을 찾을 수 없습니다: {filename}"
 
-            with open(sql_file_path, "r", encoding="utf-8") as f:
-                ddl_content = f.read()
-
             result = await self.validate_ddl(ddl_content, database_secret, filename)
             return result
         except Exception as e:
@@ -1699,12 +2146,22 @@ SQL 쿼리:"""
             if not filenames:
                 return "검증할 SQL 파일이 없습니다."
 
-            # 개별 파일 검증
-            results = []
-            for filename in filenames:
-                logger.info(f"검증 중: {filename}")
-                result = await self.validate_sql_file(filename, database_secret)
-                results.append(f"✅ {filename}: {result.split(chr(10))[0]}")  # 첫 줄만
+            # 개별 파일 검증 - DB/Lambda/Claude 호출 대기가 대부분이므로 파일들을 동시에 검증
+            # (연결 풀을 넘지 않도록 동시 실행 수 제한, gather 결과는 입력 파일 순서 유지)
+            semaphore = asyncio.Semaphore(SQL_VALIDATION_CONCURRENCY)
+
+            async def _validate_one(filename: str) -> str:
+                async with semaphore:
+                    logger.info(f"검증 중: {filename}")
+                    return await self.validate_sql_file(filename, database_secret)
+
+            file_results = await asyncio.gather(
+                *(_validate_one(filename) for filename in filenames)
+            )
+            results = [
+                f"✅ {filename}: {result.split(chr(10))[0]}"  # 첫 줄만
+                for filename, result in zip(filenames, file_results)
+            ]
 
             # 2개 이상이면 통합 보고서 생성
             if len(filenames) >= 2:
@@ -1718,35 +2175,29 @@ SQL 쿼리:"""
     async def auto_generate_consolidated_report(self) -> str:
         """최근 생성된 개별 보고서들을 수집해서 통합 보고서 생성"""
         try:
-            import re
             from datetime import timedelta
 
-            # 최근 5분 내에 생성된 validation_report 찾기
+            # 최근 5분 내에 생성된 validation_report 찾기 (수정 시각 순 정렬)
             now = datetime.now()
-            recent_reports = []
-
-            for html_file in OUTPUT_DIR.glob('validation_report_*.html'):
-                mtime = datetime.fromtimestamp(html_file.stat().st_mtime)
-                if now - mtime < timedelta(minutes=5):
-                    recent_reports.append(html_file)
+            recent_reports = await asyncio.to_thread(
+                self._scan_recent_reports,
+                (now - timedelta(minutes=5)).timestamp(),
+            )
 
             if len(recent_reports) < 2:
                 return "통합 보고서 생성 조건 미달 (최근 보고서 2개 미만)"
 
-            recent_reports.sort(key=lambda x: x.stat().st_mtime)
-
             # 통계 계산
             passed_count = 0
             failed_count = 0
-            report_rows = ''
+            report_rows = []  # 행 조각을 모아 마지막에 한 번만 join
 
             for i, report_file in enumerate(recent_reports, 1):
-                with open(report_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = await asyncio.to_thread(report_file.read_text, encoding='utf-8')
 
                 # 파일명 추출
                 filename = report_file.name.replace('validation_report_', '').replace('.html', '')
-                filename_match = re.match(r'(.+?)_\d{8}_\d{6}$', filename)
+                filename_match = _REPORT_FILENAME_TIMESTAMP_RE.match(filename)
                 if filename_match:
                     sql_filename = filename_match.group(1)
                 else:
@@ -1765,23 +2216,23 @@ SQL 쿼리:"""
                     passed_count += 1
 
                 # SQL 타입 추출
-                sql_type_match = re.search(r'<h4>🔧 SQL 타입</h4>\s*<p>([^<]+)</p>', content)
+                sql_type_match = _REPORT_SQL_TYPE_RE.search(content)
                 sql_type = sql_type_match.group(1) if sql_type_match else 'UNKNOWN'
 
-                report_rows += f'''
+                report_rows.append(f'''
     <tr>
         <td>{i}</td>
         <td><a href="{report_file.name}" target="_blank">{sql_filename}</a></td>
         <td>{sql_type}</td>
         <td style="color: {status_color}; font-weight: bold;">{status_icon} {status}</td>
     </tr>
-    '''
+    ''')
 
             total_files = len(recent_reports)
             pass_rate = (passed_count / total_files * 100 if total_files > 0 else 0)
 
             # 통합 보고서 HTML 생성
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             consolidated_file = OUTPUT_DIR / f'consolidated_validation_report_{timestamp}.html'
 
             html_content = f'''<!DOCTYPE html>
@@ -1881,7 +2332,7 @@ SQL 쿼리:"""
     <div class="container">
         <div class="header">
             <h1>📊 SQL 통합 검증 보고서</h1>
-            <p>생성 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>생성 일시: {now.strftime('%Y-%m-%d %H:%M:%S')}</p>
         </div>
 
         <div class="content">
@@ -1915,7 +2366,7 @@ SQL 쿼리:"""
                     </tr>
                 </thead>
                 <tbody>
-                    {report_rows}
+                    {"".join(report_rows)}
                 </tbody>
             </table>
 
@@ -1926,16 +2377,15 @@ SQL 쿼리:"""
 
         <div class="footer">
             <p>Generated by DB Assistant MCP Server</p>
-            <p>Report generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>Report generated at {now.strftime('%Y-%m-%d %H:%M:%S')}</p>
         </div>
     </div>
 </body>
 </html>
 '''
 
-            # 파일 저장
-            with open(consolidated_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # 파일 저장 (이벤트 루프를 막지 않도록 스레드에서 수행)
+            await asyncio.to_thread(consolidated_file.write_text, html_content, encoding='utf-8')
 
             logger.info(f"통합 보고서 생성 완료: {consolidated_file}")
 
@@ -1945,6 +2395,33 @@ SQL 쿼리:"""
             logger.error(f"통합 보고서 생성 오류: {e}")
             return f"통합 보고서 생성 실패: {str(e)}"
 
+    async def _with_lambda_call_limit(self, coro):
+        """Lambda 동시 호출 수 제한 하에서 코루틴 실행"""
+        async with self._lambda_call_semaphore:
+            return await coro
+
+    def _apply_schema_validation_result(
+        self, ddl_validation: dict, issues: list, label: str
+    ) -> None:
+        """Lambda 스키마 검증 결과를 issues에 반영 (각 필드는 한 번만 조회)"""
+        success = ddl_validation.get("success")
+        validation_issues = ddl_validation.get("issues") or []
+        debug_log(
+            f"{label} 완료: Success={success}, Valid={ddl_validation.get('valid')}, Issues={len(validation_issues)}"
+        )
+
+        if success:
+            issues.extend(validation_issues)
+            warnings = ddl_validation.get("warnings")
+            if warnings:
+                # 경고는 issues에 추가하지 않고 로그만
+                debug_log(f"경고: {warnings}")
+        else:
+            # Lambda 호출 실패
+            error_msg = ddl_validation.get("error", "Lambda 스키마 검증 실패")
+            issues.append(f"스키마 검증 오류: {error_msg}")
+            debug_log(f"Lambda 스키마 검증 오류: {error_msg}")
+
     async def validate_ddl(
         self, ddl_content: str, database_secret: Optional[str], filename: str
     ) -> str:
@@ -1985,29 +2462,23 @@ SQL 쿼리:"""
             sql_type = self.sql_parser.extract_ddl_type(ddl_content, debug_log)
             debug_log(f"SQL 타입: {sql_type}")
 
-            # 3. SQL 타입에 따른 검증 분기
-            ddl_types = [
-                "CREATE_TABLE",
-                "ALTER_TABLE",
-                "CREATE_INDEX",
-                "DROP_TABLE",
-                "DROP_INDEX",
-            ]
-            dql_types = ["SELECT", "UPDATE", "DELETE", "INSERT", "MIXED_SELECT"]
-            skip_types = ["SHOW", "SET", "USE"]  # 스킵할 SQL 타입
+            # 3. SQL 타입에 따른 검증 분기 (MIXED_SELECT는 DQL 경로에서 스키마 검증도 함께 수행)
+            sql_category = (
+                "dql" if sql_type == "MIXED_SELECT" else _SQL_TYPE_CATEGORY.get(sql_type)
+            )
 
             if database_secret:
                 try:
                     debug_log("Lambda 기반 검증 시작 (로컬 DB 연결 없음)")
 
                     # SQL 타입별 검증 분기
-                    if sql_type in skip_types:
+                    if sql_category == "skip":
                         debug_log(
                             f"SQL 타입 스킵: {sql_type} (SHOW/SET/USE 구문은 검증하지 않음)"
                         )
 
                     # DDL 검증
-                    elif sql_type in ddl_types:
+                    elif sql_category == "ddl":
                         debug_log(f"DDL 검증 수행: {sql_type}")
                         debug_log("=== Lambda 스키마 검증 로직 시작 ===")
 
@@ -2017,60 +2488,15 @@ SQL 쿼리:"""
                             self.selected_database,
                             ddl_content
                         )
-                        debug_log(
-                            f"Lambda 스키마 검증 완료: Success={ddl_validation.get('success')}, Valid={ddl_validation.get('valid')}, Issues={len(ddl_validation.get('issues', []))}"
-                        )
-
                         # Lambda 결과 처리
-                        if ddl_validation.get('success'):
-                            if ddl_validation.get('issues'):
-                                issues.extend(ddl_validation['issues'])
-                            if ddl_validation.get('warnings'):
-                                # 경고는 issues에 추가하지 않고 로그만
-                                debug_log(f"경고: {ddl_validation['warnings']}")
-                        else:
-                            # Lambda 호출 실패
-                            error_msg = ddl_validation.get('error', 'Lambda 스키마 검증 실패')
-                            issues.append(f"스키마 검증 오류: {error_msg}")
-                            debug_log(f"Lambda 스키마 검증 오류: {error_msg}")
+                        self._apply_schema_validation_result(
+                            ddl_validation, issues, "Lambda 스키마 검증"
+                        )
 
                     # DQL(DML) 검증 - MIXED_SELECT 포함
-                    elif sql_type in dql_types:
+                    elif sql_category == "dql":
                         debug_log(f"DQL 검증 수행: {sql_type}")
 
-                        # MIXED_SELECT인 경우 DDL과 DML 모두 검증
-                        if sql_type == "MIXED_SELECT":
-                            debug_log("=== 혼합 SQL 파일 검증 시작 ===")
-
-                            # 1. DDL 구문 검증 (Lambda 사용)
-                            debug_log("혼합 파일 내 Lambda 스키마 검증 시작")
-                            ddl_validation = await self.validate_schema_lambda(
-                                database_secret,
-                                self.selected_database,
-                                ddl_content
-                            )
-
-                            # 타입 체크: ddl_validation이 딕셔너리가 아닌 경우 처리
-                            if not isinstance(ddl_validation, dict):
-                                logger.error(f"ddl_validation이 딕셔너리가 아님: {type(ddl_validation)}, 내용: {str(ddl_validation)[:200]}")
-                                issues.append(f"스키마 검증 오류: Lambda 응답 형식 오류 (타입: {type(ddl_validation).__name__})")
-                                ddl_validation = {'success': False, 'error': f'응답 타입 오류: {type(ddl_validation).__name__}'}
-
-                            debug_log(
-                                f"혼합 파일 Lambda 스키마 검증 완료: Success={ddl_validation.get('success')}, Valid={ddl_validation.get('valid')}, Issues={len(ddl_validation.get('issues', []))}"
-                            )
-
-                            # Lambda 결과 처리
-                            if ddl_validation.get('success'):
-                                if ddl_validation.get('issues'):
-                                    issues.extend(ddl_validation['issues'])
-                                if ddl_validation.get('warnings'):
-                                    debug_log(f"경고: {ddl_validation['warnings']}")
-                            else:
-                                error_msg = ddl_validation.get('error', 'Lambda 스키마 검증 실패')
-                                issues.append(f"스키마 검증 오류: {error_msg}")
-                                debug_log(f"Lambda 스키마 검증 오류: {error_msg}")
-
                         # DML 검증 (Lambda EXPLAIN 사용)
                         debug_log("=== Lambda EXPLAIN 검증 시작 ===")
 
@@ -2089,16 +2515,12 @@ SQL 쿼리:"""
                         except Exception as parse_error:
                             debug_log(f"DDL 파싱 오류 (무시하고 계속): {parse_error}")
 
-                        # SQL을 개별 쿼리로 분리
-                        if sqlparse:
-                            statements = sqlparse.split(ddl_content)
-                        else:
-                            statements = [
-                                stmt.strip() for stmt in ddl_content.split(";") if stmt.strip()
-                            ]
+                        # SQL을 개별 쿼리로 분리 (동일 내용은 파서 캐시 재사용)
+                        statements = self.sql_parser.split_statements(ddl_content)
                         debug_log(f"총 {len(statements)}개의 개별 쿼리로 분리")
 
-                        # 각 SELECT 쿼리에 대해 Lambda EXPLAIN 실행
+                        # EXPLAIN 대상 쿼리 수집 (Lambda 호출은 아래에서 동시에 실행)
+                        explain_targets = []
                         for i, stmt in enumerate(statements):
                             if not stmt.strip():
                                 continue
@@ -2118,13 +2540,15 @@ SQL 쿼리:"""
                                 continue
 
                             # 파일 내 생성된 테이블을 참조하는지 확인
-                            references_new_table = False
-                            referenced_tables = []
-                            for table in created_tables:
-                                # FROM, JOIN, INTO 절에서 테이블 참조 확인
-                                if re.search(rf'\b(FROM|JOIN|INTO)\s+`?{table}`?\b', cleaned_stmt, re.IGNORECASE):
-                                    references_new_table = True
-                                    referenced_tables.append(table)
+                            # (생성 테이블마다 정규식을 돌리지 않고, FROM/JOIN/INTO 참조 테이블을 한 번 추출해 집합 조회)
+                            referenced_tables = [
+                                table
+                                for table in dict.fromkeys(
+                                    name.lower() for name in _TABLE_REFERENCE_RE.findall(cleaned_stmt)
+                                )
+                                if table in created_tables
+                            ]
+                            references_new_table = bool(referenced_tables)
 
                             # 새 테이블 참조 시 EXPLAIN 스킵
                             if references_new_table:
@@ -2137,13 +2561,53 @@ SQL 쿼리:"""
                                 })
                                 continue
 
-                            debug_log(f"쿼리 {i+1}: Lambda EXPLAIN 실행 중...")
-                            explain_result = await self.explain_query_lambda(
+                            explain_targets.append((i, cleaned_stmt))
+
+                        # 스키마 검증(MIXED_SELECT)과 쿼리별 EXPLAIN은 서로 독립적이므로 동시에 실행
+                        lambda_calls = [
+                            self.explain_query_lambda(
                                 database_secret,
                                 self.selected_database,
                                 cleaned_stmt
                             )
+                            for _, cleaned_stmt in explain_targets
+                        ]
+                        if sql_type == "MIXED_SELECT":
+                            debug_log("=== 혼합 SQL 파일 검증 시작 ===")
+                            debug_log("혼합 파일 내 Lambda 스키마 검증 시작")
+                            lambda_calls.insert(
+                                0,
+                                self.validate_schema_lambda(
+                                    database_secret,
+                                    self.selected_database,
+                                    ddl_content
+                                ),
+                            )
+                        debug_log(f"Lambda 동시 호출: EXPLAIN {len(explain_targets)}건")
+                        lambda_results = await asyncio.gather(
+                            *(self._with_lambda_call_limit(call) for call in lambda_calls)
+                        )
+
+                        # MIXED_SELECT인 경우 DDL 구문 검증 결과 먼저 반영
+                        if sql_type == "MIXED_SELECT":
+                            ddl_validation = lambda_results[0]
+                            explain_results = lambda_results[1:]
+
+                            # 타입 체크: ddl_validation이 딕셔너리가 아닌 경우 처리
+                            if not isinstance(ddl_validation, dict):
+                                logger.error(f"ddl_validation이 딕셔너리가 아님: {type(ddl_validation)}, 내용: {str(ddl_validation)[:200]}")
+                                issues.append(f"스키마 검증 오류: Lambda 응답 형식 오류 (타입: {type(ddl_validation).__name__})")
+                                ddl_validation = {'success': False, 'error': f'응답 타입 오류: {type(ddl_validation).__name__}'}
+
+                            # Lambda 결과 처리
+                            self._apply_schema_validation_result(
+                                ddl_validation, issues, "혼합 파일 Lambda 스키마 검증"
+                            )
+                        else:
+                            explain_results = lambda_results
 
+                        # 각 쿼리의 EXPLAIN 결과를 원래 쿼리 순서대로 처리
+                        for (i, cleaned_stmt), explain_result in zip(explain_targets, explain_results):
                             # 타입 체크: explain_result가 딕셔너리가 아닌 경우 처리
                             if not isinstance(explain_result, dict):
                                 logger.error(f"쿼리 {i+1} explain_result가 딕셔너리가 아님: {type(explain_result)}, 내용: {str(explain_result)[:200]}")
@@ -2207,7 +2671,7 @@ SQL 쿼리:"""
                 claude_analysis_result = claude_result
 
                 # Claude 응답 분석 - 더 엄격한 검증
-                if "오류:" in claude_result or "존재하지 않" in claude_result:
+                if _CLAUDE_ERROR_RE.search(claude_result):
                     issues.append(f"Claude 검증: {claude_result}")
                     debug_log("Claude 검증에서 오류 발견")
                 elif "검증 통과" in claude_result:
@@ -2242,8 +2706,7 @@ SQL 쿼리:"""
 
             # 결과 생성 - Claude 검증이 성공이면 우선적으로 PASS 처리
             if claude_success and not any(
-                "오류:" in issue or "실패" in issue or "존재하지 않" in issue
-                for issue in issues
+                _SEVERE_ISSUE_RE.search(str(issue)) for issue in issues
             ):
                 summary = "✅ 모든 검증을 통과했습니다."
                 status = "PASS"
@@ -2252,18 +2715,20 @@ SQL 쿼리:"""
                 summary = "✅ 모든 검증을 통과했습니다."
                 status = "PASS"
             else:
-                # 성능 문제와 기타 문제 분류
-                performance_issues = [
-                    issue for issue in issues if "심각한 성능 문제" in str(issue)
-                ]
-                claude_issues = [
-                    issue for issue in issues if "Claude 검증:" in str(issue)
-                ]
-                other_issues = [
-                    issue
-                    for issue in issues
-                    if issue not in performance_issues and issue not in claude_issues
-                ]
+                # 성능 문제와 기타 문제 분류 (이슈 목록을 한 번만 순회)
+                performance_issues = []
+                claude_issues = []
+                other_issues = []
+                for issue in issues:
+                    issue_text = str(issue)
+                    is_performance = "심각한 성능 문제" in issue_text
+                    is_claude = "Claude 검증:" in issue_text
+                    if is_performance:
+                        performance_issues.append(issue)
+                    if is_claude:
+                        claude_issues.append(issue)
+                    if not (is_performance or is_claude):
+                        other_issues.append(issue)
 
                 # 문제 요약 생성
                 problem_parts = []
@@ -2331,9 +2796,8 @@ SQL 쿼리:"""
                 debug_log("HTML 보고서 생성 완료")
             except Exception as html_error:
                 debug_log(f"HTML 보고서 생성 실패: {html_error}")
-                import traceback
-
-                debug_log(f"HTML 오류 상세: {traceback.format_exc()}")
+                # 스택 트레이스는 DEBUG 레벨이 활성화된 경우에만 포맷
+                logger.debug("HTML 보고서 생성 오류 상세", exc_info=True)
 
             return f"{summary}\n\n📄 상세 보고서가 저장되었습니다: {report_path}\n🔍 디버그 로그: {debug_log_path}"
 
@@ -2342,14 +2806,12 @@ SQL 쿼리:"""
 
     def validate_semicolon_usage(self, ddl_content: str) -> bool:
         """개선된 세미콜론 검증 - 독립적인 문장은 세미콜론 없어도 허용"""
-        content = ddl_content.strip()
-
-        # 빈 내용은 통과
-        if not content:
+        # 빈 내용은 통과 (strip()으로 전체 문자열을 복사하지 않음)
+        if not ddl_content or ddl_content.isspace():
             return True
 
         # 주석 제거하고 실제 SQL 구문만 추출
-        lines = content.split("\n")
+        lines = ddl_content.split("\n")
         sql_lines = []
         for line in lines:
             line = line.strip()
@@ -2396,33 +2858,26 @@ SQL 쿼리:"""
                     return True
 
         # 여러 문장이 있는 경우 마지막을 제외하고는 모두 세미콜론이 있어야 함
-        return content.endswith(";")
+        # 오른쪽 끝에서 공백만 건너뛰며 마지막 문자를 확인
+        i = len(ddl_content) - 1
+        while i >= 0 and ddl_content[i] in _SQL_WHITESPACE:
+            i -= 1
+        return i >= 0 and ddl_content[i] == ";"
 
 
     def detect_ddl_type(self, ddl_content: str) -> str:
         """DDL 타입 감지"""
-        ddl_upper = ddl_content.upper().strip()
-
-        if ddl_upper.startswith("CREATE TABLE"):
-            return "CREATE_TABLE"
-        elif ddl_upper.startswith("ALTER TABLE"):
-            return "ALTER_TABLE"
-        elif ddl_upper.startswith("DROP TABLE"):
-            return "DROP_TABLE"
-        elif ddl_upper.startswith("CREATE INDEX"):
-            return "CREATE_INDEX"
-        elif ddl_upper.startswith("DROP INDEX"):
-            return "DROP_INDEX"
-        elif ddl_upper.startswith("INSERT"):
-            return "INSERT"
-        elif ddl_upper.startswith("UPDATE"):
-            return "UPDATE"
-        elif ddl_upper.startswith("DELETE"):
-            return "DELETE"
-        elif ddl_upper.startswith("SELECT"):
-            return "SELECT"
-        else:
-            return "UNKNOWN"
+        # 전체 문자열을 upper()/strip() 하지 않고 선행 공백 이후 앞부분만 비교
+        start = 0
+        length = len(ddl_content)
+        while start < length and ddl_content[start] in _SQL_WHITESPACE:
+            start += 1
+        head = ddl_content[start : start + _DDL_TYPE_SCAN_LENGTH].upper()
+
+        for prefix, ddl_type in _DDL_TYPE_PREFIXES:
+            if head.startswith(prefix):
+                return ddl_type
+        return "UNKNOWN"
 
     def create_schema_validation_summary(
         self, issues: list, dml_column_issues: list
@@ -2444,6 +2899,29 @@ SQL 쿼리:"""
 
         return "\n".join(summary_parts)
 
+    async def _build_knowledge_context(self, ddl_content: str, sql_type: str) -> str:
+        """Knowledge Base에서 관련 정보를 조회하여 프롬프트용 컨텍스트 생성"""
+        try:
+            knowledge_info = await self.query_knowledge_base(ddl_content, sql_type)
+            if knowledge_info and knowledge_info != "관련 정보를 찾을 수 없습니다.":
+                return f"""
+Knowledge Base 참고 정보:
+{knowledge_info}
+
+위 정보를 참고하여 검증을 수행해주세요.
+"""
+        except Exception as e:
+            logger.warning(f"Knowledge Base 조회 중 오류: {e}")
+        return ""
+
+    async def _extract_schema_info_safe(self, database_secret: str) -> dict:
+        """스키마 정보 추출 (실패 시 빈 dict 반환)"""
+        try:
+            return await self.extract_current_schema_info(database_secret)
+        except Exception as e:
+            logger.warning(f"스키마 정보 추출 실패: {e}")
+            return {}
+
     async def validate_with_claude(
         self,
         ddl_content: str,
@@ -2460,13 +2938,16 @@ SQL 쿼리:"""
         Args:
             skipped_queries: 파일 내 생성된 테이블을 참조하여 EXPLAIN이 스킵된 쿼리 목록
         """
-        # 스키마 정보가 제공되지 않았고 database_secret이 있으면 스키마 정보 추출
+        # Knowledge Base 조회는 스키마 정보와 무관하므로 스키마 추출과 동시에 수행
         if schema_info is None and database_secret:
-            try:
-                schema_info = await self.extract_current_schema_info(database_secret)
-            except Exception as e:
-                logger.warning(f"스키마 정보 추출 실패: {e}")
-                schema_info = {}
+            knowledge_context, schema_info = await asyncio.gather(
+                self._build_knowledge_context(ddl_content, sql_type),
+                self._extract_schema_info_safe(database_secret),
+            )
+        else:
+            knowledge_context = await self._build_knowledge_context(
+                ddl_content, sql_type
+            )
 
         # 관련 스키마 정보를 포함한 프롬프트 생성 (순서 고려)
         schema_context = ""
@@ -2667,31 +3148,10 @@ SELECT, UPDATE, DELETE, INSERT 등의 DML 구문에 대해서만 EXPLAIN 분석
 5. 사용자에게 "실제 테이블 생성 후 별도의 성능 검증이 필요합니다"라고 안내하세요.
 """
 
-        # Knowledge Base에서 관련 정보 조회
-        knowledge_context = ""
-        try:
-            knowledge_info = await self.query_knowledge_base(ddl_content, sql_type)
-            if knowledge_info and knowledge_info != "관련 정보를 찾을 수 없습니다.":
-                knowledge_context = f"""
-Knowledge Base 참고 정보:
-{knowledge_info}
-
-위 정보를 참고하여 검증을 수행해주세요.
-"""
-        except Exception as e:
-            logger.warning(f"Knowledge Base 조회 중 오류: {e}")
-
         # DDL과 DQL에 따른 프롬프트 구분
-        ddl_types = [
-            "CREATE_TABLE",
-            "ALTER_TABLE",
-            "CREATE_INDEX",
-            "DROP_TABLE",
-            "DROP_INDEX",
-        ]
-        dql_types = ["SELECT", "UPDATE", "DELETE", "INSERT"]
+        sql_category = _SQL_TYPE_CATEGORY.get(sql_type)
 
-        if sql_type in ddl_types:
+        if sql_category == "ddl":
             # DDL 검증 프롬프트
             prompt = f"""
         다음 DDL 문을 Aurora MySQL 문법으로 검증해주세요:
@@ -2724,7 +3184,7 @@ Knowledge Base 참고 정보:
 
         반드시 위 형식으로만 응답하세요.
         """
-        elif sql_type in dql_types:
+        elif sql_category == "dql":
             # DQL 검증 프롬프트
             prompt = f"""
         다음 DQL(DML) 쿼리를 Aurora MySQL에서 검증해주세요:
@@ -2817,11 +3277,16 @@ Knowledge Base 참고 정보:
         sonnet_3_7_model_id = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 
         # Claude Sonnet 4 inference profile 호출
+        # (수 초 걸리는 동기 호출이므로 스레드에서 실행 - 동시 검증과 다른 MCP 요청이 이벤트 루프에서 대기하지 않도록)
         try:
-            response = self.bedrock_client.invoke_model(
-                modelId=sonnet_4_model_id, body=claude_input
+            response = await asyncio.to_thread(
+                self.bedrock_client.invoke_model,
+                modelId=sonnet_4_model_id,
+                body=claude_input,
+            )
+            response_body = json.loads(
+                await asyncio.to_thread(response.get("body").read)
             )
-            response_body = json.loads(response.get("body").read())
 
             # response_body가 딕셔너리인지 확인
             if not isinstance(response_body, dict):
@@ -2852,10 +3317,14 @@ Knowledge Base 참고 정보:
             )
             # Claude 3.7 Sonnet inference profile 호출 (fallback)
             try:
-                response = self.bedrock_client.invoke_model(
-                    modelId=sonnet_3_7_model_id, body=claude_input
+                response = await asyncio.to_thread(
+                    self.bedrock_client.invoke_model,
+                    modelId=sonnet_3_7_model_id,
+                    body=claude_input,
+                )
+                response_body = json.loads(
+                    await asyncio.to_thread(response.get("body").read)
                 )
-                response_body = json.loads(response.get("body").read())
 
                 # response_body가 딕셔너리인지 확인
                 if not isinstance(response_body, dict):
@@ -2986,7 +3455,8 @@ Knowledge Base 성능 최적화 가이드:
             # Claude Sonnet 4 호출
             try:
                 logger.info(f"Claude Sonnet 4 호출 시작 - 모델ID: {sonnet_4_model_id}")
-                logger.debug(f"입력 데이터 크기: {len(claude_input)} bytes")
+                # debug 레벨이 꺼져 있으면 미리보기 자르기/포맷팅을 하지 않도록 지연 인자로 전달
+                logger.debug("입력 데이터 크기: %d bytes", len(claude_input))
 
                 response = self.bedrock_client.invoke_model(
                     modelId=sonnet_4_model_id, body=claude_input
@@ -2994,13 +3464,13 @@ Knowledge Base 성능 최적화 가이드:
                 logger.info("Claude Sonnet 4 응답 수신 완료")
 
                 response_body = json.loads(response.get("body").read())
-                logger.debug(f"응답 본문 파싱 완료: {list(response_body.keys())}")
+                logger.debug("응답 본문 파싱 완료: %s", response_body.keys())
 
                 claude_response = response_body.get("content", [{}])[0].get("text", "")
                 logger.info(
                     f"Claude 응답 텍스트 길이: {len(claude_response)} characters"
                 )
-                logger.debug(f"Claude 응답 미리보기: {claude_response[:200]}...")
+                logger.debug("Claude 응답 미리보기: %.200s...", claude_response)
 
                 # JSON 파싱 시도 - 먼저 마크다운 코드 블록 확인
                 try:
@@ -3024,7 +3494,7 @@ Knowledge Base 성능 최적화 가이드:
                         parsed_result = json.loads(claude_response)
 
                     logger.info("Claude 응답 JSON 파싱 성공")
-                    logger.debug(f"파싱된 결과 키: {list(parsed_result.keys())}")
+                    logger.debug("파싱된 결과 키: %s", parsed_result.keys())
 
                     # 필요한 키가 있는지 확인
                     if isinstance(parsed_result, dict) and (
@@ -3174,7 +3644,7 @@ Knowledge Base 성능 최적화 가이드:
             import re
 
             logger.info(f"Claude 응답 파싱 시작, 응답 길이: {len(text_response)}")
-            logger.debug(f"응답 시작 부분: {text_response[:200]}")
+            logger.debug("응답 시작 부분: %.200s", text_response)
 
             # 먼저 마크다운 코드 블록에서 JSON 추출
             markdown_pattern = r"```(?:json)?\s*(.*?)\s*```"
@@ -3187,7 +3657,7 @@ Knowledge Base 성능 최적화 가이드:
                 logger.info(
                     f"마크다운 블록에서 JSON 추출 성공, 길이: {len(json_content)}"
                 )
-                logger.debug(f"추출된 JSON 시작 부분: {json_content[:200]}")
+                logger.debug("추출된 JSON 시작 부분: %.200s", json_content)
                 try:
                     parsed = json.loads(json_content)
                     if isinstance(parsed, dict) and (
@@ -3201,9 +3671,7 @@ Knowledge Base 성능 최적화 가이드:
                         logger.warning("파싱된 JSON에 필요한 키가 없음")
                 except json.JSONDecodeError as e:
                     logger.error(f"마크다운 블록 JSON 파싱 실패: {e}")
-                    logger.debug(
-                        f"파싱 실패한 JSON 내용 (처음 500자): {json_content[:500]}"
-                    )
+                    logger.debug("파싱 실패한 JSON 내용 (처음 500자): %.500s", json_content)
             else:
                 logger.warning("마크다운 코드 블록을 찾을 수 없음")
 
@@ -3217,9 +3685,9 @@ Knowledge Base 성능 최적화 가이드:
             ]
 
             for i, pattern in enumerate(json_patterns):
-                logger.debug(f"패턴 {i+1} 시도: {pattern}")
+                logger.debug("패턴 %d 시도: %s", i + 1, pattern)
                 matches = re.findall(pattern, text_response, re.DOTALL | re.IGNORECASE)
-                logger.debug(f"패턴 {i+1}에서 {len(matches)}개 매치 발견")
+                logger.debug("패턴 %d에서 %d개 매치 발견", i + 1, len(matches))
                 for j, match in enumerate(matches):
                     try:
                         parsed = json.loads(match)
@@ -3230,7 +3698,7 @@ Knowledge Base 성능 최적화 가이드:
                             logger.info(f"JSON 패턴 매칭 성공: 패턴 {i+1}, 매치 {j+1}")
                             return parsed
                     except json.JSONDecodeError as e:
-                        logger.debug(f"패턴 {i+1}, 매치 {j+1} JSON 파싱 실패: {e}")
+                        logger.debug("패턴 %d, 매치 %d JSON 파싱 실패: %s", i + 1, j + 1, e)
                         continue
 
             # 구조화된 텍스트에서 정보 추출
@@ -3483,102 +3951,146 @@ Knowledge Base 성능 최적화 가이드:
             ],
         }
 
-    async def extract_current_schema_info(
-        self, database_secret: str, use_ssh_tunnel: bool = False  # EC2에서는 VPC 직접 연결
-    ) -> Dict[str, Any]:
-        """현재 데이터베이스의 스키마 정보 추출"""
-        try:
-            logger.info(f"스키마 정보 추출 시작: database_secret={database_secret}")
-            connection, tunnel_used = self.get_db_connection(
-                database_secret, self.selected_database, use_ssh_tunnel
-            )
-            cursor = connection.cursor()
+    def _fetch_schema_info(self, connection) -> Dict[str, Any]:
+        """information_schema에서 테이블/컬럼/인덱스 정보를 조회 (동기 - 이벤트 루프 밖 스레드에서 실행)"""
+        # 비버퍼 커서: 넓은 스키마의 컬럼/인덱스 메타데이터를 리스트로 모두 적재하지 않고 행 단위로 스트리밍
+        # (비버퍼 커서는 다음 execute 전에 결과를 모두 읽어야 하므로 단건 결과도 fetchall로 소비)
+        cursor = connection.cursor()
 
-            # 현재 데이터베이스 확인
-            cursor.execute("SELECT DATABASE()")
-            current_db = cursor.fetchone()[0]
-            logger.info(f"현재 데이터베이스: {current_db}")
+        # 현재 데이터베이스 확인
+        cursor.execute("SELECT DATABASE()")
+        current_db = cursor.fetchall()[0][0]
+        logger.info(f"현재 데이터베이스: {current_db}")
 
-            schema_info = {"tables": [], "columns": {}, "indexes": {}}
+        schema_info = {"tables": [], "columns": {}, "indexes": {}}
 
-            # 테이블 목록 조회
-            cursor.execute(
-                """
-                SELECT table_name FROM information_schema.tables 
-                WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE'
-                ORDER BY table_name
+        # 테이블 목록 조회
+        cursor.execute(
             """
-            )
-            tables = [row[0] for row in cursor.fetchall()]
-            schema_info["tables"] = tables
-            logger.info(f"발견된 테이블: {tables}")
-
-            # 각 테이블의 컬럼 정보 조회
-            for table in tables:
-                cursor.execute(
-                    """
-                    SELECT column_name, data_type, character_maximum_length, 
-                           numeric_precision, numeric_scale, is_nullable, column_default
-                    FROM information_schema.columns 
-                    WHERE table_schema = DATABASE() AND table_name = %s
-                    ORDER BY ordinal_position
-                """,
-                    (table,),
-                )
+            SELECT table_name FROM information_schema.tables 
+            WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE'
+            ORDER BY table_name
+        """
+        )
+        tables = [row[0] for row in cursor.fetchall()]
+        schema_info["tables"] = tables
+        logger.info(f"발견된 테이블: {tables}")
 
-                columns = []
-                for col_row in cursor.fetchall():
-                    col_info = {
-                        "name": col_row[0],
-                        "data_type": col_row[1],
-                        "max_length": col_row[2],
-                        "precision": col_row[3],
-                        "scale": col_row[4],
-                        "is_nullable": col_row[5],
-                        "default_value": col_row[6],
-                    }
-                    columns.append(col_info)
+        # 테이블별 반복 조회(N+1) 대신 스키마 전체를 한 번씩 조회한 뒤 테이블별로 분류
+        columns_by_table = {table: [] for table in tables}
+        indexes_by_table = {table: {} for table in tables}
 
-                schema_info["columns"][table] = columns
+        # 컬럼 정보 조회
+        cursor.execute(
+            """
+            SELECT table_name, column_name, data_type, character_maximum_length,
+                   numeric_precision, numeric_scale, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_schema = DATABASE()
+            ORDER BY table_name, ordinal_position
+        """
+        )
+        for col_row in cursor:
+            columns = columns_by_table.get(col_row[0])
+            if columns is None:
+                continue  # 뷰 등 BASE TABLE이 아닌 객체
+            # 캐시에 오래 머무르므로 dict 대신 __slots__ 기반 ColumnMeta로 보관
+            columns.append(ColumnMeta(*col_row[1:8]))
+
+        # 인덱스 정보 조회
+        cursor.execute(
+            """
+            SELECT table_name, index_name, column_name, non_unique, seq_in_index
+            FROM information_schema.statistics
+            WHERE table_schema = DATABASE()
+            ORDER BY table_name, index_name, seq_in_index
+        """
+        )
+        for idx_row in cursor:
+            indexes = indexes_by_table.get(idx_row[0])
+            if indexes is None:
+                continue
+            # 조회 1회로 처리 (IndexMeta는 처음 나온 인덱스에서만 생성)
+            index = indexes.get(idx_row[1])
+            if index is None:
+                index = indexes[idx_row[1]] = IndexMeta(unique=idx_row[3] == 0)
+            index.columns.append(idx_row[2])
+
+        schema_info["columns"] = columns_by_table
+        schema_info["indexes"] = indexes_by_table
+
+        cursor.close()
+
+        return schema_info
+
+    def _fetch_schema_fingerprint(self, connection) -> tuple:
+        """스키마 변경 감지용 지문 조회 (테이블/컬럼/인덱스 개수와 최근 테이블 생성 시각, 1회 왕복)"""
+        cursor = connection.cursor()
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = DATABASE()),
+                (SELECT MAX(create_time) FROM information_schema.tables WHERE table_schema = DATABASE()),
+                (SELECT COUNT(*) FROM information_schema.columns WHERE table_schema = DATABASE()),
+                (SELECT COUNT(*) FROM information_schema.statistics WHERE table_schema = DATABASE())
+        """
+        )
+        fingerprint = tuple(cursor.fetchall()[0])
+        cursor.close()
+        return fingerprint
 
-                # 인덱스 정보 조회
-                cursor.execute(
-                    """
-                    SELECT index_name, column_name, non_unique, seq_in_index
-                    FROM information_schema.statistics 
-                    WHERE table_schema = DATABASE() AND table_name = %s
-                    ORDER BY index_name, seq_in_index
-                """,
-                    (table,),
-                )
+    async def extract_current_schema_info(
+        self, database_secret: str, use_ssh_tunnel: bool = False  # EC2에서는 VPC 직접 연결
+    ) -> Dict[str, Any]:
+        """현재 데이터베이스의 스키마 정보 추출
 
-                indexes = {}
-                for idx_row in cursor.fetchall():
-                    idx_name = idx_row[0]
-                    col_name = idx_row[1]
-                    is_unique = idx_row[2] == 0
+        캐시된 스키마는 매 호출마다 가벼운 지문 쿼리로 변경 여부를 확인한 뒤 재사용하고,
+        지문으로 잡히지 않는 변경(컬럼 타입 수정 등)에 대비해 TTL이 지나면 전체를 다시 조회한다.
+        """
+        cache_key = (database_secret, self.selected_database)
+        cached = self._schema_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] >= SCHEMA_CACHE_TTL_SECONDS:
+            cached = None
 
-                    if idx_name not in indexes:
-                        indexes[idx_name] = {"columns": [], "unique": is_unique}
-                    indexes[idx_name]["columns"].append(col_name)
+        fingerprint = None
+        try:
+            connection, tunnel_used = await asyncio.to_thread(
+                self.get_db_connection, database_secret, self.selected_database, use_ssh_tunnel
+            )
+            # 동기 커서 조회가 이벤트 루프(Knowledge Base 조회 등 동시 작업)를 막지 않도록 스레드에서 실행
+            fingerprint = await asyncio.to_thread(self._fetch_schema_fingerprint, connection)
 
-                schema_info["indexes"][table] = indexes
+            if cached and cached[1] == fingerprint:
+                logger.info(f"스키마 정보 캐시 사용 (지문 일치): database_secret={database_secret}")
+                schema_info = cached[2]
+                self._schema_cache.move_to_end(cache_key)
+            else:
+                logger.info(f"스키마 정보 추출 시작: database_secret={database_secret}")
+                schema_info = await asyncio.to_thread(self._fetch_schema_info, connection)
+                logger.info(
+                    f"스키마 정보 추출 완료: {len(schema_info['tables'])}개 테이블, {len(schema_info['columns'])}개 테이블의 컬럼 정보"
+                )
+                self._schema_cache[cache_key] = (time.monotonic(), fingerprint, schema_info)
+                self._schema_cache.move_to_end(cache_key)
+                if len(self._schema_cache) > SCHEMA_CACHE_MAX_ENTRIES:
+                    self._schema_cache.popitem(last=False)
 
-            cursor.close()
             connection.close()
 
             if tunnel_used:
                 self.cleanup_ssh_tunnel()
 
-            logger.info(
-                f"스키마 정보 추출 완료: {len(schema_info['tables'])}개 테이블, {len(schema_info['columns'])}개 테이블의 컬럼 정보"
-            )
             return schema_info
 
         except Exception as e:
-            logger.error(f"스키마 정보 추출 오류: {e}")
             if "tunnel_used" in locals() and tunnel_used:
                 self.cleanup_ssh_tunnel()
+            # 연결/지문 조회 단계에서 실패하면 TTL 이내의 캐시를 그대로 사용 (지문 도입 전 TTL 동작과 동일)
+            # 지문 불일치 후 전체 조회가 실패한 경우는 캐시가 이미 낡았으므로 사용하지 않음
+            if cached and fingerprint is None:
+                logger.warning(f"스키마 지문 확인 실패, 캐시된 스키마 정보 사용: {e}")
+                return cached[2]
+            logger.error(f"스키마 정보 추출 오류: {e}")
             return {}
 
 
@@ -3602,34 +4114,22 @@ Knowledge Base 성능 최적화 가이드:
         new_type_info = self.parse_data_type(new_definition.split()[0])
         existing_type = existing_column["data_type"]
 
-        # 호환되지 않는 타입 변경 검사
-        incompatible_changes = [
-            # 문자열 -> 숫자
-            (
-                ["VARCHAR", "CHAR", "TEXT"],
-                ["INT", "BIGINT", "DECIMAL", "FLOAT", "DOUBLE"],
-            ),
-            # 숫자 -> 문자열 (일반적으로 안전하지만 데이터 손실 가능)
-            (["INT", "BIGINT", "DECIMAL", "FLOAT", "DOUBLE"], ["VARCHAR", "CHAR"]),
-            # 날짜/시간 타입 변경
-            (["DATE", "DATETIME", "TIMESTAMP"], ["INT", "VARCHAR", "CHAR"]),
-        ]
-
-        for from_types, to_types in incompatible_changes:
-            if existing_type in from_types and new_type_info["type"] in to_types:
-                issues.append(
-                    f"데이터 타입을 {existing_type}에서 {new_type_info['type']}로 변경하는 것은 데이터 손실을 야기할 수 있습니다."
-                )
+        # 호환되지 않는 타입 변경 검사 (모듈 상수의 (기존, 신규) 타입 쌍 집합 조회)
+        if (existing_type, new_type_info["type"]) in _INCOMPATIBLE_TYPE_CHANGES:
+            issues.append(
+                f"데이터 타입을 {existing_type}에서 {new_type_info['type']}로 변경하는 것은 데이터 손실을 야기할 수 있습니다."
+            )
 
         # 길이 축소 검사
-        if existing_type in ["VARCHAR", "CHAR"] and new_type_info["type"] in [
-            "VARCHAR",
-            "CHAR",
-        ]:
+        if existing_type in _CHAR_TYPES and new_type_info["type"] in _CHAR_TYPES:
             existing_length = existing_column["max_length"]
             new_length = new_type_info["length"]
 
-            if existing_length and new_length and new_length < existing_length:
+            if (
+                existing_length is not None
+                and new_length is not None
+                and new_length < existing_length
+            ):
                 issues.append(
                     f"컬럼 길이를 {existing_length}에서 {new_length}로 축소하는 것은 데이터 손실을 야기할 수 있습니다."
                 )
@@ -3641,11 +4141,16 @@ Knowledge Base 성능 최적화 가이드:
             new_precision = new_type_info["precision"]
             new_scale = new_type_info["scale"]
 
+            # 0(스케일 0 등)도 유효한 값이므로 truthy 대신 None 여부로 판단
             if (
-                existing_precision
-                and new_precision
+                existing_precision is not None
+                and new_precision is not None
                 and new_precision < existing_precision
-            ) or (existing_scale and new_scale and new_scale < existing_scale):
+            ) or (
+                existing_scale is not None
+                and new_scale is not None
+                and new_scale < existing_scale
+            ):
                 issues.append(
                     f"DECIMAL 정밀도를 ({existing_precision},{existing_scale})에서 ({new_precision},{new_scale})로 축소하는 것은 데이터 손실을 야기할 수 있습니다."
                 )
@@ -3656,6 +4161,12 @@ Knowledge Base 성능 최적화 가이드:
         """데이터 타입 문자열을 파싱하여 타입과 길이 정보 추출 (utils/parsers.py 위임)"""
         return parse_data_type(data_type_str)
 
+    def _write_report_sections(self, report_path, sections) -> None:
+        """보고서 섹션들을 하나의 문자열로 합치지 않고 버퍼 파일에 순서대로 기록"""
+        with open(report_path, "w", encoding="utf-8", buffering=65536) as f:
+            for section in sections:
+                f.write(section)
+
     async def generate_html_report(
         self,
         report_path: Path,
@@ -3719,40 +4230,20 @@ Knowledge Base 성능 최적화 가이드:
             if (
                 claude_success
                 and status == "FAIL"
-                and not any(
-                    "오류:" in issue or "실패" in issue or "존재하지 않" in issue
-                    for issue in issues
-                )
+                and not any(_SEVERE_ISSUE_RE.search(str(issue)) for issue in issues)
             ):
                 # Claude가 성공이고 심각한 오류가 없으면 PASS로 변경
                 status = "PASS"
                 summary = "✅ 모든 검증을 통과했습니다."
 
-            status_color = "#28a745" if status == "PASS" else "#dc3545"
-            status_icon = "✅" if status == "PASS" else "❌"
+            # 상태별 색상/아이콘은 모듈 상수에서 한 번에 조회
+            status_color, status_icon = _STATUS_STYLE.get(status, _STATUS_STYLE["FAIL"])
 
             # DB 연결 정보 섹션 제거 (요청사항에 따라)
             db_info_section = ""
 
-            # 발견된 문제 섹션 - Claude 검증과 기타 검증 분리
-            claude_issues = []
-            other_issues = []
-
-            for issue in issues:
-                if issue.startswith("Claude 검증:"):
-                    claude_issues.append(issue[12:].strip())  # "Claude 검증:" 제거
-                else:
-                    other_issues.append(issue)
-
-            # 기타 검증 문제 섹션 제거 (중복 방지)
-
-            # Claude 검증 결과 내용 준비 (스키마 검증 결과 포함)
-            schema_validation_summary = self.create_schema_validation_summary(
-                issues, dml_column_issues
-            )
-
-            # Claude 검증과 스키마 검증을 통합한 내용 생성
-            combined_validation_content = ""
+            # Claude 검증과 스키마 검증을 통합한 내용 (조각 단위로 파일에 바로 기록)
+            validation_parts = []
 
             # Claude AI 검증 결과 추가 (스키마 검증 결과는 숨김)
             claude_content = (
@@ -3760,330 +4251,41 @@ Knowledge Base 성능 최적화 가이드:
                 if claude_analysis_result
                 else "Claude 검증 결과를 사용할 수 없습니다."
             )
-            combined_validation_content += f"""
+            validation_parts.append(
+                f"""
 <div class="validation-subsection">
     <h4>📋 SQL검증결과</h4>
-    <pre class="validation-text">{claude_content}</pre>
+    <pre class="validation-text">{escape_html(claude_content)}</pre>
 </div>
 """
+            )
 
-            # 전체 문제가 없는 경우
-            success_section = ""
-            if not issues:
-                success_section = """
-                <div class="issues-section success" style="display: none;">
-                    <h3>✅ 검증 결과</h3>
-                    <p class="no-issues">모든 검증을 통과했습니다.</p>
-                </div>
-                """
-
-            # HTML 보고서 내용
-            report_content = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SQL 검증보고서 - {filename}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 0 20px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .status-badge {{
-            display: inline-block;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: bold;
-            margin-top: 10px;
-            background-color: {status_color};
-        }}
-        .content {{
-            padding: 30px;
-        }}
-        .summary-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .summary-item {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            border-left: 4px solid #667eea;
-        }}
-        .summary-item h4 {{
-            margin: 0 0 10px 0;
-            color: #333;
-        }}
-        .summary-item p {{
-            margin: 0;
-            font-size: 1.1em;
-            font-weight: 500;
-        }}
-        .info-section, .issues-section {{
-            margin: 30px 0;
-            padding: 20px;
-            border-radius: 8px;
-            border: 1px solid #e9ecef;
-        }}
-        .info-section h3, .issues-section h3 {{
-            margin-top: 0;
-            color: #495057;
-            border-bottom: 2px solid #e9ecef;
-            padding-bottom: 10px;
-        }}
-        .info-table {{
-            width: 100%;
-            border-collapse: collapse;
-        }}
-        .info-table td {{
-            padding: 10px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .info-table td:first-child {{
-            width: 150px;
-            background: #f8f9fa;
-        }}
-        .issues-list {{
-            margin: 10px 0;
-            padding-left: 20px;
-        }}
-        .issues-list li {{
-            margin: 5px 0;
-        }}
-        .status-success {{
-            color: #28a745;
-            font-weight: bold;
-        }}
-        .status-error {{
-            color: #dc3545;
-            font-weight: bold;
-        }}
-        .no-issues {{
-            color: #28a745;
-            font-weight: 500;
-        }}
-        .issues-section.success {{
-            background: #d4edda;
-            border-color: #28a745;
-        }}
-        .sql-code {{
-            background: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 6px;
-            padding: 20px;
-            margin: 20px 0;
-            font-family: 'Courier New', monospace;
-            overflow-x: auto;
-            overflow-y: auto;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            max-height: 300px;
-        }}
-        .claude-section {{
-            margin: 30px 0;
-            padding: 25px;
-            border-radius: 8px;
-            border: 2px solid #667eea;
-            background: #f8f9ff;
-            box-shadow: 0 2px 10px rgba(102, 126, 234, 0.1);
-        }}
-        .claude-section h3 {{
-            margin-top: 0;
-            color: #495057;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-            font-size: 1.3em;
-        }}
-        .claude-result {{
-            margin: 20px 0;
-            padding: 0;
-            background: white;
-            border-radius: 8px;
-            border: 1px solid #e9ecef;
-            box-shadow: 0 1px 5px rgba(0,0,0,0.05);
-        }}
-        .claude-text {{
-            background: white;
-            border: 1px solid #e9ecef;
-            border-radius: 4px;
-            padding: 20px;
-            margin: 0;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            font-size: 14px;
-            line-height: 1.8;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            overflow-x: auto;
-            max-height: 800px;  /* 400px에서 800px로 증가 */
-            overflow-y: auto;
-            min-height: 100px;
-            resize: vertical;  /* 사용자가 수직으로 크기 조절 가능 */
-        }}
-        .validation-subsection {{
-            margin: 15px 0;
-            padding: 15px;
-            border-radius: 6px;
-            border-left: 4px solid #28a745;
-            background: #f8fff9;
-        }}
-        .validation-subsection h4 {{
-            margin: 0 0 10px 0;
-            color: #495057;
-            font-size: 1.1em;
-        }}
-        .validation-text {{
-            background: white;
-            border: 1px solid #e9ecef;
-            border-radius: 4px;
-            padding: 15px;
-            margin: 0;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            font-size: 13px;
-            line-height: 1.6;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            overflow-x: auto;
-            max-height: 300px;
-            overflow-y: auto;
-        }}
-        .success-text {{
-            color: #28a745;
-            font-weight: 500;
-            margin: 0;
-        }}
-        .footer {{
-            background: #f8f9fa;
-            padding: 20px;
-            text-align: center;
-            color: #6c757d;
-            border-top: 1px solid #e9ecef;
-        }}
-        @media (max-width: 768px) {{
-            .summary-grid {{
-                grid-template-columns: 1fr;
-            }}
-            .container {{
-                margin: 10px;
-            }}
-            body {{
-                padding: 10px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{status_icon} SQL 검증보고서</h1>
-            <div class="status-badge">{status}</div>
-        </div>
-        
-        <div class="content">
-            <div class="summary-grid">
-                <div class="summary-item">
-                    <h4>📄 파일명</h4>
-                    <p>{filename}</p>
-                </div>
-                <div class="summary-item">
-                    <h4>🕒 검증 일시</h4>
-                    <p>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                </div>
-                <div class="summary-item">
-                    <h4>🔧 SQL 타입</h4>
-                    <p>{sql_type}</p>
-                </div>
-                <div class="summary-item">
-                    <h4>🗄️ 데이터베이스</h4>
-                    <p>{database_secret or 'N/A'}</p>
-                </div>
-            </div>
-            
-            {db_info_section}
-            
-            <div class="info-section">
-                <h3>📝 원본 SQL</h3>
-                <div class="sql-code">{ddl_content}</div>
-            </div>
-            
-            <div class="claude-section">
-                <h3>🔍 통합 검증 결과 (스키마 + 쿼리성능)</h3>
-                <div class="claude-result">
-                    {combined_validation_content}
-                </div>
-            </div>
-            
-        </div>
-        
-        <div class="footer">
-            <p>Generated by DB Assistant MCP Server</p>
-            <p>Report generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-    </div>
-</body>
-</html>"""
-
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(report_content)
-
-            # 검증 결과 섹션 제거
-            try:
-                with open(report_path, "r", encoding="utf-8") as f:
-                    html_content = f.read()
-
-                # 검증 결과 섹션 제거 - 더 정확한 방법
-                lines = html_content.split("\n")
-                new_lines = []
-                i = 0
-
-                while i < len(lines):
-                    line = lines[i]
-
-                    # 검증 결과 섹션 시작 감지
-                    if '<div class="info-section" style="display: none;">' in line:
-                        # 다음 라인들을 확인하여 검증 결과 섹션인지 판단
-                        if i + 1 < len(lines) and "📊 검증 결과" in lines[i + 1]:
-                            # 검증 결과 섹션이므로 </div>까지 스킵
-                            i += 1  # 현재 div 라인 스킵
-                            while i < len(lines):
-                                if "</div>" in lines[i]:
-                                    i += 1  # </div> 라인도 스킵
-                                    break
-                                i += 1
-                            continue
-
-                    new_lines.append(line)
-                    i += 1
-
-                html_content = "\n".join(new_lines)
+            # HTML 보고서 내용 (정적 템플릿은 utils/report_templates.py에서 한 번만 생성)
+            # 검증 일시와 생성 일시는 동일한 타임스탬프를 한 번만 포맷하여 사용
+            generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            report_sections = [
+                SQL_VALIDATION_REPORT_HEAD.substitute(
+                    filename=filename,
+                    status_color=status_color,
+                    status_icon=status_icon,
+                    status=status,
+                    generated_at=generated_at,
+                    sql_type=sql_type,
+                    database=database_secret or 'N/A',
+                    db_info_section=db_info_section,
+                ),
+                # 원본 SQL의 <, & 등이 HTML로 해석되지 않도록 한 번만 이스케이프
+                escape_html(ddl_content),
+                SQL_VALIDATION_REPORT_MIDDLE,
+                *validation_parts,
+                SQL_VALIDATION_REPORT_TAIL.substitute(generated_at=generated_at),
+            ]
 
-                with open(report_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-            except Exception as e:
-                pass
+            # 디스크 쓰기는 블로킹 I/O이므로 스레드에서 실행하여 이벤트 루프 비차단
+            await asyncio.to_thread(
+                self._write_report_sections, report_path, report_sections
+            )
 
             # 파일 생성 확인 디버그
             try:
@@ -4099,18 +4301,19 @@ Knowledge Base 성능 최적화 가이드:
                 pass
 
         except Exception as e:
-            logger.error(f"HTML 보고서 생성 오류: {e}")
-            # 상세 오류 정보를 디버그 파일에 기록
+            # 스택 트레이스는 DEBUG 레벨이 활성화된 경우에만 포맷
+            logger.error(
+                f"HTML 보고서 생성 오류: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            # 오류 요약을 디버그 파일에 기록
             try:
                 with open(
                     OUTPUT_DIR / "html_debug.txt",
                     "a",
                     encoding="utf-8",
                 ) as f:
-                    import traceback
-
                     f.write(f"HTML 생성 오류: {e}\n")
-                    f.write(f"상세 오류: {traceback.format_exc()}\n")
                     f.flush()
             except:
                 pass
@@ -4120,247 +4323,81 @@ Knowledge Base 성능 최적화 가이드:
     ) -> str:
         """여러 SQL 파일의 통합 HTML 보고서 생성"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # 파일명과 본문의 생성 일시가 일치하도록 요청 시각을 한 번만 계산
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            generated_at = now.strftime("%Y-%m-%d %H:%M:%S")
             report_filename = f"consolidated_validation_report_{timestamp}.html"
             report_path = OUTPUT_DIR / report_filename
 
-            # 전체 통계 계산
-            total_files = len(validation_results)
-            passed_files = sum(1 for r in validation_results if r["status"] == "PASS")
-            failed_files = total_files - passed_files
+            # HTML 보고서 내용 (정적 골격은 utils/report_templates.py에서 한 번만 생성)
+            # 문서 전체를 하나의 문자열로 합치지 않고 앞부분/파일별 섹션/뒷부분을 순서대로 파일에 기록
+            # (앞부분의 통계는 섹션 생성과 같은 순회에서 집계한 뒤 0번 자리에 채움)
+            report_sections = [None]
+            passed_files = 0
 
-            # 파일별 결과 섹션 생성
-            file_sections = ""
+            # 파일별 결과 섹션 생성 + 통과 건수 집계
             for i, result in enumerate(validation_results, 1):
-                status_icon = "✅" if result["status"] == "PASS" else "❌"
-                status_class = "success" if result["status"] == "PASS" else "error"
+                if result["status"] == "PASS":
+                    passed_files += 1
+                    status_icon = "✅"
+                    status_class = "success"
+                else:
+                    status_icon = "❌"
+                    status_class = "error"
 
-                issues_html = ""
                 if result["issues"]:
-                    issues_html = "<ul class='issues-list'>"
-                    for issue in result["issues"]:
-                        issues_html += f"<li>{issue}</li>"
-                    issues_html += "</ul>"
+                    issues_parts = ["<ul class='issues-list'>"]
+                    issues_parts.extend(
+                        f"<li>{escape_html(str(issue))}</li>"
+                        for issue in result["issues"]
+                    )
+                    issues_parts.append("</ul>")
+                    issues_html = "".join(issues_parts)
                 else:
                     issues_html = "<p class='no-issues'>문제가 발견되지 않았습니다.</p>"
 
                 # 개별 파일 검증에서만 상세 보고서가 생성되므로 링크 없이 파일명만 표시
-                filename_display = result["filename"]
-
-                file_sections += f"""
-                <div class="file-section {status_class}">
-                    <h3>{status_icon} {i}. {filename_display}</h3>
-                    <div class="file-details">
-                        <div class="file-info">
-                            <span><strong>DDL 타입:</strong> {result['ddl_type']}</span>
-                            <span><strong>상태:</strong> {result['status']}</span>
-                            <span><strong>문제 수:</strong> {len(result['issues'])}개</span>
-                        </div>
-                        <div class="sql-code">
-{result['ddl_content']}
-                        </div>
-                        {f'<div class="issues-section">{issues_html}</div>' if result['issues'] else ''}
-                    </div>
-                </div>
-                """
+                filename_display = escape_html(result["filename"])
+
+                report_sections.append(
+                    CONSOLIDATED_VALIDATION_FILE_SECTION.substitute(
+                        status_class=status_class,
+                        status_icon=status_icon,
+                        index=i,
+                        filename=filename_display,
+                        ddl_type=result["ddl_type"],
+                        status=result["status"],
+                        issue_count=len(result["issues"]),
+                        # 사용자 SQL은 <, & 등이 그대로 들어가지 않도록 필드당 한 번만 이스케이프
+                        ddl_content=escape_html(result["ddl_content"]),
+                        issues_section=(
+                            f'<div class="issues-section">{issues_html}</div>'
+                            if result["issues"]
+                            else ""
+                        ),
+                    )
+                )
+            # 전체 통계
+            total_files = len(validation_results)
+            failed_files = total_files - passed_files
 
-            # HTML 보고서 내용
-            report_content = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>통합 SQL 검증보고서</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 0 20px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .summary-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 20px;
-            margin: 30px;
-        }}
-        .stat-item {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            border-left: 4px solid #667eea;
-        }}
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #333;
-        }}
-        .stat-label {{
-            color: #666;
-            margin-top: 5px;
-        }}
-        .file-section {{
-            margin: 20px 30px;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        .file-section.success {{
-            border-left: 4px solid #28a745;
-        }}
-        .file-section.error {{
-            border-left: 4px solid #dc3545;
-        }}
-        .file-section h3 {{
-            margin: 0;
-            padding: 15px 20px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .file-section h3 a {{
-            color: #495057;
-            text-decoration: none;
-        }}
-        .file-section h3 a:hover {{
-            color: #007bff;
-            text-decoration: underline;
-        }}
-        .file-details {{
-            padding: 20px;
-        }}
-        .file-info {{
-            display: flex;
-            gap: 20px;
-            margin-bottom: 15px;
-            flex-wrap: wrap;
-        }}
-        .file-info span {{
-            background: #e9ecef;
-            padding: 5px 10px;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }}
-        .sql-code {{
-            background: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 6px;
-            padding: 15px;
-            margin: 15px 0;
-            font-family: 'Courier New', monospace;
-            overflow-x: auto;
-            overflow-y: auto;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            max-height: 300px;
-            font-size: 0.9em;
-        }}
-        .issues-section {{
-            margin-top: 15px;
-            padding: 15px;
-            background: #fff5f5;
-            border: 1px solid #fed7d7;
-            border-radius: 6px;
-        }}
-        .issues-section h4 {{
-            margin: 0 0 10px 0;
-            color: #c53030;
-        }}
-        .issues-list {{
-            margin: 0;
-            padding-left: 20px;
-        }}
-        .issues-list li {{
-            margin: 5px 0;
-            color: #c53030;
-        }}
-        .no-issues {{
-            color: #38a169;
-            margin: 0;
-            font-weight: 500;
-        }}
-        .footer {{
-            background: #f8f9fa;
-            padding: 20px;
-            text-align: center;
-            color: #6c757d;
-            border-top: 1px solid #e9ecef;
-        }}
-        @media (max-width: 768px) {{
-            .summary-stats {{
-                grid-template-columns: 1fr;
-                margin: 20px;
-            }}
-            .file-section {{
-                margin: 20px 15px;
-            }}
-            .file-info {{
-                flex-direction: column;
-                gap: 10px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 통합 SQL 검증보고서</h1>
-            <p>데이터베이스: {database_secret}</p>
-            <p>검증 일시: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-        </div>
-        
-        <div class="summary-stats">
-            <div class="stat-item">
-                <div class="stat-number">{total_files}</div>
-                <div class="stat-label">총 파일 수</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number" style="color: #28a745;">{passed_files}</div>
-                <div class="stat-label">통과</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number" style="color: #dc3545;">{failed_files}</div>
-                <div class="stat-label">실패</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{round(passed_files/total_files*100) if total_files > 0 else 0}%</div>
-                <div class="stat-label">성공률</div>
-            </div>
-        </div>
-        
-        {file_sections}
-        
-        <div class="footer">
-            <p>Generated by DB Assistant MCP Server</p>
-            <p>Report generated at {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-        </div>
-    </div>
-</body>
-</html>"""
+            report_sections[0] = CONSOLIDATED_VALIDATION_REPORT_HEAD.substitute(
+                database_secret=escape_html(database_secret),
+                generated_at=generated_at,
+                total_files=total_files,
+                passed_files=passed_files,
+                failed_files=failed_files,
+                pass_rate=round(passed_files / total_files * 100) if total_files > 0 else 0,
+            )
+            report_sections.append(
+                CONSOLIDATED_VALIDATION_REPORT_TAIL.substitute(generated_at=generated_at)
+            )
 
-            # 파일 저장
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(report_content)
+            # 파일 저장 (버퍼 쓰기, 이벤트 루프를 막지 않도록 스레드에서 수행)
+            await asyncio.to_thread(
+                self._write_report_sections, report_path, report_sections
+            )
 
             return str(report_path)
 
@@ -4385,15 +4422,13 @@ Knowledge Base 성능 최적화 가이드:
                 ]
             else:
                 # validation_report로 시작하는 HTML 파일만 (debug_log 제외)
-                html_files = list(OUTPUT_DIR.glob("validation_report_*.html"))
-
-                # 키워드 필터링
-                if keyword:
-                    html_files = [f for f in html_files if keyword in f.name]
-
-                # 날짜 필터링 (YYYYMMDD 형식)
-                if date_filter:
-                    html_files = [f for f in html_files if date_filter in f.name]
+                # 키워드/날짜(YYYYMMDD 형식) 필터는 glob 결과를 한 번 순회하며 함께 적용
+                html_files = [
+                    f
+                    for f in OUTPUT_DIR.glob("validation_report_*.html")
+                    if (not keyword or keyword in f.name)
+                    and (not date_filter or date_filter in f.name)
+                ]
 
                 # 최신 파일 개수 제한
                 if latest_count:
@@ -4404,11 +4439,14 @@ Knowledge Base 성능 최적화 가이드:
             if not html_files:
                 return f"조건에 맞는 HTML 보고서를 찾을 수 없습니다. (키워드: {keyword}, 날짜: {date_filter}, 개수: {latest_count})"
 
-            # 각 보고서에서 정보 추출
+            # 각 보고서에서 정보 추출 (통과 건수도 같은 순회에서 집계)
             report_data = []
+            passed_reports = 0
             for html_file in html_files:
                 try:
-                    content = html_file.read_text(encoding="utf-8")
+                    content = await asyncio.to_thread(
+                        html_file.read_text, encoding="utf-8"
+                    )
 
                     # 파일명에서 원본 SQL 파일명 추출
                     sql_filename = html_file.name.replace(
@@ -4438,13 +4476,7 @@ Knowledge Base 성능 최적화 가이드:
                     # SQL 내용 일부 추출 (HTML 파일에서만)
                     sql_preview = "SQL 내용을 찾을 수 없습니다"
                     if "sql-code" in content:
-                        import re
-
-                        sql_match = re.search(
-                            r'<div class="sql-code"[^>]*>(.*?)</div>',
-                            content,
-                            re.DOTALL,
-                        )
+                        sql_match = _REPORT_SQL_CODE_RE.search(content)
                         if sql_match:
                             sql_preview = sql_match.group(1).strip()[:100] + "..."
 
@@ -4463,6 +4495,8 @@ Knowledge Base 성능 최적화 가이드:
                             "summary": summary,
                         }
                     )
+                    if status == "PASS":
+                        passed_reports += 1
 
                 except Exception as e:
                     logger.error(f"보고서 파싱 오류 {html_file}: {e}")
@@ -4476,111 +4510,50 @@ Knowledge Base 성능 최적화 가이드:
             report_filename = f"consolidated_report_{timestamp}.html"
             report_path = OUTPUT_DIR / report_filename
 
-            # 통계 계산
-            total_reports = len(report_data)
-            passed_reports = sum(1 for r in report_data if r["status"] == "PASS")
-            failed_reports = total_reports - passed_reports
-
-            # 테이블 행 생성
-            table_rows = ""
-            for i, data in enumerate(report_data, 1):
-                table_rows += f"""
-                <tr onclick="openReport('{data['html_file']}')" style="cursor: pointer;">
-                    <td>{i}</td>
-                    <td>{data['status_icon']} {data['filename']}</td>
-                    <td><code>{data['sql_preview']}</code></td>
-                    <td><span class="status-badge {data['status'].lower()}">{data['status']}</span></td>
-                    <td>{data['summary']}</td>
-                </tr>
-                """
-
-            html_content = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>통합 검증 보고서</title>
-    <style>
-        body {{ font-family: 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }}
-        .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }}
-        .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; }}
-        .header h1 {{ margin: 0; font-size: 2.5em; font-weight: 300; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 30px; }}
-        .stat-card {{ background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid #667eea; }}
-        .stat-number {{ font-size: 2em; font-weight: bold; color: #333; }}
-        .stat-label {{ color: #666; margin-top: 5px; }}
-        .table-container {{ margin: 30px; overflow-x: auto; }}
-        table {{ width: 100%; border-collapse: collapse; background: white; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background: #f8f9fa; font-weight: 600; }}
-        tr:hover {{ background: #f8f9fa; }}
-        .status-badge {{ padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: bold; }}
-        .status-badge.pass {{ background: #d4edda; color: #155724; }}
-        .status-badge.fail {{ background: #f8d7da; color: #721c24; }}
-        code {{ background: #f1f3f4; padding: 2px 4px; border-radius: 3px; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 통합 검증 보고서</h1>
-            <p>생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stat-card">
-                <div class="stat-number">{total_reports}</div>
-                <div class="stat-label">총 보고서</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{passed_reports}</div>
-                <div class="stat-label">검증 통과</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{failed_reports}</div>
-                <div class="stat-label">검증 실패</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{round(passed_reports/total_reports*100) if total_reports > 0 else 0}%</div>
-                <div class="stat-label">성공률</div>
-            </div>
-        </div>
-        
-        <div class="table-container">
-            <h2>📋 보고서 목록 (클릭하여 상세 보기)</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>#</th>
-                        <th>파일명</th>
-                        <th>SQL 미리보기</th>
-                        <th>검증 결과</th>
-                        <th>요약</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {table_rows}
-                </tbody>
-            </table>
-        </div>
-    </div>
-    
-    <script>
-        function openReport(filename) {{
-            window.open(filename, '_blank');
-        }}
-    </script>
-</body>
-</html>"""
-
-            report_path.write_text(html_content, encoding="utf-8")
+            # 통계 계산
+            total_reports = len(report_data)
+            failed_reports = total_reports - passed_reports
+            # 비율은 한 번만 계산 (빈 목록이어도 예외 대신 분기로 0% 처리)
+            if total_reports:
+                pass_rate = round(passed_reports / total_reports * 100)
+                fail_rate = round(failed_reports / total_reports * 100)
+            else:
+                pass_rate = fail_rate = 0
+
+            # 테이블 행 생성 (행/전체 골격은 utils/report_templates.py의 컴파일된 템플릿 사용)
+            table_rows = "".join(
+                CONSOLIDATED_REPORT_ROW.substitute(
+                    index=i,
+                    html_file=data["html_file"],
+                    status_icon=data["status_icon"],
+                    filename=data["filename"],
+                    sql_preview=data["sql_preview"],
+                    status_class=data["status"].lower(),
+                    status=data["status"],
+                    summary=data["summary"],
+                )
+                for i, data in enumerate(report_data, 1)
+            )
+
+            html_content = CONSOLIDATED_REPORT_HTML.substitute(
+                generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                total_reports=total_reports,
+                passed_reports=passed_reports,
+                failed_reports=failed_reports,
+                pass_rate=pass_rate,
+                table_rows=table_rows,
+            )
+
+            await asyncio.to_thread(
+                report_path.write_text, html_content, encoding="utf-8"
+            )
 
             return f"""📊 통합 보고서 생성 완료
 
 📈 요약:
 • 총 보고서: {total_reports}개
-• 검증 통과: {passed_reports}개 ({round(passed_reports/total_reports*100)}%)
-• 검증 실패: {failed_reports}개 ({round(failed_reports/total_reports*100)}%)
+• 검증 통과: {passed_reports}개 ({pass_rate}%)
+• 검증 실패: {failed_reports}개 ({fail_rate}%)
 
 📄 통합 보고서: {report_path}
 
@@ -4801,10 +4774,15 @@ Knowledge Base 성능 최적화 가이드:
         hours: int = 24,
     ) -> str:
         """종합 성능 진단 보고서 생성"""
+        # 요청 시각을 한 번만 계산하여 로그/보고서 파일명과 본문 생성 일시에 공통 사용
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        generated_at = now.strftime("%Y-%m-%d %H:%M:%S")
+
         # 디버그 로그 파일 생성
         debug_log_path = (
             LOGS_DIR
-            / f"debug_log_performance_{db_instance_identifier}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            / f"debug_log_performance_{db_instance_identifier}_{timestamp}.txt"
         )
 
         debug_log(
@@ -4818,7 +4796,6 @@ Knowledge Base 성능 최적화 가이드:
 
             # 클러스터 엔드포인트 확인 및 인스턴스 identifier 변환
             original_identifier = db_instance_identifier
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             debug_log(f"리전 설정: {region}, 타임스탬프: {timestamp}")
 
             # 1. 메트릭 수집
@@ -4870,9 +4847,11 @@ Knowledge Base 성능 최적화 가이드:
             # SQL 파일들이 생성되었는지 확인하고 추적
             sql_files = list(Path("sql").glob("*.sql")) if Path("sql").exists() else []
             for sql_file in sql_files:
+                # 파일명 소문자 변환은 키워드마다 반복하지 않고 파일당 한 번만 수행
+                name_lower = sql_file.name.lower()
                 if any(
-                    keyword in sql_file.name.lower()
-                    for keyword in ["slow", "cpu", "memory", "temp"]
+                    keyword in name_lower
+                    for keyword in ("slow", "cpu", "memory", "temp")
                 ):
                     generated_files.append(
                         {
@@ -5036,7 +5015,7 @@ Knowledge Base 성능 최적화 가이드:
                 <strong>인스턴스:</strong> {db_instance_identifier} | 
                 <strong>리전:</strong> {region} | 
                 <strong>분석 기간:</strong> {hours}시간 | 
-                <strong>생성일시:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+                <strong>생성일시:</strong> {generated_at}
             </div>
         </div>
 
@@ -5238,7 +5217,7 @@ Knowledge Base 성능 최적화 가이드:
 • 인스턴스: {db_instance_identifier}
 • 리전: {region}
 • 분석 기간: {hours}시간
-• 생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+• 생성 시간: {generated_at}
 
 📁 **생성된 파일들:**
 • 종합 보고서: {report_path.name}
@@ -5283,10 +5262,13 @@ Knowledge Base 성능 최적화 가이드:
         - 각 인스턴스별 상세 보고서 링크 제공
         - Writer/Reader 역할별 비교 분석
         """
+        # 요청 시각을 한 번만 계산하여 디버그 로그와 보고서 파일명에 공통 사용
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
         # 디버그 로그 파일 생성
         debug_log_path = (
             LOGS_DIR
-            / f"debug_log_cluster_{db_cluster_identifier}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            / f"debug_log_cluster_{db_cluster_identifier}_{timestamp}.txt"
         )
 
         try:
@@ -5294,13 +5276,11 @@ Knowledge Base 성능 최적화 가이드:
 
             # 1. database_secret에서 실제 클러스터 정보 찾기
             debug_log("RDS 클라이언트 초기화")
-            rds_client = boto3.client("rds", region_name=region)
+            rds_client = self._get_rds_client(region)
 
             # Secret에서 호스트 정보 가져오기
             debug_log("Secret 정보 조회")
-            secrets_client = boto3.client(
-                "secretsmanager", region_name=region, verify=False
-            )
+            secrets_client = self._get_secrets_client(region, verify=False)
             get_secret_value_response = secrets_client.get_secret_value(
                 SecretId=database_secret
             )
@@ -5311,16 +5291,15 @@ Knowledge Base 성능 최적화 가이드:
 
             # 호스트 정보로 실제 클러스터 찾기
             actual_cluster_id = None
+            cluster_info = None
             if host:
-                # 모든 클러스터 조회해서 엔드포인트 매칭
+                # 블로킹 RDS 호출은 스레드에서 수행 (연속 요청 시 TTL 캐시 재사용)
                 debug_log("클러스터 목록 조회 및 매칭")
-                clusters = rds_client.describe_db_clusters()["DBClusters"]
-                for cluster in clusters:
-                    if cluster.get("Endpoint", "") in host or host in cluster.get(
-                        "Endpoint", ""
-                    ):
-                        actual_cluster_id = cluster["DBClusterIdentifier"]
-                        break
+                cluster_info = await asyncio.to_thread(
+                    self._find_cluster_by_host, region, host
+                )
+                if cluster_info is not None:
+                    actual_cluster_id = cluster_info["DBClusterIdentifier"]
 
             # 실제 클러스터 ID가 없으면 파라미터로 받은 값 사용
             if not actual_cluster_id:
@@ -5328,9 +5307,14 @@ Knowledge Base 성능 최적화 가이드:
 
             debug_log(f"실제 클러스터 ID: {actual_cluster_id}")
 
-            cluster_info = rds_client.describe_db_clusters(
-                DBClusterIdentifier=actual_cluster_id
-            )["DBClusters"][0]
+            # 목록에서 찾은 클러스터는 이미 상세 정보를 포함하므로 재조회 생략
+            if cluster_info is None:
+                cluster_info = (
+                    await asyncio.to_thread(
+                        rds_client.describe_db_clusters,
+                        DBClusterIdentifier=actual_cluster_id,
+                    )
+                )["DBClusters"][0]
 
             cluster_members = cluster_info["DBClusterMembers"]
             writer_instance = next(
@@ -5422,7 +5406,6 @@ Knowledge Base 성능 최적화 가이드:
 
             # 4. 클러스터 통합 보고서 생성
             debug_log("클러스터 통합 보고서 생성 시작")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             report_filename = (
                 f"cluster_performance_report_{actual_cluster_id}_{timestamp}.html"
             )
@@ -5532,22 +5515,9 @@ Knowledge Base 성능 최적화 가이드:
         """이벤트 메시지 기반 심각도 분류"""
         message_lower = message.lower()
 
-        if any(
-            keyword in message_lower
-            for keyword in [
-                "failed",
-                "error",
-                "critical",
-                "fatal",
-                "crash",
-                "corruption",
-            ]
-        ):
+        if _HIGH_SEVERITY_EVENT_RE.search(message_lower):
             return "HIGH"
-        elif any(
-            keyword in message_lower
-            for keyword in ["warning", "slow", "timeout", "retry", "restart", "reboot"]
-        ):
+        elif _MEDIUM_SEVERITY_EVENT_RE.search(message_lower):
             return "MEDIUM"
         else:
             return "LOW"
@@ -5561,7 +5531,7 @@ Knowledge Base 성능 최적화 가이드:
     ) -> Dict:
         """클러스터 레벨 메트릭 분석"""
         try:
-            if not ANALYSIS_AVAILABLE:
+            if not _load_analysis_libs():
                 logger.warning("분석 라이브러리 없음 - 기본 분석만 수행")
                 return {"error": "분석 라이브러리가 필요합니다"}
 
@@ -5577,10 +5547,16 @@ Knowledge Base 성능 최적화 가이드:
             # 각 인스턴스의 메트릭 로드 및 비교 - data 폴더에서 직접 찾기
             metrics_data = {}
 
-            # 클러스터 멤버에서 인스턴스 ID 가져오기
-            for member in cluster_info["DBClusterMembers"]:
-                instance_id = member["DBInstanceIdentifier"]
+            # 클러스터 멤버 dict 목록은 한 번만 순회해 인스턴스 ID 목록과 Writer ID 집합으로 변환
+            # (인스턴스마다 멤버 목록 전체를 다시 훑어 역할을 찾지 않도록 함)
+            members = cluster_info["DBClusterMembers"]
+            member_ids = [m["DBInstanceIdentifier"] for m in members]
+            writer_ids = {
+                m["DBInstanceIdentifier"] for m in members if m["IsClusterWriter"]
+            }
 
+            # 클러스터 멤버에서 인스턴스 ID 가져오기
+            for instance_id in member_ids:
                 # data 폴더에서 해당 인스턴스의 최신 CSV 파일 찾기
                 data_dir = Path("data")
                 csv_files = list(data_dir.glob(f"database_metrics_{instance_id}_*.csv"))
@@ -5610,11 +5586,7 @@ Knowledge Base 성능 최적화 가이드:
 
                 for instance_id, df in metrics_data.items():
                     # 클러스터 멤버 정보에서 역할 확인
-                    is_writer = any(
-                        m["DBInstanceIdentifier"] == instance_id
-                        and m["IsClusterWriter"]
-                        for m in cluster_info["DBClusterMembers"]
-                    )
+                    is_writer = instance_id in writer_ids
 
                     logger.info(
                         f"인스턴스 역할 확인: {instance_id} -> {'Writer' if is_writer else 'Reader'}"
@@ -5969,16 +5941,11 @@ Knowledge Base 성능 최적화 가이드:
         if not cluster_metrics:
             return '<div class="no-data">클러스터 메트릭 데이터가 없습니다.</div>'
 
-        # 주요 메트릭들에 대한 통계 계산
-        important_metrics = [
-            ("CPUUtilization", "CPU 사용률", "%"),
-            ("FreeableMemory", "사용 가능한 메모리", "MB"),
-            ("ReadIOPS", "읽기 IOPS", "IOPS"),
-            ("WriteIOPS", "쓰기 IOPS", "IOPS"),
-            ("DatabaseConnections", "데이터베이스 연결 수", "개"),
-            ("AuroraReplicaLag", "Aurora 복제 지연", "ms"),
-        ]
+        # 표시할 주요 메트릭이 하나도 없으면 표를 만들지 않음
+        if not any(m in cluster_metrics for m, _, _ in _CLUSTER_SUMMARY_METRICS):
+            return '<div class="no-data">표시할 메트릭 데이터가 없습니다.</div>'
 
+        # 주요 메트릭들에 대한 통계 계산
         table_html = """
         <table class="metrics-table">
             <thead>
@@ -5993,7 +5960,7 @@ Knowledge Base 성능 최적화 가이드:
             <tbody>
         """
 
-        for metric_name, display_name, unit in important_metrics:
+        for metric_name, display_name, unit in _CLUSTER_SUMMARY_METRICS:
             if metric_name in cluster_metrics:
                 datapoints = cluster_metrics[metric_name]
 
@@ -6024,9 +5991,6 @@ Knowledge Base 성능 최적화 가이드:
 
         table_html += "</tbody></table>"
 
-        if len([m for m, _, _ in important_metrics if m in cluster_metrics]) == 0:
-            return '<div class="no-data">표시할 메트릭 데이터가 없습니다.</div>'
-
         return table_html
 
     def _generate_events_table(self, events: List[Dict]) -> str:
@@ -6180,11 +6144,7 @@ Knowledge Base 성능 최적화 가이드:
 
         html = ""
         for rec in recommendations:
-            priority_color = {
-                "높음": "#dc3545",
-                "중간": "#ffc107",
-                "낮음": "#28a745",
-            }.get(rec["priority"], "#6c757d")
+            priority_color = _PRIORITY_COLORS.get(rec["priority"], "#6c757d")
             html += f"""
             <div class="recommendation">
                 <h4 style="color: {priority_color};">🎯 {rec['title']} (우선순위: {rec['priority']})</h4>
@@ -6404,59 +6364,7 @@ Knowledge Base 성능 최적화 가이드:
     def get_dynamic_dbload_threshold(self, instance_class: str) -> float:
         """인스턴스 클래스별 DBLoad 임계값 반환"""
         # vCPU 수 기반 임계값 설정
-        vcpu_mapping = {
-            # t3/t4g 시리즈
-            "t3.micro": 2,
-            "t3.small": 2,
-            "t3.medium": 2,
-            "t3.large": 2,
-            "t3.xlarge": 4,
-            "t3.2xlarge": 8,
-            "t4g.micro": 2,
-            "t4g.small": 2,
-            "t4g.medium": 2,
-            "t4g.large": 2,
-            "t4g.xlarge": 4,
-            "t4g.2xlarge": 8,
-            # r5/r6i 시리즈
-            "r5.large": 2,
-            "r5.xlarge": 4,
-            "r5.2xlarge": 8,
-            "r5.4xlarge": 16,
-            "r5.8xlarge": 32,
-            "r5.12xlarge": 48,
-            "r5.16xlarge": 64,
-            "r5.24xlarge": 96,
-            "r6i.large": 2,
-            "r6i.xlarge": 4,
-            "r6i.2xlarge": 8,
-            "r6i.4xlarge": 16,
-            "r6i.8xlarge": 32,
-            "r6i.12xlarge": 48,
-            "r6i.16xlarge": 64,
-            "r6i.24xlarge": 96,
-            "r6i.32xlarge": 128,
-            # m5/m6i 시리즈
-            "m5.large": 2,
-            "m5.xlarge": 4,
-            "m5.2xlarge": 8,
-            "m5.4xlarge": 16,
-            "m5.8xlarge": 32,
-            "m5.12xlarge": 48,
-            "m5.16xlarge": 64,
-            "m5.24xlarge": 96,
-            "m6i.large": 2,
-            "m6i.xlarge": 4,
-            "m6i.2xlarge": 8,
-            "m6i.4xlarge": 16,
-            "m6i.8xlarge": 32,
-            "m6i.12xlarge": 48,
-            "m6i.16xlarge": 64,
-            "m6i.24xlarge": 96,
-            "m6i.32xlarge": 128,
-        }
-
-        vcpu_count = vcpu_mapping.get(instance_class, 2)  # 기본값 2 vCPU
+        vcpu_count = _INSTANCE_CLASS_VCPUS.get(instance_class, 2)  # 기본값 2 vCPU
         # DBLoad 임계값 = vCPU 수 * 0.8 (80% 활용률 기준)
         return vcpu_count * 0.8
 
@@ -6464,7 +6372,7 @@ Knowledge Base 성능 최적화 가이드:
         self, csv_file: str, std_threshold: float = 3.0, skip_html_report: bool = False
     ) -> str:
         """개선된 아웃라이어 탐지 - 메트릭별 맞춤 기준 적용"""
-        if not ANALYSIS_AVAILABLE:
+        if not _load_analysis_libs():
             return "❌ 분석 라이브러리가 설치되지 않았습니다."
 
         try:
@@ -6474,11 +6382,11 @@ Knowledge Base 성능 최적화 가이드:
             else:
                 csv_path = Path(csv_file)
 
-            if not csv_path.exists():
+            # 데이터 읽기 (exists() 선확인 없이 바로 읽고 없으면 FileNotFoundError 처리)
+            try:
+                df = pd.read_csv(csv_path, index_col="Timestamp", parse_dates=True)
+            except FileNotFoundError:
                 return f"CSV 파일을 찾을 수 없습니다: {csv_path}"
-
-            # 데이터 읽기
-            df = pd.read_csv(csv_path, index_col="Timestamp", parse_dates=True)
             df = df.dropna()
 
             # 임계값 파일에서 로드
@@ -6488,6 +6396,10 @@ Knowledge Base 성능 최적화 가이드:
             outlier_summary = []
             critical_issues = []
 
+            # DBLoad 계열 동적 임계값은 컬럼과 무관하므로 루프 밖에서 한 번만 계산
+            instance_class = self.current_instance_class
+            dynamic_threshold = self.get_dynamic_dbload_threshold(instance_class)
+
             # 각 메트릭에 대해 맞춤 아웃라이어 탐지
             for column in df.columns:
                 series = df[column]
@@ -6496,13 +6408,7 @@ Knowledge Base 성능 최적화 가이드:
 
                 if config["method"] == "dynamic":
                     # 동적 임계값 기준 (DBLoad 등)
-                    if column in ["DBLoad", "DBLoadCPU", "DBLoadNonCPU"]:
-                        instance_class = getattr(
-                            self, "current_instance_class", "r5.large"
-                        )
-                        dynamic_threshold = self.get_dynamic_dbload_threshold(
-                            instance_class
-                        )
+                    if column in _DBLOAD_METRICS:
                         outliers = series[series > dynamic_threshold]
                     else:
                         # 다른 메트릭은 기본 임계값 사용
@@ -6553,21 +6459,12 @@ Knowledge Base 성능 최적화 가이드:
                         critical_issues.append(
                             f"CPU 사용률 위험 수준: {outliers.max():.1f}%"
                         )
-                    elif (
-                        column in ["ReadLatency", "WriteLatency"]
-                        and outliers.max() > 0.1
-                    ):
+                    elif column in _LATENCY_METRICS and outliers.max() > 0.1:
                         critical_issues.append(
                             f"{column} 지연시간 급증: {outliers.max():.3f}초"
                         )
-                    elif column in ["DBLoad", "DBLoadCPU", "DBLoadNonCPU"]:
+                    elif column in _DBLOAD_METRICS:
                         # 동적 임계값 기반 판정
-                        instance_class = getattr(
-                            self, "current_instance_class", "r5.large"
-                        )
-                        dynamic_threshold = self.get_dynamic_dbload_threshold(
-                            instance_class
-                        )
                         if (
                             outliers.max() > dynamic_threshold * 1.5
                         ):  # 임계값의 150% 초과 시 심각
@@ -6656,7 +6553,7 @@ Knowledge Base 성능 최적화 가이드:
         target_metric: str = "CPUUtilization",
     ) -> str:
         """회귀 분석 수행"""
-        if not ANALYSIS_AVAILABLE:
+        if not _load_analysis_libs():
             return "❌ 분석 라이브러리가 설치되지 않았습니다."
 
         try:
@@ -6666,12 +6563,12 @@ Knowledge Base 성능 최적화 가이드:
             else:
                 csv_path = Path(csv_file)
 
-            if not csv_path.exists():
+            # 데이터 읽기 (exists() 선확인 없이 바로 읽고 없으면 FileNotFoundError 처리)
+            try:
+                df = pd.read_csv(csv_path, index_col="Timestamp", parse_dates=True)
+            except FileNotFoundError:
                 return f"CSV 파일을 찾을 수 없습니다: {csv_path}"
 
-            # 데이터 읽기
-            df = pd.read_csv(csv_path, index_col="Timestamp", parse_dates=True)
-
             # 필요한 메트릭 확인
             if predictor_metric not in df.columns or target_metric not in df.columns:
                 return f"필요한 메트릭이 데이터에 없습니다.\n사용 가능한 메트릭: {list(df.columns)}"
@@ -6754,7 +6651,7 @@ Knowledge Base 성능 최적화 가이드:
 
     async def get_metric_summary(self, csv_file: str) -> str:
         """메트릭 요약 정보 조회"""
-        if not ANALYSIS_AVAILABLE:
+        if not _load_analysis_libs():
             return "❌ 분석 라이브러리가 설치되지 않았습니다."
 
         try:
@@ -6764,12 +6661,12 @@ Knowledge Base 성능 최적화 가이드:
             else:
                 csv_path = Path(csv_file)
 
-            if not csv_path.exists():
+            # 데이터 읽기 (exists() 선확인 없이 바로 읽고 없으면 FileNotFoundError 처리)
+            try:
+                df = pd.read_csv(csv_path, index_col="Timestamp", parse_dates=True)
+            except FileNotFoundError:
                 return f"CSV 파일을 찾을 수 없습니다: {csv_path}"
 
-            # 데이터 읽기
-            df = pd.read_csv(csv_path, index_col="Timestamp", parse_dates=True)
-
             result = f"📊 메트릭 요약 정보 ({csv_file}):\n\n"
             result += f"📅 데이터 기간: {df.index.min()} ~ {df.index.max()}\n"
             result += f"📈 데이터 포인트: {len(df)}개\n"
@@ -6827,14 +6724,15 @@ Knowledge Base 성능 최적화 가이드:
                 debug_log(f"호환성 문제: {existing_type} -> {new_type_info['type']}")
 
         # 길이 축소 검사
-        if existing_type in ["VARCHAR", "CHAR"] and new_type_info["type"] in [
-            "VARCHAR",
-            "CHAR",
-        ]:
+        if existing_type in _CHAR_TYPES and new_type_info["type"] in _CHAR_TYPES:
             existing_length = existing_column["max_length"]
             new_length = new_type_info["length"]
 
-            if existing_length and new_length and new_length < existing_length:
+            if (
+                existing_length is not None
+                and new_length is not None
+                and new_length < existing_length
+            ):
                 issues.append(
                     f"컬럼 길이를 {existing_length}에서 {new_length}로 축소하는 것은 데이터 손실을 야기할 수 있습니다."
                 )
@@ -6847,11 +6745,16 @@ Knowledge Base 성능 최적화 가이드:
             new_precision = new_type_info["precision"]
             new_scale = new_type_info["scale"]
 
+            # 0(스케일 0 등)도 유효한 값이므로 truthy 대신 None 여부로 판단
             if (
-                existing_precision
-                and new_precision
+                existing_precision is not None
+                and new_precision is not None
                 and new_precision < existing_precision
-            ) or (existing_scale and new_scale and new_scale < existing_scale):
+            ) or (
+                existing_scale is not None
+                and new_scale is not None
+                and new_scale < existing_scale
+            ):
                 issues.append(
                     f"DECIMAL 정밀도를 ({existing_precision},{existing_scale})에서 ({new_precision},{new_scale})로 축소하는 것은 데이터 손실을 야기할 수 있습니다."
                 )
@@ -6876,9 +6779,7 @@ Knowledge Base 성능 최적화 가이드:
             end_dt = self.convert_kst_to_utc(end_time)
 
             # 시크릿에서 DB 정보 가져오기
-            secrets_client = boto3.client(
-                "secretsmanager", region_name="ap-northeast-2"
-            )
+            secrets_client = self._get_secrets_client("ap-northeast-2")
             secret_response = secrets_client.get_secret_value(SecretId=database_secret)
             secret_data = json.loads(secret_response["SecretString"])
 
@@ -6890,7 +6791,7 @@ Knowledge Base 성능 최적화 가이드:
                 return "❌ Aurora 클러스터를 찾을 수 없습니다"
 
             # CloudWatch 수집 시도
-            logs_client = boto3.client("logs", region_name="ap-northeast-2")
+            logs_client = self._get_aws_client("logs", "ap-northeast-2")
             log_group_name = f"/aws/rds/cluster/{cluster_identifier}/slowquery"
 
             start_time_ms = int(start_dt.timestamp() * 1000)
@@ -6931,9 +6832,11 @@ Knowledge Base 성능 최적화 가이드:
             return f"✅ 디버그 완료: {events_count}개 이벤트 발견"
 
         except Exception as e:
-            import traceback
-
-            return f"❌ 디버그 실패: {str(e)}\n{traceback.format_exc()}"
+            logger.error(
+                f"CloudWatch 디버그 실패: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            return f"❌ 디버그 실패: {str(e)}"
 
     async def collect_slow_queries(
         self, database_secret: str, start_time: str = None, end_time: str = None
@@ -6950,9 +6853,7 @@ Knowledge Base 성능 최적화 가이드:
                 start_dt = end_dt - timedelta(hours=24)
 
             # 시크릿에서 DB 정보 가져오기
-            secrets_client = boto3.client(
-                "secretsmanager", region_name=self.default_region
-            )
+            secrets_client = self._get_secrets_client(self.default_region)
             secret_response = secrets_client.get_secret_value(SecretId=database_secret)
             secret_data = json.loads(secret_response["SecretString"])
 
@@ -6995,9 +6896,11 @@ Knowledge Base 성능 최적화 가이드:
         except ValueError as ve:
             return f"❌ {str(ve)}"
         except Exception as e:
-            import traceback
-
-            return f"❌ 슬로우 쿼리 수집 실패: {str(e)}\n{traceback.format_exc()}"
+            logger.error(
+                f"슬로우 쿼리 수집 실패: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            return f"❌ 슬로우 쿼리 수집 실패: {str(e)}"
 
     async def _collect_from_local_file(
         self, database_secret: str, start_dt: datetime, end_dt: datetime
@@ -7009,7 +6912,9 @@ Knowledge Base 성능 최적화 가이드:
                 self.cleanup_shared_connection()
 
             # 데이터베이스 연결
-            if not self.setup_shared_connection(database_secret, None, True):
+            if not await asyncio.to_thread(
+                self.setup_shared_connection, database_secret, None, True
+            ):
                 return {"success": False, "message": "데이터베이스 연결 실패"}
 
             cursor = self.shared_cursor
@@ -7071,8 +6976,7 @@ Knowledge Base 성능 최적화 가이드:
 
                     # S3에 업로드 및 Pre-signed URL 생성
                     try:
-                        import boto3
-                        s3_client = boto3.client('s3', region_name=self.default_region)
+                        s3_client = self._get_aws_client("s3", self.default_region)
                         s3_bucket = QUERY_RESULTS_DEV_BUCKET
                         s3_key = f"sql-files/slow-queries/{filename}"
 
@@ -7232,8 +7136,7 @@ Knowledge Base 성능 최적화 가이드:
 
                     # S3에 업로드 및 Pre-signed URL 생성
                     try:
-                        import boto3
-                        s3_client = boto3.client('s3', region_name=self.default_region)
+                        s3_client = self._get_aws_client("s3", self.default_region)
                         s3_bucket = QUERY_RESULTS_DEV_BUCKET
                         s3_key = f"sql-files/slow-queries/{filename}"
 
@@ -7282,7 +7185,9 @@ Knowledge Base 성능 최적화 가이드:
                 self.cleanup_shared_connection()
 
             # 데이터베이스 연결
-            if not self.setup_shared_connection(database_secret, None, True):
+            if not await asyncio.to_thread(
+                self.setup_shared_connection, database_secret, None, True
+            ):
                 return {"success": False, "message": "데이터베이스 연결 실패"}
 
             cursor = self.shared_cursor
@@ -7341,8 +7246,7 @@ Knowledge Base 성능 최적화 가이드:
 
                 # S3에 업로드 및 Pre-signed URL 생성
                 try:
-                    import boto3
-                    s3_client = boto3.client('s3', region_name=self.default_region)
+                    s3_client = self._get_aws_client("s3", self.default_region)
                     s3_bucket = QUERY_RESULTS_DEV_BUCKET
                     s3_key = f"sql-files/slow-queries/{filename}"
 
@@ -7383,11 +7287,12 @@ Knowledge Base 성능 최적화 가이드:
         """Log exports 설정 제안 및 자동 설정"""
         try:
             # RDS 클라이언트로 현재 설정 확인
-            rds_client = boto3.client("rds", region_name="ap-northeast-2")
+            rds_client = self._get_rds_client("ap-northeast-2")
 
             try:
-                response = rds_client.describe_db_clusters(
-                    DBClusterIdentifier=cluster_identifier
+                response = await asyncio.to_thread(
+                    rds_client.describe_db_clusters,
+                    DBClusterIdentifier=cluster_identifier,
                 )
                 cluster = response["DBClusters"][0]
                 enabled_logs = cluster.get("EnabledCloudwatchLogsExports", [])
@@ -7435,7 +7340,7 @@ Knowledge Base 성능 최적화 가이드:
     async def enable_slow_query_log_exports(self, cluster_identifier: str) -> str:
         """Aurora 클러스터의 SlowQuery 로그 CloudWatch 전송 활성화"""
         try:
-            rds_client = boto3.client("rds", region_name="ap-northeast-2")
+            rds_client = self._get_rds_client("ap-northeast-2")
 
             response = rds_client.modify_db_cluster(
                 DBClusterIdentifier=cluster_identifier,
@@ -7500,8 +7405,7 @@ Knowledge Base 성능 최적화 가이드:
 
                 # S3에 업로드 및 Pre-signed URL 생성
                 try:
-                    import boto3
-                    s3_client = boto3.client('s3', region_name=self.default_region)
+                    s3_client = self._get_aws_client("s3", self.default_region)
                     s3_bucket = QUERY_RESULTS_DEV_BUCKET
                     s3_key = f"sql-files/cpu-intensive/{filename}"
 
@@ -7576,8 +7480,7 @@ Knowledge Base 성능 최적화 가이드:
 
                 # S3에 업로드 및 Pre-signed URL 생성
                 try:
-                    import boto3
-                    s3_client = boto3.client('s3', region_name=self.default_region)
+                    s3_client = self._get_aws_client("s3", self.default_region)
                     s3_bucket = QUERY_RESULTS_DEV_BUCKET
                     s3_key = f"sql-files/temp-intensive/{filename}"
 
@@ -7645,7 +7548,7 @@ Knowledge Base 성능 최적화 가이드:
             logger.info(f"에러 로그 분석 시작: {start_time_utc} ~ {end_time_utc} (UTC)")
 
             # AWS 클라이언트 초기화
-            rds_client = boto3.client("rds", region_name=self.default_region)
+            rds_client = self._get_rds_client(self.default_region)
 
             # 키워드로 시크릿 리스트 가져오기
             secret_lists = await self.get_secrets_by_keyword(keyword)
@@ -7671,13 +7574,9 @@ Knowledge Base 성능 최적화 가이드:
                     if ".cluster-" in db_host:
                         cluster_id = db_host.split(".")[0]
                         try:
-                            response = rds_client.describe_db_clusters(
-                                DBClusterIdentifier=cluster_id
+                            instances = self._get_cluster_member_ids(
+                                self.default_region, cluster_id
                             )
-                            instances = [
-                                member["DBInstanceIdentifier"]
-                                for member in response["DBClusters"][0]["DBClusterMembers"]
-                            ]
                         except Exception as e:
                             logger.warning(f"클러스터 {cluster_id} 조회 실패: {e}")
                             continue
@@ -7724,21 +7623,12 @@ Knowledge Base 성능 최적화 가이드:
                                     log_data = response.get("LogFileData", "")
                                     lines = log_data.splitlines()
 
-                                    # 중요한 에러 로그 항목 필터링
-                                    error_keywords = [
-                                        "error",
-                                        "warning",
-                                        "critical",
-                                        "failed",
-                                        "crash",
-                                        "exception",
-                                        "fatal",
-                                        "corruption",
-                                    ]
-
-                                    for line in lines:
-                                        if any(kw in line.lower() for kw in error_keywords):
-                                            log_content.append(line)
+                                    # 중요한 에러 로그 항목 필터링 (라인당 정규식 한 번만 검색)
+                                    log_content.extend(
+                                        line
+                                        for line in lines
+                                        if _ERROR_LOG_KEYWORD_RE.search(line)
+                                    )
                                 except Exception as e:
                                     logger.error(f"로그 파일 {log_filename} 다운로드 실패: {e}")
                                     continue
@@ -8177,7 +8067,7 @@ similarity_checked: true
                 f.write(file_content)
 
             # S3에 메타데이터와 함께 업로드
-            s3_client = boto3.client("s3", region_name="us-east-1")
+            s3_client = self._get_aws_client("s3", "us-east-1")
 
             s3_client.upload_file(
                 local_path,
@@ -8391,9 +8281,10 @@ CONFLICT_DETAILS: 상충되는 내용 설명 (상충이 있을 경우만)"""
             response_body = json.loads(response.get("body").read())
             analysis_text = response_body.get("content", [{}])[0].get("text", "")
 
-            # 응답 파싱
-            is_duplicate = "DUPLICATE: true" in analysis_text.lower()
-            has_conflict = "CONFLICT: true" in analysis_text.lower()
+            # 응답 파싱 (응답을 한 번만 소문자로 정규화하고 비교 대상도 소문자로 맞춤)
+            analysis_lower = analysis_text.lower()
+            is_duplicate = "duplicate: true" in analysis_lower
+            has_conflict = "conflict: true" in analysis_lower
 
             # 유사도 점수 추출
             similarity_score = 0.0
@@ -8513,7 +8404,7 @@ CONFLICT_DETAILS: 상충되는 내용 설명 (상충이 있을 경우만)"""
             filename = f"full_content_{date_str}_{clean_topic}.md"
             s3_key = f"{category}/full_content/{filename}"
 
-            s3_client = boto3.client("s3", region_name="us-east-1")
+            s3_client = self._get_aws_client("s3", "us-east-1")
             s3_client.put_object(
                 Bucket=BEDROCK_AGENT_BUCKET,
                 Key=s3_key,
@@ -8623,9 +8514,7 @@ CONFLICT_DETAILS: 상충되는 내용 설명 (상충이 있을 경우만)"""
     async def sync_knowledge_base(self) -> str:
         """Knowledge Base 데이터 소스 동기화"""
         try:
-            bedrock_agent_client = boto3.client(
-                "bedrock-agent", region_name="us-east-1"
-            )
+            bedrock_agent_client = self._get_aws_client("bedrock-agent", "us-east-1")
 
             response = bedrock_agent_client.start_ingestion_job(
                 knowledgeBaseId=KNOWLEDGE_BASE_ID, dataSourceId=DATA_SOURCE_ID
@@ -8652,8 +8541,8 @@ CONFLICT_DETAILS: 상충되는 내용 설명 (상충이 있을 경우만)"""
     async def query_vector_store(self, query: str, max_results: int = 5) -> str:
         """벡터 저장소에서 내용을 검색합니다"""
         try:
-            bedrock_agent_runtime = boto3.client(
-                "bedrock-agent-runtime", region_name="us-east-1"
+            bedrock_agent_runtime = self._get_aws_client(
+                "bedrock-agent-runtime", "us-east-1"
             )
 
             # Knowledge Base에서 검색
@@ -8734,7 +8623,7 @@ CONFLICT_DETAILS: 상충되는 내용 설명 (상충이 있을 경우만)"""
             object_key = uri_parts[1]
 
             # S3 클라이언트로 파일 내용 가져오기
-            s3_client = boto3.client("s3", region_name="us-east-1")
+            s3_client = self._get_aws_client("s3", "us-east-1")
             response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
             content = response["Body"].read().decode("utf-8")
 
@@ -8748,7 +8637,7 @@ CONFLICT_DETAILS: 상충되는 내용 설명 (상충이 있을 경우만)"""
     async def _check_file_version_in_s3(self, s3_key: str) -> dict:
         """S3에서 파일 버전 정보를 확인합니다"""
         try:
-            s3_client = boto3.client("s3", region_name="us-east-1")
+            s3_client = self._get_aws_client("s3", "us-east-1")
 
             # 파일 존재 여부 및 메타데이터 확인
             try:
@@ -8854,7 +8743,7 @@ CONFLICT_DETAILS: 상충되는 내용 설명 (상충이 있을 경우만)"""
                 f.write(updated_content)
 
             # S3 업데이트
-            s3_client = boto3.client("s3", region_name="us-east-1")
+            s3_client = self._get_aws_client("s3", "us-east-1")
 
             # 카테고리 추출 (파일명에서 또는 YAML에서)
             category = "examples"  # 기본값
@@ -8897,923 +8786,934 @@ server = Server("db-assistant-mcp-server")
 db_assistant = DBAssistantMCPServer()
 
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """사용 가능한 도구 목록 반환"""
-    return [
-        types.Tool(
-            name="list_sql_files",
-            description="sql 디렉토리의 SQL 파일 목록을 조회합니다",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        types.Tool(
-            name="list_database_secrets",
-            description="AWS Secrets Manager의 데이터베이스 시크릿 목록을 조회합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keyword": {
-                        "type": "string",
-                        "description": "검색할 키워드 (선택사항)",
-                    }
-                },
+# 도구 목록은 정적이므로 모듈 로드 시 한 번만 생성하여 list_tools 요청마다 재사용
+_TOOL_DEFINITIONS = (
+    types.Tool(
+        name="list_sql_files",
+        description="sql 디렉토리의 SQL 파일 목록을 조회합니다",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    types.Tool(
+        name="list_database_secrets",
+        description="AWS Secrets Manager의 데이터베이스 시크릿 목록을 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keyword": {
+                    "type": "string",
+                    "description": "검색할 키워드 (선택사항)",
+                }
             },
-        ),
-        types.Tool(
-            name="test_database_connection",
-            description="데이터베이스 연결을 테스트합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    }
-                },
-                "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="test_database_connection",
+        description="데이터베이스 연결을 테스트합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                }
             },
-        ),
-        types.Tool(
-            name="list_databases",
-            description="데이터베이스 목록을 조회하고 선택할 수 있습니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    }
-                },
-                "required": ["database_secret"],
+            "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="list_databases",
+        description="데이터베이스 목록을 조회하고 선택할 수 있습니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                }
             },
-        ),
-        types.Tool(
-            name="select_database",
-            description="특정 데이터베이스를 선택합니다 (USE 명령어 실행). 먼저 list_databases로 목록을 확인한 후 번호나 이름으로 선택하세요.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "database_selection": {
-                        "type": "string",
-                        "description": "선택할 데이터베이스 (번호 또는 이름)",
-                    },
+            "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="select_database",
+        description="특정 데이터베이스를 선택합니다 (USE 명령어 실행). 먼저 list_databases로 목록을 확인한 후 번호나 이름으로 선택하세요.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
                 },
-                "required": ["database_secret", "database_selection"],
-            },
-        ),
-        types.Tool(
-            name="get_schema_summary",
-            description="현재 데이터베이스 스키마의 요약 정보를 제공합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    }
+                "database_selection": {
+                    "type": "string",
+                    "description": "선택할 데이터베이스 (번호 또는 이름)",
                 },
-                "required": ["database_secret"],
             },
-        ),
-        types.Tool(
-            name="get_table_schema",
-            description="특정 테이블의 상세 스키마 정보를 조회합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "table_name": {
-                        "type": "string",
-                        "description": "조회할 테이블 이름",
-                    },
-                },
-                "required": ["database_secret", "table_name"],
+            "required": ["database_secret", "database_selection"],
+        },
+    ),
+    types.Tool(
+        name="get_schema_summary",
+        description="현재 데이터베이스 스키마의 요약 정보를 제공합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                }
             },
-        ),
-        types.Tool(
-            name="text_to_sql",
-            description="자연어 쿼리를 SQL로 변환하고 실행합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "natural_language_query": {
-                        "type": "string",
-                        "description": "자연어로 작성된 쿼리 요청",
-                    },
+            "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="get_table_schema",
+        description="특정 테이블의 상세 스키마 정보를 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
                 },
-                "required": ["database_secret", "natural_language_query"],
-            },
-        ),
-        types.Tool(
-            name="get_table_index",
-            description="특정 테이블의 인덱스 정보를 조회합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "table_name": {
-                        "type": "string",
-                        "description": "조회할 테이블 이름",
-                    },
+                "table_name": {
+                    "type": "string",
+                    "description": "조회할 테이블 이름",
                 },
-                "required": ["database_secret", "table_name"],
             },
-        ),
-        types.Tool(
-            name="get_performance_metrics",
-            description="데이터베이스 성능 메트릭을 조회합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "metric_type": {
-                        "type": "string",
-                        "description": "메트릭 타입 (all, query, io, memory, connection)",
-                        "enum": ["all", "query", "io", "memory", "connection"],
-                        "default": "all",
-                    },
+            "required": ["database_secret", "table_name"],
+        },
+    ),
+    types.Tool(
+        name="text_to_sql",
+        description="자연어 쿼리를 SQL로 변환하고 실행합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
                 },
-                "required": ["database_secret"],
-            },
-        ),
-        types.Tool(
-            name="collect_db_metrics",
-            description="CloudWatch에서 데이터베이스 메트릭을 수집합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "db_instance_identifier": {
-                        "type": "string",
-                        "description": "데이터베이스 인스턴스 식별자",
-                    },
-                    "hours": {
-                        "type": "integer",
-                        "description": "수집할 시간 범위 (시간 단위, 기본값: 24)",
-                        "default": 24,
-                    },
-                    "metrics": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "수집할 메트릭 목록 (선택사항)",
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS 리전 (기본값: us-east-1)",
-                        "default": "us-east-1",
-                    },
+                "natural_language_query": {
+                    "type": "string",
+                    "description": "자연어로 작성된 쿼리 요청",
                 },
-                "required": ["db_instance_identifier"],
             },
-        ),
-        types.Tool(
-            name="analyze_metric_correlation",
-            description="메트릭 간 상관관계를 분석합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "csv_file": {"type": "string", "description": "분석할 CSV 파일명"},
-                    "target_metric": {
-                        "type": "string",
-                        "description": "타겟 메트릭 (기본값: CPUUtilization)",
-                        "default": "CPUUtilization",
-                    },
-                    "top_n": {
-                        "type": "integer",
-                        "description": "상위 N개 메트릭 (기본값: 10)",
-                        "default": 10,
-                    },
+            "required": ["database_secret", "natural_language_query"],
+        },
+    ),
+    types.Tool(
+        name="get_table_index",
+        description="특정 테이블의 인덱스 정보를 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "table_name": {
+                    "type": "string",
+                    "description": "조회할 테이블 이름",
                 },
-                "required": ["csv_file"],
             },
-        ),
-        types.Tool(
-            name="detect_metric_outliers",
-            description="개선된 아웃라이어 탐지 - 메트릭별 맞춤 임계값과 물리적 제약 적용",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "csv_file": {"type": "string", "description": "분석할 CSV 파일명"},
-                    "std_threshold": {
-                        "type": "number",
-                        "description": "IQR 방식용 임계값 (기본값: 3.0, 메트릭별 맞춤 기준 우선 적용)",
-                        "default": 3.0,
-                    },
+            "required": ["database_secret", "table_name"],
+        },
+    ),
+    types.Tool(
+        name="get_performance_metrics",
+        description="데이터베이스 성능 메트릭을 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "metric_type": {
+                    "type": "string",
+                    "description": "메트릭 타입 (all, query, io, memory, connection)",
+                    "enum": ["all", "query", "io", "memory", "connection"],
+                    "default": "all",
                 },
-                "required": ["csv_file"],
             },
-        ),
-        types.Tool(
-            name="perform_regression_analysis",
-            description="메트릭 간 회귀 분석을 수행합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "csv_file": {"type": "string", "description": "분석할 CSV 파일명"},
-                    "predictor_metric": {
-                        "type": "string",
-                        "description": "예측 변수 메트릭",
-                    },
-                    "target_metric": {
-                        "type": "string",
-                        "description": "타겟 메트릭 (기본값: CPUUtilization)",
-                        "default": "CPUUtilization",
-                    },
+            "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="collect_db_metrics",
+        description="CloudWatch에서 데이터베이스 메트릭을 수집합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "db_instance_identifier": {
+                    "type": "string",
+                    "description": "데이터베이스 인스턴스 식별자",
+                },
+                "hours": {
+                    "type": "integer",
+                    "description": "수집할 시간 범위 (시간 단위, 기본값: 24)",
+                    "default": 24,
+                },
+                "metrics": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "수집할 메트릭 목록 (선택사항)",
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS 리전 (기본값: us-east-1)",
+                    "default": "us-east-1",
                 },
-                "required": ["csv_file", "predictor_metric"],
             },
-        ),
-        types.Tool(
-            name="list_data_files",
-            description="데이터 디렉토리의 CSV 파일 목록을 조회합니다",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        types.Tool(
-            name="validate_sql_file",
-            description="특정 SQL 파일을 검증합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string", "description": "검증할 SQL 파일명"},
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름 (선택사항)",
-                    },
+            "required": ["db_instance_identifier"],
+        },
+    ),
+    types.Tool(
+        name="analyze_metric_correlation",
+        description="메트릭 간 상관관계를 분석합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "csv_file": {"type": "string", "description": "분석할 CSV 파일명"},
+                "target_metric": {
+                    "type": "string",
+                    "description": "타겟 메트릭 (기본값: CPUUtilization)",
+                    "default": "CPUUtilization",
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "상위 N개 메트릭 (기본값: 10)",
+                    "default": 10,
                 },
-                "required": ["filename"],
             },
-        ),
-        types.Tool(
-            name="copy_sql_to_directory",
-            description="SQL 파일을 sql 디렉토리로 복사합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source_path": {
-                        "type": "string",
-                        "description": "복사할 SQL 파일의 경로",
-                    },
-                    "target_name": {
-                        "type": "string",
-                        "description": "대상 파일명 (선택사항, 기본값은 원본 파일명)",
-                    },
+            "required": ["csv_file"],
+        },
+    ),
+    types.Tool(
+        name="detect_metric_outliers",
+        description="개선된 아웃라이어 탐지 - 메트릭별 맞춤 임계값과 물리적 제약 적용",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "csv_file": {"type": "string", "description": "분석할 CSV 파일명"},
+                "std_threshold": {
+                    "type": "number",
+                    "description": "IQR 방식용 임계값 (기본값: 3.0, 메트릭별 맞춤 기준 우선 적용)",
+                    "default": 3.0,
                 },
-                "required": ["source_path"],
             },
-        ),
-        types.Tool(
-            name="get_metric_summary",
-            description="CSV 파일의 메트릭 요약 정보를 조회합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "csv_file": {"type": "string", "description": "요약할 CSV 파일명"}
+            "required": ["csv_file"],
+        },
+    ),
+    types.Tool(
+        name="perform_regression_analysis",
+        description="메트릭 간 회귀 분석을 수행합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "csv_file": {"type": "string", "description": "분석할 CSV 파일명"},
+                "predictor_metric": {
+                    "type": "string",
+                    "description": "예측 변수 메트릭",
+                },
+                "target_metric": {
+                    "type": "string",
+                    "description": "타겟 메트릭 (기본값: CPUUtilization)",
+                    "default": "CPUUtilization",
                 },
-                "required": ["csv_file"],
             },
-        ),
-        types.Tool(
-            name="debug_cloudwatch_collection",
-            description="CloudWatch 슬로우 쿼리 수집 디버그",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "시작 시간 (YYYY-MM-DD HH:MM:SS, KST 기준)",
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "종료 시간 (YYYY-MM-DD HH:MM:SS, KST 기준)",
-                    },
+            "required": ["csv_file", "predictor_metric"],
+        },
+    ),
+    types.Tool(
+        name="list_data_files",
+        description="데이터 디렉토리의 CSV 파일 목록을 조회합니다",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    types.Tool(
+        name="validate_sql_file",
+        description="특정 SQL 파일을 검증합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string", "description": "검증할 SQL 파일명"},
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름 (선택사항)",
                 },
-                "required": ["database_secret", "start_time", "end_time"],
             },
-        ),
-        types.Tool(
-            name="collect_slow_queries",
-            description="슬로우 쿼리 로그에서 느린 쿼리를 수집합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "시작 시간 (YYYY-MM-DD HH:MM:SS, KST 기준, 선택사항)",
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "종료 시간 (YYYY-MM-DD HH:MM:SS, KST 기준, 선택사항)",
-                    },
+            "required": ["filename"],
+        },
+    ),
+    types.Tool(
+        name="copy_sql_to_directory",
+        description="SQL 파일을 sql 디렉토리로 복사합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_path": {
+                    "type": "string",
+                    "description": "복사할 SQL 파일의 경로",
+                },
+                "target_name": {
+                    "type": "string",
+                    "description": "대상 파일명 (선택사항, 기본값은 원본 파일명)",
                 },
-                "required": ["database_secret"],
             },
-        ),
-        types.Tool(
-            name="enable_slow_query_log_exports",
-            description="Aurora 클러스터의 SlowQuery 로그 CloudWatch 전송을 활성화합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "cluster_identifier": {
-                        "type": "string",
-                        "description": "Aurora 클러스터 식별자",
-                    },
+            "required": ["source_path"],
+        },
+    ),
+    types.Tool(
+        name="get_metric_summary",
+        description="CSV 파일의 메트릭 요약 정보를 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "csv_file": {"type": "string", "description": "요약할 CSV 파일명"}
+            },
+            "required": ["csv_file"],
+        },
+    ),
+    types.Tool(
+        name="debug_cloudwatch_collection",
+        description="CloudWatch 슬로우 쿼리 수집 디버그",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "시작 시간 (YYYY-MM-DD HH:MM:SS, KST 기준)",
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "종료 시간 (YYYY-MM-DD HH:MM:SS, KST 기준)",
                 },
-                "required": ["cluster_identifier"],
             },
-        ),
-        types.Tool(
-            name="collect_cpu_intensive_queries",
-            description="CPU 집약적 쿼리를 수집하는 SQL을 생성합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "db_instance_identifier": {
-                        "type": "string",
-                        "description": "특정 인스턴스 식별자 (선택사항)",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "시작 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "종료 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
-                    },
+            "required": ["database_secret", "start_time", "end_time"],
+        },
+    ),
+    types.Tool(
+        name="collect_slow_queries",
+        description="슬로우 쿼리 로그에서 느린 쿼리를 수집합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "시작 시간 (YYYY-MM-DD HH:MM:SS, KST 기준, 선택사항)",
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "종료 시간 (YYYY-MM-DD HH:MM:SS, KST 기준, 선택사항)",
                 },
-                "required": ["database_secret"],
             },
-        ),
-        types.Tool(
-            name="collect_temp_space_intensive_queries",
-            description="임시 공간 집약적 쿼리를 수집하는 SQL을 생성합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "db_instance_identifier": {
-                        "type": "string",
-                        "description": "특정 인스턴스 식별자 (선택사항)",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "시작 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "종료 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
-                    },
+            "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="enable_slow_query_log_exports",
+        description="Aurora 클러스터의 SlowQuery 로그 CloudWatch 전송을 활성화합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "cluster_identifier": {
+                    "type": "string",
+                    "description": "Aurora 클러스터 식별자",
                 },
-                "required": ["database_secret"],
             },
-        ),
-        types.Tool(
-            name="validate_schema_lambda",
-            description="DDL 스키마를 검증합니다 (Lambda 사용) - CREATE TABLE, ALTER TABLE, DROP TABLE, CREATE INDEX 지원",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "데이터베이스 이름",
-                    },
-                    "ddl_content": {
-                        "type": "string",
-                        "description": "검증할 DDL 구문",
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS 리전 (기본값: ap-northeast-2)",
-                    },
+            "required": ["cluster_identifier"],
+        },
+    ),
+    types.Tool(
+        name="collect_cpu_intensive_queries",
+        description="CPU 집약적 쿼리를 수집하는 SQL을 생성합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "db_instance_identifier": {
+                    "type": "string",
+                    "description": "특정 인스턴스 식별자 (선택사항)",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "시작 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "종료 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
                 },
-                "required": ["database_secret", "database", "ddl_content"],
             },
-        ),
-        types.Tool(
-            name="explain_query_lambda",
-            description="SQL 쿼리 실행 계획을 분석합니다 (Lambda 사용) - 성능 이슈 자동 감지 및 개선 권장사항 제공",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "database": {
-                        "type": "string",
-                        "description": "데이터베이스 이름",
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "분석할 SQL 쿼리",
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS 리전 (기본값: ap-northeast-2)",
-                    },
+            "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="collect_temp_space_intensive_queries",
+        description="임시 공간 집약적 쿼리를 수집하는 SQL을 생성합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "db_instance_identifier": {
+                    "type": "string",
+                    "description": "특정 인스턴스 식별자 (선택사항)",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "시작 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "종료 시간 (YYYY-MM-DD HH:MM:SS 형식, 선택사항)",
                 },
-                "required": ["database_secret", "database", "query"],
             },
-        ),
-        types.Tool(
-            name="analyze_aurora_mysql_error_logs",
-            description="Aurora MySQL 에러 로그를 분석합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keyword": {
-                        "type": "string",
-                        "description": "검색할 키워드 (시크릿 이름 필터링용)",
-                    },
-                    "start_datetime_str": {
-                        "type": "string",
-                        "description": "시작 시간 (YYYY-MM-DD HH:MM:SS 형식)",
-                    },
-                    "end_datetime_str": {
-                        "type": "string",
-                        "description": "종료 시간 (YYYY-MM-DD HH:MM:SS 형식)",
-                    },
+            "required": ["database_secret"],
+        },
+    ),
+    types.Tool(
+        name="validate_schema_lambda",
+        description="DDL 스키마를 검증합니다 (Lambda 사용) - CREATE TABLE, ALTER TABLE, DROP TABLE, CREATE INDEX 지원",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "database": {
+                    "type": "string",
+                    "description": "데이터베이스 이름",
+                },
+                "ddl_content": {
+                    "type": "string",
+                    "description": "검증할 DDL 구문",
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS 리전 (기본값: ap-northeast-2)",
                 },
-                "required": ["keyword", "start_datetime_str", "end_datetime_str"],
             },
-        ),
-        types.Tool(
-            name="test_individual_query_validation",
-            description="개별 쿼리 검증 테스트 (디버그용)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "filename": {"type": "string", "description": "검증할 SQL 파일명"},
+            "required": ["database_secret", "database", "ddl_content"],
+        },
+    ),
+    types.Tool(
+        name="explain_query_lambda",
+        description="SQL 쿼리 실행 계획을 분석합니다 (Lambda 사용) - 성능 이슈 자동 감지 및 개선 권장사항 제공",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "database": {
+                    "type": "string",
+                    "description": "데이터베이스 이름",
+                },
+                "query": {
+                    "type": "string",
+                    "description": "분석할 SQL 쿼리",
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS 리전 (기본값: ap-northeast-2)",
                 },
-                "required": ["database_secret", "filename"],
             },
-        ),
-        types.Tool(
-            name="generate_consolidated_report",
-            description="기존 HTML 보고서들을 기반으로 통합 보고서 생성",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "keyword": {
-                        "type": "string",
-                        "description": "필터링할 키워드 (선택사항)",
-                    },
-                    "report_files": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "특정 보고서 파일명 목록 (선택사항)",
-                    },
-                    "date_filter": {
-                        "type": "string",
-                        "description": "날짜 필터 (YYYYMMDD 형식, 선택사항)",
-                    },
-                    "latest_count": {
-                        "type": "integer",
-                        "description": "최신 파일 개수 제한 (선택사항)",
-                    },
+            "required": ["database_secret", "database", "query"],
+        },
+    ),
+    types.Tool(
+        name="analyze_aurora_mysql_error_logs",
+        description="Aurora MySQL 에러 로그를 분석합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keyword": {
+                    "type": "string",
+                    "description": "검색할 키워드 (시크릿 이름 필터링용)",
+                },
+                "start_datetime_str": {
+                    "type": "string",
+                    "description": "시작 시간 (YYYY-MM-DD HH:MM:SS 형식)",
+                },
+                "end_datetime_str": {
+                    "type": "string",
+                    "description": "종료 시간 (YYYY-MM-DD HH:MM:SS 형식)",
                 },
             },
-        ),
-        types.Tool(
-            name="save_to_vector_store",
-            description="대화 내용이나 분석 결과를 벡터 저장소(Knowledge Base)에 저장합니다 (중복/상충 검사 포함)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "저장할 내용",
-                    },
-                    "topic": {
-                        "type": "string",
-                        "description": "주제명 (10자 이내 영문)",
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "카테고리 (database-standards, performance-optimization, troubleshooting, examples 중 선택)",
-                        "enum": [
-                            "database-standards",
-                            "performance-optimization",
-                            "troubleshooting",
-                            "examples",
-                        ],
-                        "default": "examples",
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "태그 목록 (선택사항)",
-                    },
-                    "force_save": {
-                        "type": "boolean",
-                        "description": "중복/상충 검사 무시하고 강제 저장 (선택사항)",
-                        "default": False,
-                    },
-                    "auto_summarize": {
-                        "type": "boolean",
-                        "description": "1000자 이상 내용 자동 요약 (선택사항)",
-                        "default": True,
-                    },
+            "required": ["keyword", "start_datetime_str", "end_datetime_str"],
+        },
+    ),
+    types.Tool(
+        name="test_individual_query_validation",
+        description="개별 쿼리 검증 테스트 (디버그용)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
                 },
-                "required": ["content", "topic"],
+                "filename": {"type": "string", "description": "검증할 SQL 파일명"},
             },
-        ),
-        types.Tool(
-            name="update_vector_content",
-            description="기존 벡터 저장소 문서를 업데이트합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "업데이트할 파일명",
-                    },
-                    "new_content": {
-                        "type": "string",
-                        "description": "새로운 내용 (기존 내용에 추가됨)",
-                    },
-                    "update_mode": {
-                        "type": "string",
-                        "description": "업데이트 모드 (append: 추가, replace: 교체)",
-                        "enum": ["append", "replace"],
-                        "default": "append",
-                    },
+            "required": ["database_secret", "filename"],
+        },
+    ),
+    types.Tool(
+        name="generate_consolidated_report",
+        description="기존 HTML 보고서들을 기반으로 통합 보고서 생성",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "keyword": {
+                    "type": "string",
+                    "description": "필터링할 키워드 (선택사항)",
+                },
+                "report_files": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "특정 보고서 파일명 목록 (선택사항)",
+                },
+                "date_filter": {
+                    "type": "string",
+                    "description": "날짜 필터 (YYYYMMDD 형식, 선택사항)",
+                },
+                "latest_count": {
+                    "type": "integer",
+                    "description": "최신 파일 개수 제한 (선택사항)",
                 },
-                "required": ["filename", "new_content"],
             },
-        ),
-        types.Tool(
-            name="sync_knowledge_base",
-            description="Knowledge Base 데이터 소스를 동기화합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+        },
+    ),
+    types.Tool(
+        name="save_to_vector_store",
+        description="대화 내용이나 분석 결과를 벡터 저장소(Knowledge Base)에 저장합니다 (중복/상충 검사 포함)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "description": "저장할 내용",
+                },
+                "topic": {
+                    "type": "string",
+                    "description": "주제명 (10자 이내 영문)",
+                },
+                "category": {
+                    "type": "string",
+                    "description": "카테고리 (database-standards, performance-optimization, troubleshooting, examples 중 선택)",
+                    "enum": [
+                        "database-standards",
+                        "performance-optimization",
+                        "troubleshooting",
+                        "examples",
+                    ],
+                    "default": "examples",
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "태그 목록 (선택사항)",
+                },
+                "force_save": {
+                    "type": "boolean",
+                    "description": "중복/상충 검사 무시하고 강제 저장 (선택사항)",
+                    "default": False,
+                },
+                "auto_summarize": {
+                    "type": "boolean",
+                    "description": "1000자 이상 내용 자동 요약 (선택사항)",
+                    "default": True,
+                },
             },
-        ),
-        types.Tool(
-            name="query_vector_store",
-            description="벡터 저장소(Knowledge Base)에서 내용을 검색합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "검색할 키워드나 질문",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "최대 검색 결과 수 (기본값: 5)",
-                        "default": 5,
-                    },
+            "required": ["content", "topic"],
+        },
+    ),
+    types.Tool(
+        name="update_vector_content",
+        description="기존 벡터 저장소 문서를 업데이트합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "업데이트할 파일명",
+                },
+                "new_content": {
+                    "type": "string",
+                    "description": "새로운 내용 (기존 내용에 추가됨)",
+                },
+                "update_mode": {
+                    "type": "string",
+                    "description": "업데이트 모드 (append: 추가, replace: 교체)",
+                    "enum": ["append", "replace"],
+                    "default": "append",
                 },
-                "required": ["query"],
             },
-        ),
-        types.Tool(
-            name="generate_comprehensive_performance_report",
-            description="Oracle AWR 스타일의 종합 성능 진단 보고서 생성 (메트릭 분석, 상관관계, 느린 쿼리, 리소스 집약적 쿼리 포함)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "db_instance_identifier": {
-                        "type": "string",
-                        "description": "데이터베이스 인스턴스 식별자",
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS 리전 (기본값: ap-northeast-2)",
-                        "default": "ap-northeast-2",
-                    },
-                    "hours": {
-                        "type": "integer",
-                        "description": "수집할 시간 범위 (시간 단위, 기본값: 24)",
-                        "default": 24,
-                    },
+            "required": ["filename", "new_content"],
+        },
+    ),
+    types.Tool(
+        name="sync_knowledge_base",
+        description="Knowledge Base 데이터 소스를 동기화합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    types.Tool(
+        name="query_vector_store",
+        description="벡터 저장소(Knowledge Base)에서 내용을 검색합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "검색할 키워드나 질문",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "최대 검색 결과 수 (기본값: 5)",
+                    "default": 5,
                 },
-                "required": ["database_secret", "db_instance_identifier"],
             },
-        ),
-        types.Tool(
-            name="generate_cluster_performance_report",
-            description="Aurora 클러스터 전용 성능 보고서 생성 (클러스터 레벨 분석 + 인스턴스별 상세 보고서 링크)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_secret": {
-                        "type": "string",
-                        "description": "데이터베이스 시크릿 이름",
-                    },
-                    "db_cluster_identifier": {
-                        "type": "string",
-                        "description": "Aurora 클러스터 식별자",
-                    },
-                    "region": {
-                        "type": "string",
-                        "description": "AWS 리전 (기본값: ap-northeast-2)",
-                        "default": "ap-northeast-2",
-                    },
-                    "hours": {
-                        "type": "integer",
-                        "description": "수집할 시간 범위 (시간 단위, 기본값: 24)",
-                        "default": 24,
-                    },
+            "required": ["query"],
+        },
+    ),
+    types.Tool(
+        name="generate_comprehensive_performance_report",
+        description="Oracle AWR 스타일의 종합 성능 진단 보고서 생성 (메트릭 분석, 상관관계, 느린 쿼리, 리소스 집약적 쿼리 포함)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "db_instance_identifier": {
+                    "type": "string",
+                    "description": "데이터베이스 인스턴스 식별자",
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS 리전 (기본값: ap-northeast-2)",
+                    "default": "ap-northeast-2",
+                },
+                "hours": {
+                    "type": "integer",
+                    "description": "수집할 시간 범위 (시간 단위, 기본값: 24)",
+                    "default": 24,
                 },
-                "required": ["database_secret", "db_cluster_identifier"],
             },
-        ),
-        types.Tool(
-            name="set_default_region",
-            description="기본 AWS 리전을 변경합니다",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region_name": {
-                        "type": "string",
-                        "description": "설정할 AWS 리전 (예: ap-northeast-2, us-east-1, eu-west-1)",
-                    }
+            "required": ["database_secret", "db_instance_identifier"],
+        },
+    ),
+    types.Tool(
+        name="generate_cluster_performance_report",
+        description="Aurora 클러스터 전용 성능 보고서 생성 (클러스터 레벨 분석 + 인스턴스별 상세 보고서 링크)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_secret": {
+                    "type": "string",
+                    "description": "데이터베이스 시크릿 이름",
+                },
+                "db_cluster_identifier": {
+                    "type": "string",
+                    "description": "Aurora 클러스터 식별자",
+                },
+                "region": {
+                    "type": "string",
+                    "description": "AWS 리전 (기본값: ap-northeast-2)",
+                    "default": "ap-northeast-2",
+                },
+                "hours": {
+                    "type": "integer",
+                    "description": "수집할 시간 범위 (시간 단위, 기본값: 24)",
+                    "default": 24,
                 },
-                "required": ["region_name"],
             },
-        ),
-    ]
+            "required": ["database_secret", "db_cluster_identifier"],
+        },
+    ),
+    types.Tool(
+        name="list_aurora_mysql_clusters",
+        description="여러 리전의 사용 가능한 Aurora MySQL 클러스터 목록을 동시에 조회합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "regions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "조회할 AWS 리전 목록 (기본값: 현재 기본 리전)",
+                }
+            },
+        },
+    ),
+    types.Tool(
+        name="set_default_region",
+        description="기본 AWS 리전을 변경합니다",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region_name": {
+                    "type": "string",
+                    "description": "설정할 AWS 리전 (예: ap-northeast-2, us-east-1, eu-west-1)",
+                }
+            },
+            "required": ["region_name"],
+        },
+    ),
+)
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """사용 가능한 도구 목록 반환"""
+    return list(_TOOL_DEFINITIONS)
+
+
+async def _call_validate_schema_lambda(arguments: dict) -> str:
+    """validate_schema_lambda 도구 실행 및 결과 문자열 포맷팅"""
+    validation_result = await db_assistant.validate_schema_lambda(
+        arguments["database_secret"],
+        arguments["database"],
+        arguments["ddl_content"],
+        arguments.get("region", "ap-northeast-2"),
+    )
+    # 결과를 문자열로 포맷팅
+    if validation_result.get('success'):
+        ddl_type = validation_result.get('ddl_type', 'UNKNOWN')
+        table_name = validation_result.get('table_name', 'N/A')
+        is_valid = validation_result.get('valid', False)
+        issues = validation_result.get('issues', [])
+        warnings = validation_result.get('warnings', [])
+        s3_location = validation_result.get('s3_location', '')
+
+        status = "✅ 검증 통과" if is_valid else "❌ 검증 실패"
+        result = f"{status}\n\n"
+        result += f"DDL 타입: {ddl_type}\n"
+        result += f"테이블 이름: {table_name}\n\n"
+
+        if issues:
+            result += f"문제점 ({len(issues)}개):\n"
+            for issue in issues:
+                result += f"  - {issue}\n"
+            result += "\n"
+
+        if warnings:
+            result += f"경고 ({len(warnings)}개):\n"
+            for warning in warnings:
+                result += f"  - {warning}\n"
+            result += "\n"
+
+        result += f"S3 저장 위치: {s3_location}"
+    else:
+        error_msg = validation_result.get('error', 'Unknown error')
+        result = f"❌ 스키마 검증 실패: {error_msg}"
+    return result
+
+
+async def _call_explain_query_lambda(arguments: dict) -> str:
+    """explain_query_lambda 도구 실행 및 결과 문자열 포맷팅"""
+    explain_result = await db_assistant.explain_query_lambda(
+        arguments["database_secret"],
+        arguments["database"],
+        arguments["query"],
+        arguments.get("region", "ap-northeast-2"),
+    )
+    # 결과를 문자열로 포맷팅
+    if explain_result.get('success'):
+        query = explain_result.get('query', '')
+        explain_data = explain_result.get('explain_data', [])
+        performance_issues = explain_result.get('performance_issues', [])
+        recommendations = explain_result.get('recommendations', [])
+        s3_location = explain_result.get('s3_location', '')
+
+        issue_count = explain_result.get('performance_issue_count', 0)
+        status = "✅ 성능 이슈 없음" if issue_count == 0 else f"⚠️ 성능 이슈 {issue_count}개 발견"
+
+        result = f"{status}\n\n"
+        result += f"쿼리: {query[:100]}...\n\n" if len(query) > 100 else f"쿼리: {query}\n\n"
+
+        if performance_issues:
+            result += f"성능 이슈 ({len(performance_issues)}개):\n"
+            for issue in performance_issues:
+                result += f"  - {issue}\n"
+            result += "\n"
+
+        if recommendations:
+            result += f"개선 권장사항 ({len(recommendations)}개):\n"
+            for rec in recommendations:
+                result += f"  - {rec}\n"
+            result += "\n"
+
+        result += f"S3 저장 위치: {s3_location}"
+    else:
+        error_msg = explain_result.get('error', 'Unknown error')
+        result = f"❌ EXPLAIN 분석 실패: {error_msg}"
+    return result
+
+
+# 도구 이름 -> 실행 함수 (if/elif 체인 순차 비교 대신 한 번의 dict 조회로 디스패치)
+_TOOL_HANDLERS = {
+    "list_sql_files": lambda a: db_assistant.list_sql_files(),
+    "list_database_secrets": lambda a: db_assistant.list_database_secrets(
+        a.get("keyword", "")
+    ),
+    "test_database_connection": lambda a: db_assistant.test_database_connection(
+        a["database_secret"]
+    ),
+    "list_databases": lambda a: db_assistant.list_databases(a["database_secret"]),
+    "select_database": lambda a: db_assistant.select_database(
+        a["database_secret"], a["database_selection"]
+    ),
+    "get_schema_summary": lambda a: db_assistant.get_schema_summary(
+        a["database_secret"]
+    ),
+    "get_table_schema": lambda a: db_assistant.get_table_schema(
+        a["database_secret"], a["table_name"]
+    ),
+    "text_to_sql": lambda a: db_assistant.text_to_sql(
+        a["database_secret"], a["natural_language_query"]
+    ),
+    "get_table_index": lambda a: db_assistant.get_table_index(
+        a["database_secret"], a["table_name"]
+    ),
+    "get_performance_metrics": lambda a: db_assistant.get_performance_metrics(
+        a["database_secret"], a.get("metric_type", "all")
+    ),
+    "collect_db_metrics": lambda a: db_assistant.collect_db_metrics(
+        a["db_instance_identifier"],
+        a.get("hours", 24),
+        a.get("metrics"),
+        a.get("region", "us-east-1"),
+    ),
+    "analyze_metric_correlation": lambda a: db_assistant.analyze_metric_correlation(
+        a["csv_file"],
+        a.get("target_metric", "CPUUtilization"),
+        a.get("top_n", 10),
+    ),
+    "detect_metric_outliers": lambda a: db_assistant.detect_metric_outliers(
+        a["csv_file"], a.get("std_threshold", 3.0)
+    ),
+    "perform_regression_analysis": lambda a: db_assistant.perform_regression_analysis(
+        a["csv_file"],
+        a["predictor_metric"],
+        a.get("target_metric", "CPUUtilization"),
+    ),
+    "list_data_files": lambda a: db_assistant.list_data_files(),
+    "validate_sql_file": lambda a: db_assistant.validate_sql_file(
+        a["filename"], a.get("database_secret")
+    ),
+    "copy_sql_to_directory": lambda a: db_assistant.copy_sql_file(
+        a["source_path"], a.get("target_name")
+    ),
+    "get_metric_summary": lambda a: db_assistant.get_metric_summary(a["csv_file"]),
+    "debug_cloudwatch_collection": lambda a: db_assistant.debug_cloudwatch_collection(
+        a["database_secret"],
+        a["start_time"],
+        a["end_time"],
+    ),
+    "collect_slow_queries": lambda a: db_assistant.collect_slow_queries(
+        a["database_secret"],
+        a.get("start_time"),
+        a.get("end_time"),
+    ),
+    "enable_slow_query_log_exports": lambda a: db_assistant.enable_slow_query_log_exports(
+        a["cluster_identifier"]
+    ),
+    "collect_cpu_intensive_queries": lambda a: db_assistant.collect_cpu_intensive_queries(
+        a["database_secret"],
+        a.get("db_instance_identifier"),
+        a.get("start_time"),
+        a.get("end_time"),
+    ),
+    "collect_temp_space_intensive_queries": lambda a: db_assistant.collect_temp_space_intensive_queries(
+        a["database_secret"],
+        a.get("db_instance_identifier"),
+        a.get("start_time"),
+        a.get("end_time"),
+    ),
+    "validate_schema_lambda": _call_validate_schema_lambda,
+    "explain_query_lambda": _call_explain_query_lambda,
+    "analyze_aurora_mysql_error_logs": lambda a: db_assistant.analyze_aurora_mysql_error_logs(
+        a["keyword"],
+        a["start_datetime_str"],
+        a["end_datetime_str"],
+    ),
+    "save_to_vector_store": lambda a: db_assistant.save_to_vector_store(
+        a["content"],
+        a["topic"],
+        a.get("category", "examples"),
+        a.get("tags"),
+        a.get("force_save", False),
+        a.get("auto_summarize", True),
+    ),
+    "update_vector_content": lambda a: db_assistant.update_vector_content(
+        a["filename"],
+        a["new_content"],
+        a.get("update_mode", "append"),
+    ),
+    "sync_knowledge_base": lambda a: db_assistant.sync_knowledge_base(),
+    "query_vector_store": lambda a: db_assistant.query_vector_store(
+        a["query"], a.get("max_results", 5)
+    ),
+    "test_individual_query_validation": lambda a: db_assistant.test_individual_query_validation(
+        a["database_secret"], a["filename"]
+    ),
+    "generate_consolidated_report": lambda a: db_assistant.generate_consolidated_report(
+        a.get("keyword"),
+        a.get("report_files"),
+        a.get("date_filter"),
+        a.get("latest_count"),
+    ),
+    "generate_comprehensive_performance_report": lambda a: db_assistant.generate_comprehensive_performance_report(
+        a["database_secret"],
+        a["db_instance_identifier"],
+        a.get("region", "ap-northeast-2"),
+        a.get("hours", 24),
+    ),
+    "generate_cluster_performance_report": lambda a: db_assistant.generate_cluster_performance_report(
+        a["database_secret"],
+        a["db_cluster_identifier"],
+        a.get("hours", 24),
+        a.get("region", "ap-northeast-2"),
+    ),
+    "list_aurora_mysql_clusters": lambda a: db_assistant.list_aurora_mysql_clusters(
+        a.get("regions")
+    ),
+    # set_default_region은 동기 메서드 (반환값이 코루틴이 아니면 그대로 사용)
+    "set_default_region": lambda a: db_assistant.set_default_region(a["region_name"]),
+}
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     """도구 호출 처리"""
     try:
-        if name == "list_sql_files":
-            result = await db_assistant.list_sql_files()
-        elif name == "list_database_secrets":
-            result = await db_assistant.list_database_secrets(
-                arguments.get("keyword", "")
-            )
-        elif name == "test_database_connection":
-            result = await db_assistant.test_database_connection(
-                arguments["database_secret"]
-            )
-        elif name == "list_databases":
-            result = await db_assistant.list_databases(arguments["database_secret"])
-        elif name == "select_database":
-            result = await db_assistant.select_database(
-                arguments["database_secret"], arguments["database_selection"]
-            )
-        elif name == "get_schema_summary":
-            result = await db_assistant.get_schema_summary(arguments["database_secret"])
-        elif name == "get_table_schema":
-            result = await db_assistant.get_table_schema(
-                arguments["database_secret"], arguments["table_name"]
-            )
-        elif name == "text_to_sql":
-            result = await db_assistant.text_to_sql(
-                arguments["database_secret"], arguments["natural_language_query"]
-            )
-        elif name == "get_table_index":
-            result = await db_assistant.get_table_index(
-                arguments["database_secret"], arguments["table_name"]
-            )
-        elif name == "get_performance_metrics":
-            result = await db_assistant.get_performance_metrics(
-                arguments["database_secret"], arguments.get("metric_type", "all")
-            )
-        elif name == "collect_db_metrics":
-            result = await db_assistant.collect_db_metrics(
-                arguments["db_instance_identifier"],
-                arguments.get("hours", 24),
-                arguments.get("metrics"),
-                arguments.get("region", "us-east-1"),
-            )
-        elif name == "analyze_metric_correlation":
-            result = await db_assistant.analyze_metric_correlation(
-                arguments["csv_file"],
-                arguments.get("target_metric", "CPUUtilization"),
-                arguments.get("top_n", 10),
-            )
-        elif name == "detect_metric_outliers":
-            result = await db_assistant.detect_metric_outliers(
-                arguments["csv_file"], arguments.get("std_threshold", 3.0)
-            )
-        elif name == "perform_regression_analysis":
-            result = await db_assistant.perform_regression_analysis(
-                arguments["csv_file"],
-                arguments["predictor_metric"],
-                arguments.get("target_metric", "CPUUtilization"),
-            )
-        elif name == "list_data_files":
-            result = await db_assistant.list_data_files()
-        elif name == "validate_sql_file":
-            result = await db_assistant.validate_sql_file(
-                arguments["filename"], arguments.get("database_secret")
-            )
-        elif name == "copy_sql_to_directory":
-            result = await db_assistant.copy_sql_file(
-                arguments["source_path"], arguments.get("target_name")
-            )
-        elif name == "get_metric_summary":
-            result = await db_assistant.get_metric_summary(arguments["csv_file"])
-        elif name == "debug_cloudwatch_collection":
-            result = await db_assistant.debug_cloudwatch_collection(
-                arguments["database_secret"],
-                arguments["start_time"],
-                arguments["end_time"],
-            )
-        elif name == "collect_slow_queries":
-            result = await db_assistant.collect_slow_queries(
-                arguments["database_secret"],
-                arguments.get("start_time"),
-                arguments.get("end_time"),
-            )
-        elif name == "enable_slow_query_log_exports":
-            result = await db_assistant.enable_slow_query_log_exports(
-                arguments["cluster_identifier"]
-            )
-        elif name == "collect_cpu_intensive_queries":
-            result = await db_assistant.collect_cpu_intensive_queries(
-                arguments["database_secret"],
-                arguments.get("db_instance_identifier"),
-                arguments.get("start_time"),
-                arguments.get("end_time"),
-            )
-        elif name == "collect_temp_space_intensive_queries":
-            result = await db_assistant.collect_temp_space_intensive_queries(
-                arguments["database_secret"],
-                arguments.get("db_instance_identifier"),
-                arguments.get("start_time"),
-                arguments.get("end_time"),
-            )
-        elif name == "validate_schema_lambda":
-            validation_result = await db_assistant.validate_schema_lambda(
-                arguments["database_secret"],
-                arguments["database"],
-                arguments["ddl_content"],
-                arguments.get("region", "ap-northeast-2"),
-            )
-            # 결과를 문자열로 포맷팅
-            if validation_result.get('success'):
-                ddl_type = validation_result.get('ddl_type', 'UNKNOWN')
-                table_name = validation_result.get('table_name', 'N/A')
-                is_valid = validation_result.get('valid', False)
-                issues = validation_result.get('issues', [])
-                warnings = validation_result.get('warnings', [])
-                s3_location = validation_result.get('s3_location', '')
-
-                status = "✅ 검증 통과" if is_valid else "❌ 검증 실패"
-                result = f"{status}\n\n"
-                result += f"DDL 타입: {ddl_type}\n"
-                result += f"테이블 이름: {table_name}\n\n"
-
-                if issues:
-                    result += f"문제점 ({len(issues)}개):\n"
-                    for issue in issues:
-                        result += f"  - {issue}\n"
-                    result += "\n"
-
-                if warnings:
-                    result += f"경고 ({len(warnings)}개):\n"
-                    for warning in warnings:
-                        result += f"  - {warning}\n"
-                    result += "\n"
-
-                result += f"S3 저장 위치: {s3_location}"
-            else:
-                error_msg = validation_result.get('error', 'Unknown error')
-                result = f"❌ 스키마 검증 실패: {error_msg}"
-        elif name == "explain_query_lambda":
-            explain_result = await db_assistant.explain_query_lambda(
-                arguments["database_secret"],
-                arguments["database"],
-                arguments["query"],
-                arguments.get("region", "ap-northeast-2"),
-            )
-            # 결과를 문자열로 포맷팅
-            if explain_result.get('success'):
-                query = explain_result.get('query', '')
-                explain_data = explain_result.get('explain_data', [])
-                performance_issues = explain_result.get('performance_issues', [])
-                recommendations = explain_result.get('recommendations', [])
-                s3_location = explain_result.get('s3_location', '')
-
-                issue_count = explain_result.get('performance_issue_count', 0)
-                status = "✅ 성능 이슈 없음" if issue_count == 0 else f"⚠️ 성능 이슈 {issue_count}개 발견"
-
-                result = f"{status}\n\n"
-                result += f"쿼리: {query[:100]}...\n\n" if len(query) > 100 else f"쿼리: {query}\n\n"
-
-                if performance_issues:
-                    result += f"성능 이슈 ({len(performance_issues)}개):\n"
-                    for issue in performance_issues:
-                        result += f"  - {issue}\n"
-                    result += "\n"
-
-                if recommendations:
-                    result += f"개선 권장사항 ({len(recommendations)}개):\n"
-                    for rec in recommendations:
-                        result += f"  - {rec}\n"
-                    result += "\n"
-
-                result += f"S3 저장 위치: {s3_location}"
-            else:
-                error_msg = explain_result.get('error', 'Unknown error')
-                result = f"❌ EXPLAIN 분석 실패: {error_msg}"
-        elif name == "analyze_aurora_mysql_error_logs":
-            result = await db_assistant.analyze_aurora_mysql_error_logs(
-                arguments["keyword"],
-                arguments["start_datetime_str"],
-                arguments["end_datetime_str"],
-            )
-        elif name == "save_to_vector_store":
-            result = await db_assistant.save_to_vector_store(
-                arguments["content"],
-                arguments["topic"],
-                arguments.get("category", "examples"),
-                arguments.get("tags"),
-                arguments.get("force_save", False),
-                arguments.get("auto_summarize", True),
-            )
-        elif name == "update_vector_content":
-            result = await db_assistant.update_vector_content(
-                arguments["filename"],
-                arguments["new_content"],
-                arguments.get("update_mode", "append"),
-            )
-        elif name == "sync_knowledge_base":
-            result = await db_assistant.sync_knowledge_base()
-        elif name == "query_vector_store":
-            result = await db_assistant.query_vector_store(
-                arguments["query"], arguments.get("max_results", 5)
-            )
-        elif name == "test_individual_query_validation":
-            result = await db_assistant.test_individual_query_validation(
-                arguments["database_secret"], arguments["filename"]
-            )
-        elif name == "generate_consolidated_report":
-            result = await db_assistant.generate_consolidated_report(
-                arguments.get("keyword"),
-                arguments.get("report_files"),
-                arguments.get("date_filter"),
-                arguments.get("latest_count"),
-            )
-        elif name == "generate_comprehensive_performance_report":
-            result = await db_assistant.generate_comprehensive_performance_report(
-                arguments["database_secret"],
-                arguments["db_instance_identifier"],
-                arguments.get("region", "ap-northeast-2"),
-                arguments.get("hours", 24),
-            )
-        elif name == "generate_cluster_performance_report":
-            result = await db_assistant.generate_cluster_performance_report(
-                arguments["database_secret"],
-                arguments["db_cluster_identifier"],
-                arguments.get("hours", 24),
-                arguments.get("region", "ap-northeast-2"),
-            )
-        elif name == "set_default_region":
-            result = db_assistant.set_default_region(arguments["region_name"])
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             result = f"알 수 없는 도구: {name}"
+        else:
+            result = handler(arguments)
+            if inspect.isawaitable(result):
+                result = await result
 
         return [types.TextContent(type="text", text=result)]
 
@@ -9841,6 +9741,9 @@ async def main():
     except Exception as e:
         logger.error(f"서버 실행 오류: {e}")
         raise e
+    finally:
+        # 접속 대상별 풀이 미리 열어 둔 유휴 연결 정리
+        db_assistant.close_mysql_pools()
 
 
 if __name__ == "__main__":
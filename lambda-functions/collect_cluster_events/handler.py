@@ -4,6 +4,7 @@ Purpose: RDS API로 Aurora 클러스터 이벤트 수집 (클러스터 + 인스
 """
 
 import json
+import re
 import boto3
 import logging
 from datetime import datetime, timedelta
@@ -11,26 +12,28 @@ from datetime import datetime, timedelta
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# 심각도 판별 키워드 (이벤트마다 리스트를 만들어 순회하지 않고 모듈 로드 시 한 번만 컴파일)
+_HIGH_SEVERITY_RE = re.compile(r"failed|error|critical|fatal|crash|corruption")
+_MEDIUM_SEVERITY_RE = re.compile(r"warning|slow|timeout|retry|restart|reboot")
+
+# 리전별 RDS 클라이언트 캐시 - 웜 컨테이너 재호출 시 서비스 모델을 다시 로드하지 않도록 재사용
+_RDS_CLIENTS = {}
+
+def _get_rds_client(region):
+    """리전별 RDS 클라이언트를 한 번만 생성하여 재사용"""
+    client = _RDS_CLIENTS.get(region)
+    if client is None:
+        client = boto3.client('rds', region_name=region)
+        _RDS_CLIENTS[region] = client
+    return client
+
 def categorize_event_severity(message):
     """이벤트 메시지 기반 심각도 분류"""
     message_lower = message.lower()
 
-    if any(
-        keyword in message_lower
-        for keyword in [
-            "failed",
-            "error",
-            "critical",
-            "fatal",
-            "crash",
-            "corruption",
-        ]
-    ):
+    if _HIGH_SEVERITY_RE.search(message_lower):
         return "HIGH"
-    elif any(
-        keyword in message_lower
-        for keyword in ["warning", "slow", "timeout", "retry", "restart", "reboot"]
-    ):
+    elif _MEDIUM_SEVERITY_RE.search(message_lower):
         return "MEDIUM"
     else:
         return "LOW"
@@ -80,8 +83,8 @@ def lambda_handler(event, context):
 
         logger.info(f"클러스터 이벤트 수집 시작: {cluster_id} (리전: {region}, 기간: {hours}시간)")
 
-        # RDS 클라이언트 생성
-        rds_client = boto3.client('rds', region_name=region)
+        # RDS 클라이언트 (리전별 캐시 재사용)
+        rds_client = _get_rds_client(region)
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(hours=hours)
 
@@ -11,6 +11,19 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 
+# 리전별 RDS 클라이언트 캐시 - 웜 컨테이너 재호출 시 서비스 모델을 다시 로드하지 않도록 재사용
+_RDS_CLIENTS = {}
+
+
+def _get_rds_client(region):
+    """리전별 RDS 클라이언트를 한 번만 생성하여 재사용"""
+    client = _RDS_CLIENTS.get(region)
+    if client is None:
+        client = boto3.client('rds', region_name=region)
+        _RDS_CLIENTS[region] = client
+    return client
+
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     RDS 클러스터 또는 인스턴스 정보 조회
@@ -37,7 +50,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'body': json.dumps({'error': 'identifier가 필요합니다'})
             }
 
-        rds_client = boto3.client('rds', region_name=region)
+        rds_client = _get_rds_client(region)
 
         # 먼저 클러스터로 조회 시도
         try:
@@ -17,7 +17,8 @@ def lambda_handler(event, context):
     Parameters:
     - event: {
         "keyword": "gamedb",  # 검색 키워드 (optional)
-        "region": "ap-northeast-2"  # AWS 리전 (optional, 기본값: ap-northeast-2)
+        "region": "ap-northeast-2",  # AWS 리전 (optional, 기본값: ap-northeast-2)
+        "limit": 100  # 최대 반환 개수 (optional, 도달 시 페이지네이션 조기 종료)
       }
 
     Returns:
@@ -32,8 +33,9 @@ def lambda_handler(event, context):
         # 입력 파라미터
         keyword = event.get('keyword', '')
         region = event.get('region', 'ap-northeast-2')
+        limit = event.get('limit')
 
-        logger.info(f"Secret 목록 조회 시작 (키워드: '{keyword}', 리전: {region})")
+        logger.info(f"Secret 목록 조회 시작 (키워드: '{keyword}', 리전: {region}, 제한: {limit})")
 
         # Secrets Manager 클라이언트 생성
         client = boto3.client(
@@ -41,39 +43,26 @@ def lambda_handler(event, context):
             region_name=region
         )
 
-        all_secrets = []
-        next_token = None
+        keyword_lower = keyword.lower()
+        filtered_secrets = []
+        total_scanned = 0
 
-        # 페이지네이션 처리
-        while True:
-            if next_token:
-                response = client.list_secrets(NextToken=next_token)
-            else:
-                response = client.list_secrets()
+        # boto3 paginator로 페이지 순회 - 페이지 단위로 키워드 필터링하고 limit 도달 시 조기 종료
+        # (서버측 name 필터는 접두사 매칭이라 기존 부분 문자열 검색 결과와 달라지므로 사용하지 않음)
+        paginator = client.get_paginator('list_secrets')
+        for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+            for secret in page['SecretList']:
+                total_scanned += 1
+                name = secret['Name']
+                if not keyword or keyword_lower in name.lower():
+                    filtered_secrets.append(name)
 
-            # Secret 이름 추출
-            all_secrets.extend([
-                secret['Name']
-                for secret in response['SecretList']
-            ])
-
-            # 다음 페이지 확인
-            if 'NextToken' not in response:
+            if limit and len(filtered_secrets) >= limit:
+                filtered_secrets = filtered_secrets[:limit]
+                logger.info(f"제한 개수({limit}) 도달 - 페이지네이션 조기 종료")
                 break
-            next_token = response['NextToken']
-
-        logger.info(f"총 {len(all_secrets)}개의 Secret 발견")
 
-        # 키워드 필터링
-        if keyword:
-            filtered_secrets = [
-                secret
-                for secret in all_secrets
-                if keyword.lower() in secret.lower()
-            ]
-            logger.info(f"키워드 '{keyword}' 필터링 후: {len(filtered_secrets)}개")
-        else:
-            filtered_secrets = all_secrets
+        logger.info(f"{total_scanned}개 Secret 조회, 키워드 '{keyword}' 필터링 후: {len(filtered_secrets)}개")
 
         return {
             'statusCode': 200,
@@ -16,6 +16,57 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 S3_BUCKET = os.getenv('QUERY_RESULTS_BUCKET', 'db-assistant-query-results')
+# true이면 IF [NOT] EXISTS 구문도 테이블 존재 여부를 DB에서 확인 (기본: 방어적 구문은 조회 생략)
+STRICT_EXISTENCE_CHECK = os.getenv('STRICT_EXISTENCE_CHECK', 'false').lower() == 'true'
+
+# 웜 컨테이너에서 재사용할 DB 연결 {(host, port, user, database): (password, connection)}
+_connections = {}
+
+
+def get_connection(secret: Dict[str, Any], database: str):
+    """접속 대상별 DB 연결을 재사용 (웜 호출 시 MySQL 핸드셰이크 생략)
+
+    autocommit 연결이라 이전 호출의 REPEATABLE READ 스냅샷이 남지 않으므로
+    information_schema 조회는 항상 최신 상태를 본다. 비밀번호가 교체되면 기존 연결은 버린다.
+    """
+    key = (secret.get('host'), int(secret.get('port', 3306)), secret.get('username'), database)
+    password = secret.get('password')
+    cached = _connections.get(key)
+    if cached is not None:
+        cached_password, connection = cached
+        if cached_password != password:
+            logger.info("Secret 자격 증명이 변경되어 캐시된 DB 연결을 새로 만듭니다")
+            discard_connection(connection)
+        else:
+            try:
+                connection.ping(reconnect=True)
+                return connection
+            except Exception as e:
+                logger.warning(f"캐시된 DB 연결 재사용 실패, 새로 연결: {str(e)}")
+                discard_connection(connection)
+
+    connection = pymysql.connect(
+        host=key[0],
+        port=key[1],
+        user=key[2],
+        password=password,
+        database=database,
+        connect_timeout=10,
+        autocommit=True
+    )
+    _connections[key] = (password, connection)
+    return connection
+
+
+def discard_connection(connection) -> None:
+    """오류가 난 연결은 캐시에서 제거하고 닫는다"""
+    for key, (_, cached) in list(_connections.items()):
+        if cached is connection:
+            del _connections[key]
+    try:
+        connection.close()
+    except Exception:
+        pass
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -60,24 +111,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         logger.info(f"DDL 검증 시작: {database_secret}/{database}")
 
-        # DDL 타입 분석
-        ddl_type = detect_ddl_type(ddl_content)
-        logger.info(f"DDL 타입: {ddl_type}")
+        # DDL 타입 분석 (마이그레이션 스크립트처럼 여러 타입이 섞인 경우 모두 검증)
+        ddl_types = detect_ddl_types(ddl_content)
+        ddl_type = ddl_types[0]
+        logger.info(f"DDL 타입: {', '.join(ddl_types)}")
 
         # Secrets Manager에서 DB 접속 정보 가져오기
         secrets_client = boto3.client('secretsmanager', region_name=region)
         secret_response = secrets_client.get_secret_value(SecretId=database_secret)
         secret = json.loads(secret_response['SecretString'])
 
-        # DB 연결
-        connection = pymysql.connect(
-            host=secret.get('host'),
-            port=int(secret.get('port', 3306)),
-            user=secret.get('username'),
-            password=secret.get('password'),
-            database=database,
-            connect_timeout=10
-        )
+        # DB 연결 (웜 컨테이너에서는 이전 호출의 연결 재사용)
+        connection = get_connection(secret, database)
 
         cursor = connection.cursor()
         logger.info("DB 연결 성공")
@@ -87,24 +132,20 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'success': True,
             'valid': True,
             'ddl_type': ddl_type,
+            'ddl_types': ddl_types,
             'issues': [],
             'warnings': [],
             'validated_at': datetime.utcnow().isoformat()
         }
 
-        if ddl_type == 'CREATE_TABLE':
-            validate_create_table(cursor, ddl_content, result)
-        elif ddl_type == 'ALTER_TABLE':
-            validate_alter_table(cursor, ddl_content, result)
-        elif ddl_type == 'DROP_TABLE':
-            validate_drop_table(cursor, ddl_content, result)
-        elif ddl_type == 'CREATE_INDEX':
-            validate_create_index(cursor, ddl_content, result)
-        else:
+        # 첫 번째 구문의 타입만 검증하던 방식 대신, 파일에 포함된 DDL 타입별 검증을 모두 수행
+        supported_types = [t for t in ddl_types if t in DDL_VALIDATORS]
+        for current_type in supported_types:
+            DDL_VALIDATORS[current_type](cursor, ddl_content, result)
+        if not supported_types:
             result['warnings'].append(f"검증 미지원 DDL 타입: {ddl_type}")
 
         cursor.close()
-        connection.close()
 
         logger.info(f"검증 완료: valid={result['valid']}, issues={len(result['issues'])}")
 
@@ -137,10 +178,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         logger.error(f"DDL 검증 실패: {str(e)}", exc_info=True)
 
         if connection:
-            try:
-                connection.close()
-            except:
-                pass
+            discard_connection(connection)
 
         return {
             'statusCode': 500,
@@ -151,103 +189,263 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
 
 
+# 첫 키워드별 (접두사, DDL 타입) 후보 - 긴 접두사를 먼저 검사
+_DDL_PREFIXES_BY_KEYWORD = {
+    'CREATE': (
+        ('CREATE TABLE', 'CREATE_TABLE'),
+        ('CREATE INDEX', 'CREATE_INDEX'),
+        ('CREATE UNIQUE INDEX', 'CREATE_INDEX'),
+    ),
+    'ALTER': (('ALTER TABLE', 'ALTER_TABLE'),),
+    'DROP': (
+        ('DROP TABLE', 'DROP_TABLE'),
+        ('DROP INDEX', 'DROP_INDEX'),
+    ),
+}
+# 가장 긴 접두사('CREATE UNIQUE INDEX')까지만 대문자 변환
+_DDL_HEAD_LENGTH = 19
+
+
 def detect_ddl_type(ddl_content: str) -> str:
-    """DDL 타입 감지"""
-    ddl_upper = ddl_content.strip().upper()
-
-    if ddl_upper.startswith('CREATE TABLE'):
-        return 'CREATE_TABLE'
-    elif ddl_upper.startswith('ALTER TABLE'):
-        return 'ALTER_TABLE'
-    elif ddl_upper.startswith('DROP TABLE'):
-        return 'DROP_TABLE'
-    elif ddl_upper.startswith('CREATE INDEX') or ddl_upper.startswith('CREATE UNIQUE INDEX'):
-        return 'CREATE_INDEX'
-    elif ddl_upper.startswith('DROP INDEX'):
-        return 'DROP_INDEX'
-    else:
-        return 'UNKNOWN'
+    """DDL 타입 감지 (전체 내용 대신 앞부분만 대문자 변환 후 첫 키워드로 분기)"""
+    head = ddl_content.lstrip()[:_DDL_HEAD_LENGTH].upper()
+    keyword = head.split(' ', 1)[0]
+
+    for prefix, ddl_type in _DDL_PREFIXES_BY_KEYWORD.get(keyword, ()):
+        if head.startswith(prefix):
+            return ddl_type
+    return 'UNKNOWN'
+
+
+def detect_ddl_types(ddl_content: str) -> List[str]:
+    """파일 내 구문별 DDL 타입을 등장 순서대로 중복 없이 반환 (구문이 없으면 전체 내용 기준)"""
+    statements = [stmt for stmt in ddl_content.split(';') if stmt.strip()]
+    ddl_types = list(dict.fromkeys(detect_ddl_type(stmt) for stmt in statements))
+    return ddl_types or [detect_ddl_type(ddl_content)]
+
+
+def tables_created_in_file(ddl_content: str) -> set:
+    """같은 파일에서 CREATE TABLE로 생성되는 테이블 이름 집합 (소문자)"""
+    return {
+        name.lower()
+        for name in re.findall(
+            r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?', ddl_content, re.IGNORECASE
+        )
+    }
+
+
+def fetch_existing_tables(cursor, table_names: List[str]) -> set:
+    """현재 데이터베이스에 존재하는 테이블을 한 번의 information_schema 조회로 확인
+
+    Returns:
+        존재하는 테이블 이름 집합 (소문자)
+    """
+    unique_names = sorted({name.lower() for name in table_names if name})
+    if not unique_names:
+        return set()
+
+    placeholders = ', '.join(['%s'] * len(unique_names))
+    cursor.execute(
+        "SELECT LOWER(table_name) FROM information_schema.tables "
+        f"WHERE table_schema = DATABASE() AND LOWER(table_name) IN ({placeholders})",
+        unique_names
+    )
+    return {row[0] for row in cursor.fetchall()}
 
 
 def validate_create_table(cursor, ddl_content: str, result: Dict):
     """CREATE TABLE 검증"""
     # 테이블 이름 추출
-    match = re.search(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?', ddl_content, re.IGNORECASE)
+    match = re.search(r'CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?', ddl_content, re.IGNORECASE)
     if not match:
         result['valid'] = False
         result['issues'].append("테이블 이름을 파싱할 수 없음")
         return
 
-    table_name = match.group(1)
-    result['table_name'] = table_name
-
-    # 테이블 존재 여부 확인
-    cursor.execute("SHOW TABLES LIKE %s", (table_name,))
-    if cursor.fetchone():
-        result['warnings'].append(f"테이블 '{table_name}'이 이미 존재함 (IF NOT EXISTS 사용 권장)")
+    table_name = match.group(2)
+    result.setdefault('table_name', table_name)
+    # IF NOT EXISTS가 있으면 "이미 존재함" 경고는 의미가 없으므로 테이블 존재 여부 조회 생략
+    check_table = STRICT_EXISTENCE_CHECK or not match.group(1)
 
-    # 외래 키 검증
+    # 외래 키 참조 테이블 추출
     fk_pattern = r'FOREIGN\s+KEY\s+\([^)]+\)\s+REFERENCES\s+`?(\w+)`?'
     foreign_keys = re.findall(fk_pattern, ddl_content, re.IGNORECASE)
 
+    lookup_tables = ([table_name] if check_table else []) + foreign_keys
+    if not lookup_tables:
+        return
+
+    # 생성 대상 테이블과 모든 참조 테이블의 존재 여부를 한 번의 쿼리로 확인
+    existing_tables = fetch_existing_tables(cursor, lookup_tables)
+
+    # 테이블 존재 여부 확인 (같은 파일에서 먼저 DROP TABLE 하는 경우는 제외)
+    dropped_tables = {
+        name.lower()
+        for name in re.findall(r'DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?`?(\w+)`?', ddl_content, re.IGNORECASE)
+    }
+    if check_table and table_name.lower() in existing_tables and table_name.lower() not in dropped_tables:
+        result['warnings'].append(f"테이블 '{table_name}'이 이미 존재함 (IF NOT EXISTS 사용 권장)")
+
+    # 외래 키 검증
     for ref_table in foreign_keys:
-        cursor.execute("SHOW TABLES LIKE %s", (ref_table,))
-        if not cursor.fetchone():
+        if ref_table.lower() not in existing_tables:
             result['valid'] = False
             result['issues'].append(f"외래 키 참조 테이블 '{ref_table}'이 존재하지 않음")
 
 
 def validate_alter_table(cursor, ddl_content: str, result: Dict):
     """ALTER TABLE 검증"""
-    # 테이블 이름 추출
-    match = re.search(r'ALTER\s+TABLE\s+`?(\w+)`?', ddl_content, re.IGNORECASE)
-    if not match:
+    # 파일 내 모든 ALTER TABLE 대상 테이블 추출 (구문 순서 유지, 중복 제거)
+    table_names = list(dict.fromkeys(
+        re.findall(r'ALTER\s+TABLE\s+`?(\w+)`?', ddl_content, re.IGNORECASE)
+    ))
+    if not table_names:
         result['valid'] = False
         result['issues'].append("테이블 이름을 파싱할 수 없음")
         return
 
-    table_name = match.group(1)
-    result['table_name'] = table_name
+    result.setdefault('table_name', table_names[0])
 
-    # 테이블 존재 여부 확인
-    cursor.execute("SHOW TABLES LIKE %s", (table_name,))
-    if not cursor.fetchone():
-        result['valid'] = False
-        result['issues'].append(f"테이블 '{table_name}'이 존재하지 않음")
+    # 대상 테이블 존재 여부를 구문별 조회 대신 한 번의 쿼리로 확인 (같은 파일에서 생성되는 테이블 포함)
+    existing_tables = fetch_existing_tables(cursor, table_names) | tables_created_in_file(ddl_content)
+    for table_name in table_names:
+        if table_name.lower() not in existing_tables:
+            result['valid'] = False
+            result['issues'].append(f"테이블 '{table_name}'이 존재하지 않음")
 
 
 def validate_drop_table(cursor, ddl_content: str, result: Dict):
     """DROP TABLE 검증"""
-    # 테이블 이름 추출
-    match = re.search(r'DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?`?(\w+)`?', ddl_content, re.IGNORECASE)
-    if not match:
+    # 파일 내 모든 DROP TABLE 대상 테이블 추출 (구문 순서 유지, 중복 제거)
+    drop_matches = re.findall(r'DROP\s+TABLE\s+(IF\s+EXISTS\s+)?`?(\w+)`?', ddl_content, re.IGNORECASE)
+    table_names = list(dict.fromkeys(table_name for _, table_name in drop_matches))
+    if not table_names:
         result['valid'] = False
         result['issues'].append("테이블 이름을 파싱할 수 없음")
         return
 
-    table_name = match.group(1)
-    result['table_name'] = table_name
+    result.setdefault('table_name', table_names[0])
 
-    # 테이블 존재 여부 확인
-    cursor.execute("SHOW TABLES LIKE %s", (table_name,))
-    if not cursor.fetchone():
-        result['warnings'].append(f"테이블 '{table_name}'이 존재하지 않음 (IF EXISTS 사용 권장)")
+    # IF EXISTS로 방어된 DROP은 존재하지 않아도 오류가 아니므로 조회 대상에서 제외
+    check_names = list(dict.fromkeys(
+        table_name for if_exists, table_name in drop_matches
+        if STRICT_EXISTENCE_CHECK or not if_exists
+    ))
+    if not check_names:
+        return
+
+    # 테이블 존재 여부를 구문별 SHOW TABLES LIKE 대신 한 번의 쿼리로 확인 (같은 파일에서 생성되는 테이블 포함)
+    existing_tables = fetch_existing_tables(cursor, check_names) | tables_created_in_file(ddl_content)
+    for table_name in check_names:
+        if table_name.lower() not in existing_tables:
+            result['warnings'].append(f"테이블 '{table_name}'이 존재하지 않음 (IF EXISTS 사용 권장)")
+
+
+def fetch_existing_columns(cursor, table_names: List[str]) -> Dict[str, set]:
+    """테이블별 컬럼 이름을 한 번의 information_schema 조회로 가져옴 (소문자 변환은 SQL에서 수행)
+
+    Returns:
+        {테이블 이름(소문자): 컬럼 이름 집합(소문자)}
+    """
+    unique_names = sorted({name.lower() for name in table_names if name})
+    if not unique_names:
+        return {}
+
+    placeholders = ', '.join(['%s'] * len(unique_names))
+    cursor.execute(
+        "SELECT LOWER(table_name), LOWER(column_name) FROM information_schema.columns "
+        f"WHERE table_schema = DATABASE() AND LOWER(table_name) IN ({placeholders})",
+        unique_names
+    )
+    columns_by_table = {}
+    for table_name, column_name in cursor.fetchall():
+        columns_by_table.setdefault(table_name, set()).add(column_name)
+    return columns_by_table
+
+
+def split_index_columns(ddl_content: str, start: int) -> List[str]:
+    """start 위치의 괄호로 감싼 인덱스 컬럼 목록을 최상위 쉼표 기준으로 분리 (괄호가 없으면 빈 목록)"""
+    if not ddl_content.startswith('(', start):
+        return []
+
+    parts = []
+    depth = 0
+    part_start = start + 1
+    for pos in range(start, len(ddl_content)):
+        char = ddl_content[pos]
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                parts.append(ddl_content[part_start:pos])
+                return parts
+        elif char == ',' and depth == 1:
+            parts.append(ddl_content[part_start:pos])
+            part_start = pos + 1
+    return parts
 
 
 def validate_create_index(cursor, ddl_content: str, result: Dict):
     """CREATE INDEX 검증"""
-    # 테이블 이름 추출
-    match = re.search(r'ON\s+`?(\w+)`?', ddl_content, re.IGNORECASE)
-    if not match:
+    # 파일 내 모든 CREATE INDEX 구문의 (대상 테이블, 컬럼 목록) 추출
+    index_matches = [
+        (match.group(1), split_index_columns(ddl_content, match.end()))
+        for match in re.finditer(
+            r'CREATE\s+(?:UNIQUE\s+|FULLTEXT\s+|SPATIAL\s+)?INDEX\s+`?\w+`?\s+ON\s+`?(\w+)`?\s*',
+            ddl_content, re.IGNORECASE
+        )
+    ]
+    # 구문 순서 유지, 중복 제거
+    table_names = list(dict.fromkeys(table_name for table_name, _ in index_matches))
+    if not table_names:
+        # 기존 방식: 첫 번째 ON 절의 테이블
+        match = re.search(r'ON\s+`?(\w+)`?', ddl_content, re.IGNORECASE)
+        table_names = [match.group(1)] if match else []
+    if not table_names:
         result['valid'] = False
         result['issues'].append("테이블 이름을 파싱할 수 없음")
         return
 
-    table_name = match.group(1)
-    result['table_name'] = table_name
+    result.setdefault('table_name', table_names[0])
 
-    # 테이블 존재 여부 확인
-    cursor.execute("SHOW TABLES LIKE %s", (table_name,))
-    if not cursor.fetchone():
-        result['valid'] = False
-        result['issues'].append(f"테이블 '{table_name}'이 존재하지 않음")
+    # 테이블 존재 여부를 구문별 SHOW TABLES LIKE 대신 한 번의 쿼리로 확인 (같은 파일에서 생성되는 테이블 포함)
+    existing_tables = fetch_existing_tables(cursor, table_names) | tables_created_in_file(ddl_content)
+    for table_name in table_names:
+        if table_name.lower() not in existing_tables:
+            result['valid'] = False
+            result['issues'].append(f"테이블 '{table_name}'이 존재하지 않음")
+
+    # 인덱스 컬럼 존재 여부 확인 (DB에 이미 있는 테이블만, 컬럼 이름은 구문별로 한 번만 소문자 변환)
+    # {테이블 이름(소문자): (원래 테이블 이름, {컬럼 이름(소문자): 원래 컬럼 이름})}
+    index_columns = {}
+    for table_name, column_list in index_matches:
+        _, columns = index_columns.setdefault(table_name.lower(), (table_name, {}))
+        for part in column_list:
+            column_match = re.match(r'\s*`?(\w+)`?', part)
+            if column_match:  # 함수 기반 인덱스 등 컬럼 이름이 아닌 항목은 제외
+                columns.setdefault(column_match.group(1).lower(), column_match.group(1))
+
+    if not any(columns for _, columns in index_columns.values()):
+        return
+
+    columns_by_table = fetch_existing_columns(cursor, list(index_columns))
+    for table_lc, (table_name, columns) in index_columns.items():
+        existing_columns = columns_by_table.get(table_lc)
+        if existing_columns is None:
+            continue
+        # 컬럼별 반복 검사 대신 집합 차로 누락 컬럼을 한 번에 계산 (보고 순서는 구문 순서 유지)
+        missing = columns.keys() - existing_columns
+        for column_lc, column in columns.items():
+            if column_lc in missing:
+                # 같은 파일의 ALTER TABLE로 추가되는 컬럼일 수 있으므로 경고로만 보고
+                result['warnings'].append(f"인덱스 컬럼 '{column}'이 테이블 '{table_name}'에 존재하지 않음")
+
+
+# DDL 타입별 검증 함수
+DDL_VALIDATORS = {
+    'CREATE_TABLE': validate_create_table,
+    'ALTER_TABLE': validate_alter_table,
+    'DROP_TABLE': validate_drop_table,
+    'CREATE_INDEX': validate_create_index,
+}
@@ -19,6 +19,21 @@ from .interfaces import ErrorAnalyzerInterface
 
 logger = logging.getLogger(__name__)
 
+# 로그 라인 포맷 (라인마다 패턴 문자열을 다시 조회하지 않도록 모듈 로드 시 컴파일)
+# MySQL/Aurora 로그 포맷: 2025-10-20 23:00:00 [ERROR] Message
+_LOG_LINE_RE = re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+\[(\w+)\]\s+(.+)')
+# 간단한 포맷: ERROR: Message
+_SIMPLE_LOG_LINE_RE = re.compile(r'(\w+):\s+(.+)')
+
+_KNOWN_LOG_LEVELS = frozenset({"ERROR", "WARNING", "INFO", "CRITICAL"})
+_ERROR_LOG_LEVELS = frozenset({"ERROR", "CRITICAL"})
+
+# 심각도 키워드 (우선순위 순: critical → high) - 키워드 리스트 순회 대신 정규식 한 번으로 검색
+_SEVERITY_KEYWORD_RES = (
+    ("critical", re.compile(r"crash|fatal|corruption|data loss")),
+    ("high", re.compile(r"deadlock|out of memory|replication")),
+)
+
 
 class ErrorAnalyzer(ErrorAnalyzerInterface):
     """에러 로그 분석 클래스"""
@@ -34,6 +49,26 @@ class ErrorAnalyzer(ErrorAnalyzerInterface):
             "resource": ["out of memory", "disk full", "too many connections"],
             "replication": ["replication", "slave", "binlog"],
         }
+        self._build_category_index()
+
+    def _build_category_index(self) -> None:
+        """키워드 → 카테고리 역색인과 단일 스캔용 정규식 생성
+
+        error_categories 선언 순서가 곧 우선순위이므로, 키워드별 순위를 함께 저장해
+        메시지 내 매칭 중 가장 우선순위가 높은 카테고리를 고른다.
+        """
+        self._keyword_category = {}
+        self._keyword_rank = {}
+        for rank, (category, keywords) in enumerate(self.error_categories.items()):
+            for keyword in keywords:
+                self._keyword_category.setdefault(keyword, category)
+                self._keyword_rank.setdefault(keyword, rank)
+
+        # 우선순위 순으로 정렬한 대안 + lookahead: 겹치는 키워드(예: "lock wait timeout"의 "timeout")도 모두 검사
+        ordered = sorted(self._keyword_rank, key=self._keyword_rank.__getitem__)
+        self._category_keyword_re = re.compile(
+            "(?=(" + "|".join(re.escape(keyword) for keyword in ordered) + "))"
+        )
 
     def analyze_logs(
         self,
@@ -62,7 +97,7 @@ class ErrorAnalyzer(ErrorAnalyzerInterface):
             log_entries = self._filter_by_time(log_entries, start_time, end_time)
 
         # 에러만 추출
-        error_entries = [e for e in log_entries if e.level in ["ERROR", "CRITICAL"]]
+        error_entries = [e for e in log_entries if e.level in _ERROR_LOG_LEVELS]
 
         # 패턴 추출
         patterns = self.extract_patterns(error_entries)
@@ -157,8 +192,7 @@ class ErrorAnalyzer(ErrorAnalyzerInterface):
     def _parse_log_line(self, line: str) -> Optional[ErrorLogEntry]:
         """개별 로그 라인 파싱"""
         # MySQL/Aurora 로그 포맷: 2025-10-20 23:00:00 [ERROR] Message
-        pattern = r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s+\[(\w+)\]\s+(.+)'
-        match = re.match(pattern, line)
+        match = _LOG_LINE_RE.match(line)
 
         if match:
             timestamp_str, level, message = match.groups()
@@ -174,14 +208,14 @@ class ErrorAnalyzer(ErrorAnalyzerInterface):
 
         # 다른 포맷도 시도
         # 간단한 포맷: ERROR: Message
-        simple_pattern = r'(\w+):\s+(.+)'
-        match = re.match(simple_pattern, line)
+        match = _SIMPLE_LOG_LINE_RE.match(line)
         if match:
             level, message = match.groups()
-            if level.upper() in ["ERROR", "WARNING", "INFO", "CRITICAL"]:
+            level = level.upper()
+            if level in _KNOWN_LOG_LEVELS:
                 return ErrorLogEntry(
                     timestamp=datetime.now(),
-                    level=level.upper(),
+                    level=level,
                     message=message.strip()
                 )
 
@@ -193,16 +227,12 @@ class ErrorAnalyzer(ErrorAnalyzerInterface):
         start_time: Optional[datetime],
         end_time: Optional[datetime]
     ) -> List[ErrorLogEntry]:
-        """시간 범위로 필터링"""
-        filtered = entries
-
-        if start_time:
-            filtered = [e for e in filtered if e.timestamp >= start_time]
-
-        if end_time:
-            filtered = [e for e in filtered if e.timestamp <= end_time]
-
-        return filtered
+        """시간 범위로 필터링 (시작/종료 조건을 한 번의 순회로 적용)"""
+        return [
+            e for e in entries
+            if (not start_time or e.timestamp >= start_time)
+            and (not end_time or e.timestamp <= end_time)
+        ]
 
     def _extract_pattern_from_message(self, message: str) -> str:
         """
@@ -233,26 +263,28 @@ class ErrorAnalyzer(ErrorAnalyzerInterface):
         """에러 메시지를 카테고리로 분류"""
         message_lower = message.lower()
 
-        for category, keywords in self.error_categories.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    return category
+        # 카테고리×키워드 이중 루프 대신 한 번의 스캔 + 역색인 조회
+        best_rank = None
+        best_category = "other"
+        for match in self._category_keyword_re.finditer(message_lower):
+            keyword = match.group(1)
+            rank = self._keyword_rank[keyword]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                best_category = self._keyword_category[keyword]
+                if rank == 0:
+                    break
 
-        return "other"
+        return best_category
 
     def _determine_severity(self, pattern: str, occurrences: int) -> str:
         """심각도 결정"""
         pattern_lower = pattern.lower()
 
-        # 크리티컬 키워드
-        critical_keywords = ["crash", "fatal", "corruption", "data loss"]
-        if any(keyword in pattern_lower for keyword in critical_keywords):
-            return "critical"
-
-        # 높음 키워드
-        high_keywords = ["deadlock", "out of memory", "replication"]
-        if any(keyword in pattern_lower for keyword in high_keywords):
-            return "high"
+        # 키워드 기반 (크리티컬 → 높음 순으로 먼저 매칭되는 심각도 사용)
+        for severity, keyword_re in _SEVERITY_KEYWORD_RES:
+            if keyword_re.search(pattern_lower):
+                return severity
 
         # 발생 빈도 기반
         if occurrences > 100:
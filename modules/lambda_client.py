@@ -5,6 +5,7 @@ Lambda 함수 호출 전용 모듈
 RDS/CloudWatch API 호출을 Lambda로 오프로드하여 원본 서버는 복잡한 분석 로직에만 집중
 """
 
+import asyncio
 import json
 import logging
 import boto3
@@ -66,7 +67,9 @@ class LambdaClient:
             full_name = f"db-assistant-{function_name}-dev"
             logger.info(f"Lambda 호출: {full_name}")
 
-            response = self.lambda_client.invoke(
+            # boto3 invoke는 블로킹 호출이므로 스레드에서 실행 (동시 호출 시 이벤트 루프 비차단)
+            response = await asyncio.to_thread(
+                self.lambda_client.invoke,
                 FunctionName=full_name,
                 InvocationType='RequestResponse',
                 Payload=json.dumps(payload)
@@ -74,17 +77,17 @@ class LambdaClient:
 
             result = json.loads(response['Payload'].read())
 
-            # 상세 로깅: result 타입 확인
-            logger.debug(f"Lambda result 타입: {type(result)}")
-            logger.debug(f"Lambda result 내용: {str(result)[:500]}")
+            # 상세 로깅: result 타입 확인 (DEBUG 비활성 시 포맷 생략)
+            logger.debug("Lambda result 타입: %s", type(result))
+            logger.debug("Lambda result 내용: %.500s", result)
 
             if response['StatusCode'] == 200 and result.get('statusCode') == 200:
                 body = result.get('body', '{}')
-                logger.debug(f"Lambda body 타입 (파싱 전): {type(body)}")
+                logger.debug("Lambda body 타입 (파싱 전): %s", type(body))
 
                 if isinstance(body, str):
                     body = json.loads(body)
-                    logger.debug(f"Lambda body 타입 (파싱 후): {type(body)}")
+                    logger.debug("Lambda body 타입 (파싱 후): %s", type(body))
 
                 # body가 딕셔너리가 아닌 경우 처리
                 if not isinstance(body, dict):
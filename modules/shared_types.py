@@ -104,6 +104,42 @@ class TableInfo:
     row_count: Optional[int] = None
 
 
+@dataclass(slots=True)
+class ColumnMeta:
+    """스키마 캐시용 컬럼 메타데이터 (__slots__로 컬럼별 dict 오버헤드 제거)"""
+    name: str
+    data_type: str
+    max_length: Optional[int] = None
+    precision: Optional[int] = None
+    scale: Optional[int] = None
+    is_nullable: Optional[str] = None
+    default_value: Optional[Any] = None
+
+    def __post_init__(self):
+        """길이/정밀도/스케일을 한 번만 int | None으로 정규화 (드라이버별 Decimal 등 반환 대비)"""
+        if self.max_length is not None:
+            self.max_length = int(self.max_length)
+        if self.precision is not None:
+            self.precision = int(self.precision)
+        if self.scale is not None:
+            self.scale = int(self.scale)
+
+    def __getitem__(self, key: str) -> Any:
+        """기존 dict 형태 접근(column["data_type"]) 호환"""
+        return getattr(self, key)
+
+
+@dataclass(slots=True)
+class IndexMeta:
+    """스키마 캐시용 인덱스 메타데이터"""
+    columns: List[str] = field(default_factory=list)
+    unique: bool = False
+
+    def __getitem__(self, key: str) -> Any:
+        """기존 dict 형태 접근(index["columns"]) 호환"""
+        return getattr(self, key)
+
+
 @dataclass
 class SQLValidationResult:
     """SQL 검증 결과"""
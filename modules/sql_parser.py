@@ -4,35 +4,192 @@ SQL Parser Module
 SQL 파싱 및 타입 추출 전용 모듈
 """
 
+import hashlib
 import re
 import sys
 import logging
-from typing import List, Dict, Any
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Sequence
+
+try:
+    import sqlparse
+except ImportError:
+    sqlparse = None
 
 logger = logging.getLogger(__name__)
 
+# 파싱용 정규식은 모듈 로드 시 한 번만 컴파일하여 재사용
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_ALTER_TABLE_KEYWORD_RE = re.compile(r"\bALTER\s+TABLE\b")
+_RENAME_TABLE_KEYWORD_RE = re.compile(r"\bRENAME\s+TABLE\b")
+
+# extract_ddl_type 구문 분류용 접두사 테이블 (기존 elif 체인 순서 유지)
+# ALTER TABLE 키워드 검색은 CREATE INDEX 이전, RENAME TABLE 키워드 검색은 마지막에 수행
+_LEADING_STATEMENT_PREFIXES = (
+    ("SELECT", "SELECT"),
+    ("INSERT", "INSERT"),
+    ("UPDATE", "UPDATE"),
+    ("DELETE", "DELETE"),
+    ("CREATE TABLE", "CREATE_TABLE"),
+    ("ALTER TABLE", "ALTER_TABLE"),
+)
+_TRAILING_STATEMENT_PREFIXES = (
+    ("CREATE INDEX", "CREATE_INDEX"),
+    ("DROP TABLE", "DROP_TABLE"),
+    ("DROP INDEX", "DROP_INDEX"),
+    ("RENAME TABLE", "RENAME"),
+)
+_LEADING_PREFIX_TUPLE = tuple(prefix for prefix, _ in _LEADING_STATEMENT_PREFIXES)
+_TRAILING_PREFIX_TUPLE = tuple(prefix for prefix, _ in _TRAILING_STATEMENT_PREFIXES)
+
+
+def _classify_statement(stmt_clean: str):
+    """대문자로 정리된 구문의 타입 반환 (해당 없으면 None)"""
+    # startswith(tuple)로 한 번에 걸러낸 뒤 일치한 접두사만 확인
+    if stmt_clean.startswith(_LEADING_PREFIX_TUPLE):
+        for prefix, stmt_type in _LEADING_STATEMENT_PREFIXES:
+            if stmt_clean.startswith(prefix):
+                return stmt_type
+    if _ALTER_TABLE_KEYWORD_RE.search(stmt_clean):
+        return "ALTER_TABLE"
+    if stmt_clean.startswith(_TRAILING_PREFIX_TUPLE):
+        for prefix, stmt_type in _TRAILING_STATEMENT_PREFIXES:
+            if stmt_clean.startswith(prefix):
+                return stmt_type
+    if _RENAME_TABLE_KEYWORD_RE.search(stmt_clean):
+        return "RENAME"
+    return None
+
+
+_STATEMENT_CREATE_TABLE_RE = re.compile(
+    r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?\s*\(", re.IGNORECASE
+)
+_STATEMENT_CREATE_INDEX_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+`?(\w+)`?\s+ON\s+`?(\w+)`?\s*\(\s*`?(\w+)`?",
+    re.IGNORECASE,
+)
+
+_ALTER_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), alter_type)
+    for pattern, alter_type in (
+        # ADD COLUMN
+        (
+            r"ALTER\s+TABLE\s+`?(\w+)`?\s+ADD\s+(?:COLUMN\s+)?`?(\w+)`?\s+([^,;]+)",
+            "ADD_COLUMN",
+        ),
+        # DROP COLUMN
+        (
+            r"ALTER\s+TABLE\s+`?(\w+)`?\s+DROP\s+(?:COLUMN\s+)?`?(\w+)`?",
+            "DROP_COLUMN",
+        ),
+        # MODIFY COLUMN
+        (
+            r"ALTER\s+TABLE\s+`?(\w+)`?\s+MODIFY\s+(?:COLUMN\s+)?`?(\w+)`?\s+([^,;]+)",
+            "MODIFY_COLUMN",
+        ),
+        # CHANGE COLUMN
+        (
+            r"ALTER\s+TABLE\s+`?(\w+)`?\s+CHANGE\s+(?:COLUMN\s+)?`?(\w+)`?\s+`?(\w+)`?\s+([^,;]+)",
+            "CHANGE_COLUMN",
+        ),
+    )
+]
+# ALTER TABLE 구문 시작 위치 (각 ALTER 패턴은 이 위치에서만 매칭 시도)
+_ALTER_TABLE_ANCHOR_RE = re.compile(r"ALTER\s+TABLE\s+", re.IGNORECASE)
+_CREATE_INDEX_RE = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+`?(\w+)`?\s+ON\s+`?(\w+)`?\s*\(([^)]+)\)",
+    re.IGNORECASE,
+)
+_DROP_TABLE_RE = re.compile(
+    r"DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?`?(\w+)`?", re.IGNORECASE
+)
+_DROP_INDEX_RE = re.compile(r"DROP\s+INDEX\s+`?(\w+)`?\s+ON\s+`?(\w+)`?", re.IGNORECASE)
+
+_CONSTRAINT_LINE_RE = re.compile(
+    r"(?:CONSTRAINT|PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|INDEX|KEY)", re.IGNORECASE
+)
+_FOREIGN_KEY_RE = re.compile(
+    r"FOREIGN\s+KEY\s*\(`?(\w+)`?\)\s*REFERENCES\s+`?(\w+)`?\s*\(`?(\w+)`?\)",
+    re.IGNORECASE,
+)
+# 동일 SQL 내용의 반복 파싱을 피하기 위한 결과 캐시 크기 (LRU)
+_PARSE_CACHE_SIZE = 256
+
+# 데이터 타입은 DECIMAL(10,2), ENUM('a','b')처럼 괄호 안의 콤마까지 포함하여 캡처
+_COLUMN_DEFINITION_RE = re.compile(
+    r"`?(\w+)`?\s+([^\s(]+(?:\([^)]*\)?)?)(?:\s+(.*))?", re.IGNORECASE
+)
+# 컬럼 정의 블록 토큰 (따옴표 문자열 / 괄호 / 콤마 / 그 외 연속 문자)
+_COLUMN_DEF_TOKEN_RE = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|[(),'\"]|[^(),'\"]+"
+)
+
+
+def _split_top_level_commas(text: str, start: int = 0):
+    """
+    괄호 깊이와 따옴표를 고려하여 최상위 콤마 기준으로만 분리 (한 번의 토큰 스캔)
+
+    start 위치부터 스캔하며, 짝이 없는 닫는 괄호를 만나면 블록 끝으로 보고 멈춘다.
+
+    Returns:
+        (분리된 조각 목록, 블록 끝 위치) 튜플
+    """
+    parts = []
+    buf = []
+    depth = 0
+    end = len(text)
+    for match in _COLUMN_DEF_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token == ",":
+            if depth == 0:
+                parts.append("".join(buf))
+                buf = []
+                continue
+        elif token == "(":
+            depth += 1
+        elif token == ")":
+            if depth == 0:
+                end = match.start()
+                break
+            depth -= 1
+        buf.append(token)
+    parts.append("".join(buf))
+    return parts, end
+
 
 class SQLParser:
     """SQL 파싱 클래스"""
 
     def __init__(self):
         """SQLParser 초기화"""
+        # {(파싱 종류, 내용 해시): 결과} - 같은 SQL을 여러 번 검증할 때 재파싱 방지
+        self._parse_cache = OrderedDict()
         logger.info("SQLParser 초기화 완료")
 
+    def _cached_parse(self, kind: str, content: str, parse_func):
+        """내용 해시 기준 LRU 캐시로 파싱 결과 재사용"""
+        key = (kind, hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest())
+        if key in self._parse_cache:
+            self._parse_cache.move_to_end(key)
+            return self._parse_cache[key]
+
+        result = parse_func(content)
+        self._parse_cache[key] = result
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return result
+
     def parse_ddl_statements(self, sql_content: str) -> List[Dict[str, Any]]:
         """DDL 구문을 파싱하여 개별 구문으로 분리"""
         statements = []
 
         # CREATE TABLE 파싱
-        create_table_pattern = (
-            r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?\s*\("
-        )
-        for match in re.finditer(create_table_pattern, sql_content, re.IGNORECASE):
+        for match in _STATEMENT_CREATE_TABLE_RE.finditer(sql_content):
             statements.append({"type": "CREATE_TABLE", "table": match.group(1)})
 
         # CREATE INDEX 파싱
-        create_index_pattern = r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+`?(\w+)`?\s+ON\s+`?(\w+)`?\s*\(\s*`?(\w+)`?"
-        for match in re.finditer(create_index_pattern, sql_content, re.IGNORECASE):
+        for match in _STATEMENT_CREATE_INDEX_RE.finditer(sql_content):
             statements.append(
                 {
                     "type": "CREATE_INDEX",
@@ -44,18 +201,40 @@ class SQLParser:
 
         return statements
 
+    def split_statements(self, sql_content: str) -> Sequence[str]:
+        """
+        SQL 내용을 개별 구문으로 분리 (sqlparse가 없으면 세미콜론 기준 분리)
+
+        검증과 개별 쿼리 테스트에서 같은 파일을 반복 분리하지 않도록 캐시하며, 튜플로 반환한다.
+        """
+        return self._cached_parse("statements", sql_content, self._split_statements)
+
+    @staticmethod
+    def _split_statements(sql_content: str) -> tuple:
+        """split_statements 실제 구현 (캐시 미스 시 호출)"""
+        if sqlparse:
+            return tuple(sqlparse.split(sql_content))
+        return tuple(stmt.strip() for stmt in sql_content.split(";") if stmt.strip())
+
     def extract_ddl_type(self, ddl_content: str, debug_log=None) -> str:
         """혼합 SQL 파일 타입 추출 - SELECT 쿼리가 많으면 MIXED_SELECT로 분류"""
-        import re
+        return self._cached_parse(
+            "ddl_type",
+            ddl_content,
+            lambda content: self._extract_ddl_type(content, debug_log),
+        )
 
+    def _extract_ddl_type(self, ddl_content: str, debug_log=None) -> str:
+        """extract_ddl_type 실제 구현 (캐시 미스 시 호출)"""
         # 주석과 빈 줄을 제거하고 실제 구문만 추출
         # 먼저 /* */ 스타일 주석을 전체적으로 제거
-        ddl_content = re.sub(r"/\*.*?\*/", "", ddl_content, flags=re.DOTALL)
+        ddl_content = _BLOCK_COMMENT_RE.sub("", ddl_content)
 
-        lines = ddl_content.strip().split("\n")
-        ddl_lines = []
+        # 대소문자 변환은 라인/구문별로 반복하지 않고 전체 내용에 대해 한 번만 수행
+        ddl_upper = ddl_content.upper()
 
-        for line in lines:
+        ddl_lines = []
+        for line in ddl_upper.strip().split("\n"):
             line = line.strip()
             # 주석 라인이나 빈 라인 건너뛰기
             if line and not line.startswith("--") and not line.startswith("#"):
@@ -64,15 +243,8 @@ class SQLParser:
         if not ddl_lines:
             return "UNKNOWN"
 
-        # 전체 내용을 분석하여 구문 타입별 개수 계산
-        full_content = " ".join(ddl_lines).upper()
-
         # 개별 구문들을 분석
-        statements = []
-        for line in ddl_lines:
-            line_upper = line.upper().strip()
-            if line_upper and not line_upper.startswith("/*"):
-                statements.append(line_upper)
+        statements = [line for line in ddl_lines if not line.startswith("/*")]
 
         # 구문 타입별 개수 계산
         type_counts = {
@@ -89,51 +261,28 @@ class SQLParser:
         }
 
         # 각 구문 분석 - 세미콜론으로 분리된 실제 구문 단위로 계산
+        # (/* */ 스타일 주석은 위에서 전체 내용에 대해 이미 제거됨)
         sql_statements = [
-            stmt.strip() for stmt in ddl_content.split(";") if stmt.strip()
+            stmt.strip() for stmt in ddl_upper.split(";") if stmt.strip()
         ]
 
-        for stmt in sql_statements:
-            stmt_upper = stmt.upper().strip()
-
-            # /* */ 스타일 주석 제거
-            stmt_upper = re.sub(r"/\*.*?\*/", "", stmt_upper, flags=re.DOTALL)
-
-            # -- 스타일 주석 제거
+        # 구문 루프에서 반복 참조하는 전역 함수는 지역 이름으로 바인딩 (전역 조회 → 지역 조회)
+        classify = _classify_statement
+        for stmt_upper in sql_statements:
+            # -- 스타일 주석 제거 (라인별 strip()은 한 번만 수행)
             stmt_lines = [
-                line.strip()
-                for line in stmt_upper.split("\n")
-                if line.strip() and not line.strip().startswith("--")
+                line
+                for raw_line in stmt_upper.split("\n")
+                if (line := raw_line.strip()) and not line.startswith("--")
             ]
             if not stmt_lines:
                 continue
 
             stmt_clean = " ".join(stmt_lines).strip()
 
-            if stmt_clean.startswith("SELECT"):
-                type_counts["SELECT"] += 1
-            elif stmt_clean.startswith("INSERT"):
-                type_counts["INSERT"] += 1
-            elif stmt_clean.startswith("UPDATE"):
-                type_counts["UPDATE"] += 1
-            elif stmt_clean.startswith("DELETE"):
-                type_counts["DELETE"] += 1
-            elif stmt_clean.startswith("CREATE TABLE"):
-                type_counts["CREATE_TABLE"] += 1
-            elif stmt_clean.startswith("ALTER TABLE") or re.search(
-                r"\bALTER\s+TABLE\b", stmt_clean
-            ):
-                type_counts["ALTER_TABLE"] += 1
-            elif stmt_clean.startswith("CREATE INDEX"):
-                type_counts["CREATE_INDEX"] += 1
-            elif stmt_clean.startswith("DROP TABLE"):
-                type_counts["DROP_TABLE"] += 1
-            elif stmt_clean.startswith("DROP INDEX"):
-                type_counts["DROP_INDEX"] += 1
-            elif stmt_clean.startswith("RENAME TABLE") or re.search(
-                r"\bRENAME\s+TABLE\b", stmt_clean
-            ):
-                type_counts["RENAME"] += 1
+            stmt_type = classify(stmt_clean)
+            if stmt_type:
+                type_counts[stmt_type] += 1
 
         # 총 구문 수
         total_statements = sum(type_counts.values())
@@ -196,18 +345,30 @@ class SQLParser:
         else:
             return "UNKNOWN"
 
-    def parse_ddl_detailed(self, ddl_content: str) -> List[Dict[str, Any]]:
-        """DDL 구문을 상세하게 파싱하여 구문 유형별 정보 추출"""
-        ddl_statements = []
-
-        # CREATE TABLE 파싱
-        create_table_pattern = r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?\s*\((.*?)\)(?:\s*ENGINE\s*=\s*\w+)?(?:\s*COMMENT\s*=\s*[\'"][^\'"]*[\'"])?'
-        create_matches = re.findall(
-            create_table_pattern, ddl_content, re.DOTALL | re.IGNORECASE
+    def parse_ddl_detailed(self, ddl_content: str) -> Sequence[Mapping[str, Any]]:
+        """
+        DDL 구문을 상세하게 파싱하여 구문 유형별 정보 추출
+
+        캐시된 결과를 호출마다 복사하지 않도록 읽기 전용 뷰(tuple/MappingProxyType)로 반환한다.
+        """
+        return self._cached_parse(
+            "ddl_detailed",
+            ddl_content,
+            lambda content: tuple(
+                MappingProxyType(stmt) for stmt in self._parse_ddl_detailed(content)
+            ),
         )
 
-        for table_name, columns_def in create_matches:
-            columns_info = self.parse_create_table_columns(columns_def)
+    def _parse_ddl_detailed(self, ddl_content: str) -> List[Dict[str, Any]]:
+        """parse_ddl_detailed 실제 구현 (캐시 미스 시 호출)"""
+        ddl_statements = []
+
+        # CREATE TABLE 파싱 - 헤더 이후 괄호 짝이 맞는 위치까지를 컬럼 정의 블록으로 사용
+        # (DECIMAL(10,2)처럼 컬럼 정의 안의 괄호에서 블록이 잘리지 않도록 함)
+        for create_match in _STATEMENT_CREATE_TABLE_RE.finditer(ddl_content):
+            table_name = create_match.group(1)
+            parts, _ = _split_top_level_commas(ddl_content, create_match.end())
+            columns_info = self._parse_column_parts(parts)
             ddl_statements.append(
                 {
                     "type": "CREATE_TABLE",
@@ -217,33 +378,23 @@ class SQLParser:
                 }
             )
 
-        # ALTER TABLE 파싱
-        alter_patterns = [
-            # ADD COLUMN
-            (
-                r"ALTER\s+TABLE\s+`?(\w+)`?\s+ADD\s+(?:COLUMN\s+)?`?(\w+)`?\s+([^,;]+)",
-                "ADD_COLUMN",
-            ),
-            # DROP COLUMN
-            (
-                r"ALTER\s+TABLE\s+`?(\w+)`?\s+DROP\s+(?:COLUMN\s+)?`?(\w+)`?",
-                "DROP_COLUMN",
-            ),
-            # MODIFY COLUMN
-            (
-                r"ALTER\s+TABLE\s+`?(\w+)`?\s+MODIFY\s+(?:COLUMN\s+)?`?(\w+)`?\s+([^,;]+)",
-                "MODIFY_COLUMN",
-            ),
-            # CHANGE COLUMN
-            (
-                r"ALTER\s+TABLE\s+`?(\w+)`?\s+CHANGE\s+(?:COLUMN\s+)?`?(\w+)`?\s+`?(\w+)`?\s+([^,;]+)",
-                "CHANGE_COLUMN",
-            ),
-        ]
-
-        for pattern, alter_type in alter_patterns:
-            matches = re.findall(pattern, ddl_content, re.IGNORECASE)
-            for match in matches:
+        # ALTER TABLE 파싱 - 패턴별로 전체 내용을 다시 스캔하지 않고,
+        # ALTER TABLE 시작 위치를 한 번만 찾은 뒤 그 위치에서 각 패턴을 매칭
+        # (패턴별 findall과 동일하게 같은 패턴의 매칭끼리는 겹치지 않도록 처리)
+        alter_matches = {alter_type: [] for _, alter_type in _ALTER_PATTERNS}
+        last_end = dict.fromkeys(alter_matches, 0)
+        for anchor in _ALTER_TABLE_ANCHOR_RE.finditer(ddl_content):
+            pos = anchor.start()
+            for pattern, alter_type in _ALTER_PATTERNS:
+                if pos < last_end[alter_type]:
+                    continue
+                match = pattern.match(ddl_content, pos)
+                if match:
+                    alter_matches[alter_type].append(match.groups())
+                    last_end[alter_type] = match.end()
+
+        for _, alter_type in _ALTER_PATTERNS:
+            for match in alter_matches[alter_type]:
                 if alter_type == "CHANGE_COLUMN":
                     table_name, old_column, new_column, column_def = match
                     ddl_statements.append(
@@ -272,10 +423,7 @@ class SQLParser:
                     )
 
         # CREATE INDEX 파싱
-        create_index_pattern = (
-            r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+`?(\w+)`?\s+ON\s+`?(\w+)`?\s*\(([^)]+)\)"
-        )
-        index_matches = re.findall(create_index_pattern, ddl_content, re.IGNORECASE)
+        index_matches = _CREATE_INDEX_RE.findall(ddl_content)
 
         for index_name, table_name, columns in index_matches:
             ddl_statements.append(
@@ -290,17 +438,15 @@ class SQLParser:
             )
 
         # DROP TABLE 파싱
-        drop_table_pattern = r"DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?`?(\w+)`?"
-        drop_table_matches = re.findall(drop_table_pattern, ddl_content, re.IGNORECASE)
+        drop_table_matches = _DROP_TABLE_RE.findall(ddl_content)
 
         for table_name in drop_table_matches:
             ddl_statements.append({"type": "DROP_TABLE", "table": table_name.lower()})
 
         # DROP INDEX 파싱
-        drop_index_pattern = r"DROP\s+INDEX\s+`?(\w+)`?\s+ON\s+`?(\w+)`?"
-        drop_index_matches = re.findall(drop_index_pattern, ddl_content, re.IGNORECASE)
+        drop_index_matches = _DROP_INDEX_RE.findall(ddl_content)
 
-        print(f"[DEBUG] DROP INDEX 파싱 - 패턴: {drop_index_pattern}", file=sys.stderr)
+        print(f"[DEBUG] DROP INDEX 파싱 - 패턴: {_DROP_INDEX_RE.pattern}", file=sys.stderr)
         print(f"[DEBUG] DROP INDEX 파싱 - 입력: {repr(ddl_content)}", file=sys.stderr)
         print(f"[DEBUG] DROP INDEX 파싱 - 결과: {drop_index_matches}", file=sys.stderr)
 
@@ -322,29 +468,26 @@ class SQLParser:
 
     def parse_create_table_columns(self, columns_def: str) -> Dict[str, Any]:
         """CREATE TABLE의 컬럼 정의 파싱"""
+        # 컬럼 정의와 제약조건을 분리 (DECIMAL(10,2) 등 괄호 안의 콤마에서는 분리하지 않음)
+        parts, _ = _split_top_level_commas(columns_def)
+        return self._parse_column_parts(parts)
+
+    def _parse_column_parts(self, parts: List[str]) -> Dict[str, Any]:
+        """최상위 콤마로 분리된 컬럼 정의 조각들을 컬럼/제약조건으로 분류"""
         columns = []
         constraints = []
 
-        # 컬럼 정의와 제약조건을 분리
-        lines = [line.strip() for line in columns_def.split(",")]
-
-        for line in lines:
+        for line in parts:
             line = line.strip()
             if not line:
                 continue
 
             # 제약조건 확인
-            if re.match(
-                r"(?:CONSTRAINT|PRIMARY\s+KEY|FOREIGN\s+KEY|UNIQUE|INDEX|KEY)",
-                line,
-                re.IGNORECASE,
-            ):
+            if _CONSTRAINT_LINE_RE.match(line):
                 constraints.append(line)
             else:
                 # 컬럼 정의 파싱
-                column_match = re.match(
-                    r"`?(\w+)`?\s+([^,\s]+)(?:\s+(.*))?", line, re.IGNORECASE
-                )
+                column_match = _COLUMN_DEFINITION_RE.match(line)
                 if column_match:
                     column_name = column_match.group(1).lower()
                     data_type = column_match.group(2).upper()
@@ -360,15 +503,29 @@ class SQLParser:
 
         return {"columns": columns, "constraints": constraints}
 
-    def parse_ddl_constraints(self, ddl_content: str) -> Dict[str, List[Dict]]:
-        """DDL에서 제약조건 정보 추출"""
+    def parse_ddl_constraints(self, ddl_content: str) -> Mapping[str, Sequence[Mapping]]:
+        """
+        DDL에서 제약조건 정보 추출
+
+        캐시된 결과를 호출마다 복사하지 않도록 읽기 전용 뷰(MappingProxyType/tuple)로 반환한다.
+        """
+        return self._cached_parse(
+            "ddl_constraints",
+            ddl_content,
+            lambda content: MappingProxyType(
+                {
+                    key: tuple(MappingProxyType(item) for item in values)
+                    for key, values in self._parse_ddl_constraints(content).items()
+                }
+            ),
+        )
+
+    def _parse_ddl_constraints(self, ddl_content: str) -> Dict[str, List[Dict]]:
+        """parse_ddl_constraints 실제 구현 (캐시 미스 시 호출)"""
         constraints = {"foreign_keys": [], "indexes": [], "primary_keys": []}
 
         # 외래키 패턴 매칭
-        fk_pattern = (
-            r"FOREIGN\s+KEY\s*\(`?(\w+)`?\)\s*REFERENCES\s+`?(\w+)`?\s*\(`?(\w+)`?\)"
-        )
-        fk_matches = re.findall(fk_pattern, ddl_content, re.IGNORECASE)
+        fk_matches = _FOREIGN_KEY_RE.findall(ddl_content)
 
         for column, ref_table, ref_column in fk_matches:
             constraints["foreign_keys"].append(
@@ -9,6 +9,7 @@ Modules:
     - logging_utils: Logging utilities
     - parsers: SQL/DDL parsing utilities
     - formatters: HTML/Text formatting utilities
+    - report_templates: Precompiled HTML report templates
     - validators: Basic validation functions
 """
 
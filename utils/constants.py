@@ -124,6 +124,50 @@ QUERY_EXECUTION_TIMEOUT = 300
 API_REQUEST_TIMEOUT = 30
 
 
+# ============================================================================
+# DB 연결 풀 설정
+# ============================================================================
+
+MYSQL_POOL_SIZE = 5
+
+# 유지할 최대 MySQL 연결 풀 수 (접속 대상별 풀이 풀 크기만큼 연결을 미리 열므로,
+# 초과 시 가장 오래 사용하지 않은 풀을 닫음)
+MYSQL_MAX_POOLS = 8
+
+# 복수 SQL 파일 동시 검증 수 - 연결 풀 크기를 넘지 않도록 제한
+SQL_VALIDATION_CONCURRENCY = MYSQL_POOL_SIZE
+
+# 검증용 Lambda 동시 호출 수 (전체 검증 작업 공유) - Lambda 클라이언트 HTTP 연결 풀
+# (botocore 기본 max_pool_connections=10)을 넘지 않도록 제한하여 풀 고갈과 Lambda 스로틀링 방지
+LAMBDA_CALL_CONCURRENCY = 10
+
+# Secret 파싱 결과 캐시 유지 시간 (초) - 비밀번호 교체 반영을 위해 짧게 유지
+SECRET_CACHE_TTL_SECONDS = 300
+
+# 스키마 정보 캐시 - 연속 검증 시 information_schema 재조회 방지
+# (매 호출 지문 쿼리로 변경을 감지하므로, TTL은 지문에 잡히지 않는 변경의 최대 반영 지연 시간)
+SCHEMA_CACHE_TTL_SECONDS = 300
+SCHEMA_CACHE_MAX_ENTRIES = 32
+
+# 클러스터 구성 인스턴스 목록 캐시 - 리더 오토스케일링/페일오버로 구성이 바뀌므로
+# 한 번의 분석 실행 안에서 같은 클러스터를 가리키는 Secret들의 중복 조회만 막을 정도로 짧게 유지
+CLUSTER_MEMBERS_CACHE_TTL_SECONDS = 30
+
+# 호스트로 찾은 클러스터 상세 캐시 - 연속 요청 시 describe_db_clusters 중복 호출 방지
+CLUSTER_LIST_CACHE_TTL_SECONDS = 30
+
+# 사용자 데이터베이스 목록 캐시 - list_databases 직후 select_database의 재조회 방지
+DATABASE_LIST_CACHE_TTL_SECONDS = 60
+
+
+# ============================================================================
+# 조회 제한 설정
+# ============================================================================
+
+# 시크릿 목록 표시 최대 개수 (도달 시 페이지네이션 조기 종료)
+SECRET_LIST_DISPLAY_LIMIT = 100
+
+
 # ============================================================================
 # 재시도 설정
 # ============================================================================
@@ -4,6 +4,7 @@
 HTML, 텍스트 등의 포맷팅 유틸리티 함수들을 제공합니다.
 """
 
+import html
 from typing import Dict, Any, List
 from datetime import datetime
 
@@ -243,13 +244,8 @@ def escape_html(text: str) -> str:
         >>> escape_html("<script>alert('xss')</script>")
         '&lt;script&gt;alert(&#x27;xss&#x27;)&lt;/script&gt;'
     """
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#x27;")
-    )
+    # 표준 라이브러리 html.escape로 한 번에 치환 (결과는 기존 5단계 replace와 동일)
+    return html.escape(text, quote=True)
 
 
 def format_metric_value(value: Any, metric_name: str) -> str:
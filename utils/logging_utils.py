@@ -4,8 +4,13 @@
 작업별 세션 로그 및 디버그 로그 기능을 제공합니다.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple, Callable
@@ -21,6 +26,72 @@ logging.basicConfig(
 # 로거 인스턴스
 logger = logging.getLogger(__name__)
 
+# 디버그 로그 전용 로거 - 파일 I/O는 QueueListener 백그라운드 스레드에서 수행
+_debug_queue = queue.SimpleQueue()
+_debug_logger = logging.getLogger("db_assistant.debug")
+_debug_logger.setLevel(logging.DEBUG)
+_debug_logger.propagate = False
+_debug_logger.addHandler(logging.handlers.QueueHandler(_debug_queue))
+_debug_listener = None
+_debug_listener_lock = threading.Lock()
+
+
+class _DailyDebugFileHandler(logging.Handler):
+    """
+    일자별 debug_YYYYMMDD.log 파일 핸들러
+
+    호출마다 파일을 열고 닫지 않고, 날짜나 디렉토리가 바뀔 때만 파일을 다시 연다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._path = None
+        self._stream = None
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            logs_dir = Path(getattr(record, "logs_dir", "logs"))
+            day = time.strftime("%Y%m%d", time.localtime(record.created))
+            path = logs_dir / f"debug_{day}.log"
+
+            if path != self._path:
+                self.close_stream()
+                # 디렉토리가 없으면 생성
+                path.parent.mkdir(exist_ok=True)
+                self._stream = open(path, "a", encoding="utf-8")
+                self._path = path
+
+            clock = time.strftime("%H:%M:%S", time.localtime(record.created))
+            self._stream.write(f"{clock} - {record.getMessage()}\n")
+            self._stream.flush()
+        except Exception:
+            pass  # 로그 실패 시 무시
+
+    def close_stream(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self._path = None
+
+    def close(self):
+        self.close_stream()
+        super().close()
+
+
+def _ensure_debug_listener():
+    """디버그 로그 백그라운드 리스너를 최초 호출 시 한 번만 시작"""
+    global _debug_listener
+    if _debug_listener is not None:
+        return
+    with _debug_listener_lock:
+        if _debug_listener is None:
+            listener = logging.handlers.QueueListener(
+                _debug_queue, _DailyDebugFileHandler()
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            _debug_listener = listener
+
 
 def create_session_log(operation_name: str = "operation", logs_dir: Path = None) -> Tuple[Callable, str]:
     """
@@ -80,17 +151,14 @@ def debug_log(message: str, logs_dir: Path = None):
 
     Note:
         로그 실패 시 예외를 발생시키지 않고 무시합니다.
+        파일 쓰기는 백그라운드 스레드에서 수행되어 호출자를 블로킹하지 않습니다.
     """
     if logs_dir is None:
         logs_dir = Path("logs")
 
-    debug_log_path = logs_dir / f"debug_{datetime.now().strftime('%Y%m%d')}.log"
     try:
-        # 디렉토리가 없으면 생성
-        debug_log_path.parent.mkdir(exist_ok=True)
-
-        with open(debug_log_path, "a", encoding="utf-8") as f:
-            f.write(f"{datetime.now().strftime('%H:%M:%S')} - {message}\n")
+        _ensure_debug_listener()
+        _debug_logger.debug(message, extra={"logs_dir": str(logs_dir)})
     except Exception:
         pass  # 로그 실패 시 무시
 
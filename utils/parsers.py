@@ -10,6 +10,86 @@ from pathlib import Path
 from typing import Dict, Any, Tuple, Optional, List
 
 
+# 테이블명으로 취급하지 않을 키워드 (함수 호출마다 집합을 새로 만들지 않도록 모듈 상수로 유지)
+# extract_created_tables: 소문자 비교
+SQL_KEYWORDS_NOT_TABLE = frozenset(
+    {
+        "and",
+        "or",
+        "not",
+        "in",
+        "on",
+        "as",
+        "is",
+        "if",
+        "by",
+        "to",
+        "from",
+        "where",
+        "select",
+        "insert",
+        "update",
+        "delete",
+    }
+)
+
+# extract_table_names: 대문자 비교
+MYSQL_KEYWORDS_NOT_TABLE = frozenset(
+    {
+        "CURRENT_TIMESTAMP",
+        "NOW",
+        "NULL",
+        "TRUE",
+        "FALSE",
+        "DEFAULT",
+        "AUTO_INCREMENT",
+        "PRIMARY",
+        "KEY",
+        "UNIQUE",
+        "INDEX",
+        "FOREIGN",
+        "REFERENCES",
+        "ON",
+        "DELETE",
+        "UPDATE",
+        "CASCADE",
+        "SET",
+        "RESTRICT",
+        "NO",
+        "ACTION",
+        "CHECK",
+        "CONSTRAINT",
+        "ENUM",
+        "VARCHAR",
+        "INT",
+        "DECIMAL",
+        "DATETIME",
+        "TIMESTAMP",
+        "TEXT",
+        "BOOLEAN",
+        "TINYINT",
+        "SMALLINT",
+        "MEDIUMINT",
+        "BIGINT",
+        "FLOAT",
+        "DOUBLE",
+        "CHAR",
+        "BINARY",
+        "VARBINARY",
+        "BLOB",
+        "TINYBLOB",
+        "MEDIUMBLOB",
+        "LONGBLOB",
+        "TINYTEXT",
+        "MEDIUMTEXT",
+        "LONGTEXT",
+        "DATE",
+        "TIME",
+        "YEAR",
+    }
+)
+
+
 def parse_table_name(full_table_name: str) -> Tuple[Optional[str], str]:
     """
     테이블명에서 스키마와 테이블명을 분리
@@ -338,26 +418,8 @@ def extract_created_tables(sql_content: str) -> List[str]:
     create_matches = re.findall(create_pattern, sql_clean, re.IGNORECASE)
 
     # 유효한 테이블명만 필터링 (SQL 키워드 제외)
-    sql_keywords = {
-        "and",
-        "or",
-        "not",
-        "in",
-        "on",
-        "as",
-        "is",
-        "if",
-        "by",
-        "to",
-        "from",
-        "where",
-        "select",
-        "insert",
-        "update",
-        "delete",
-    }
     for table in create_matches:
-        if table.lower() not in sql_keywords and len(table) > 1:
+        if table.lower() not in SQL_KEYWORDS_NOT_TABLE and len(table) > 1:
             tables.add(table)
 
     return list(tables)
@@ -493,66 +555,12 @@ def extract_table_names(sql_content: str) -> List[str]:
     # WITH절의 CTE 테이블들 추출
     cte_tables = set(extract_cte_tables(sql_content))
 
-    # MySQL 키워드들 (테이블명이 아닌 것들)
-    mysql_keywords = {
-        "CURRENT_TIMESTAMP",
-        "NOW",
-        "NULL",
-        "TRUE",
-        "FALSE",
-        "DEFAULT",
-        "AUTO_INCREMENT",
-        "PRIMARY",
-        "KEY",
-        "UNIQUE",
-        "INDEX",
-        "FOREIGN",
-        "REFERENCES",
-        "ON",
-        "DELETE",
-        "UPDATE",
-        "CASCADE",
-        "SET",
-        "RESTRICT",
-        "NO",
-        "ACTION",
-        "CHECK",
-        "CONSTRAINT",
-        "ENUM",
-        "VARCHAR",
-        "INT",
-        "DECIMAL",
-        "DATETIME",
-        "TIMESTAMP",
-        "TEXT",
-        "BOOLEAN",
-        "TINYINT",
-        "SMALLINT",
-        "MEDIUMINT",
-        "BIGINT",
-        "FLOAT",
-        "DOUBLE",
-        "CHAR",
-        "BINARY",
-        "VARBINARY",
-        "BLOB",
-        "TINYBLOB",
-        "MEDIUMBLOB",
-        "LONGBLOB",
-        "TINYTEXT",
-        "MEDIUMTEXT",
-        "LONGTEXT",
-        "DATE",
-        "TIME",
-        "YEAR",
-    }
-
     # CREATE TABLE 패턴 - 스키마 정보 포함 처리
     create_pattern = r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(?:([a-zA-Z_][a-zA-Z0-9_]*)\.)??`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\("
     create_matches = re.findall(create_pattern, sql_clean, re.IGNORECASE)
     for schema, table in create_matches:
         full_table_name = f"{schema}.{table}" if schema else table
-        if table.upper() not in mysql_keywords:
+        if table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
             tables.add(full_table_name)
 
     # ALTER TABLE 패턴 - 스키마 정보 포함 처리
@@ -560,7 +568,7 @@ def extract_table_names(sql_content: str) -> List[str]:
     alter_matches = re.findall(alter_pattern, sql_clean, re.IGNORECASE)
     for schema, table in alter_matches:
         full_table_name = f"{schema}.{table}" if schema else table
-        if table.upper() not in mysql_keywords:
+        if table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
             tables.add(full_table_name)
 
     # DROP TABLE 패턴 - 스키마 정보 포함 처리
@@ -568,7 +576,7 @@ def extract_table_names(sql_content: str) -> List[str]:
     drop_matches = re.findall(drop_pattern, sql_clean, re.IGNORECASE)
     for schema, table in drop_matches:
         full_table_name = f"{schema}.{table}" if schema else table
-        if table.upper() not in mysql_keywords:
+        if table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
             tables.add(full_table_name)
 
     # FROM 패턴 (SELECT, DELETE) - 스키마 정보 포함 처리
@@ -576,7 +584,7 @@ def extract_table_names(sql_content: str) -> List[str]:
     from_matches = re.findall(from_pattern, sql_clean, re.IGNORECASE)
     for schema, table in from_matches:
         full_table_name = f"{schema}.{table}" if schema else table
-        if table not in cte_tables and table.upper() not in mysql_keywords:
+        if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
             tables.add(full_table_name)
 
     # JOIN 패턴 - 스키마 정보 포함 처리
@@ -584,7 +592,7 @@ def extract_table_names(sql_content: str) -> List[str]:
     join_matches = re.findall(join_pattern, sql_clean, re.IGNORECASE)
     for schema, table in join_matches:
         full_table_name = f"{schema}.{table}" if schema else table
-        if table not in cte_tables and table.upper() not in mysql_keywords:
+        if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
             tables.add(full_table_name)
 
     # UPDATE 패턴 - 스키마 정보 포함 처리
@@ -592,7 +600,7 @@ def extract_table_names(sql_content: str) -> List[str]:
     update_matches = re.findall(update_pattern, sql_clean, re.IGNORECASE)
     for schema, table in update_matches:
         full_table_name = f"{schema}.{table}" if schema else table
-        if table not in cte_tables and table.upper() not in mysql_keywords:
+        if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
             tables.add(full_table_name)
 
     # INSERT INTO 패턴 - 스키마 정보 포함 처리
@@ -600,7 +608,7 @@ def extract_table_names(sql_content: str) -> List[str]:
     insert_matches = re.findall(insert_pattern, sql_clean, re.IGNORECASE)
     for schema, table in insert_matches:
         full_table_name = f"{schema}.{table}" if schema else table
-        if table not in cte_tables and table.upper() not in mysql_keywords:
+        if table not in cte_tables and table.upper() not in MYSQL_KEYWORDS_NOT_TABLE:
             tables.add(full_table_name)
 
     return list(tables)
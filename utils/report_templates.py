@@ -0,0 +1,606 @@
+"""
+보고서 템플릿 모듈
+
+HTML 보고서의 정적 CSS/HTML 골격을 모듈 로드 시 한 번만 생성하여 재사용합니다.
+"""
+
+from string import Template
+
+
+# ============================================================================
+# SQL 검증보고서 템플릿
+# ============================================================================
+
+# 보고서 생성 시마다 대용량 f-string을 다시 조립하지 않도록 string.Template로 미리 컴파일
+_SQL_VALIDATION_REPORT_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SQL 검증보고서 - $filename</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 10px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.5em;
+            font-weight: 300;
+        }
+        .status-badge {
+            display: inline-block;
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-weight: bold;
+            margin-top: 10px;
+            background-color: $status_color;
+        }
+        .content {
+            padding: 30px;
+        }
+        .summary-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .summary-item {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            border-left: 4px solid #667eea;
+        }
+        .summary-item h4 {
+            margin: 0 0 10px 0;
+            color: #333;
+        }
+        .summary-item p {
+            margin: 0;
+            font-size: 1.1em;
+            font-weight: 500;
+        }
+        .info-section, .issues-section {
+            margin: 30px 0;
+            padding: 20px;
+            border-radius: 8px;
+            border: 1px solid #e9ecef;
+        }
+        .info-section h3, .issues-section h3 {
+            margin-top: 0;
+            color: #495057;
+            border-bottom: 2px solid #e9ecef;
+            padding-bottom: 10px;
+        }
+        .info-table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        .info-table td {
+            padding: 10px;
+            border-bottom: 1px solid #e9ecef;
+        }
+        .info-table td:first-child {
+            width: 150px;
+            background: #f8f9fa;
+        }
+        .issues-list {
+            margin: 10px 0;
+            padding-left: 20px;
+        }
+        .issues-list li {
+            margin: 5px 0;
+        }
+        .status-success {
+            color: #28a745;
+            font-weight: bold;
+        }
+        .status-error {
+            color: #dc3545;
+            font-weight: bold;
+        }
+        .no-issues {
+            color: #28a745;
+            font-weight: 500;
+        }
+        .issues-section.success {
+            background: #d4edda;
+            border-color: #28a745;
+        }
+        .sql-code {
+            background: #f8f9fa;
+            border: 1px solid #e9ecef;
+            border-radius: 6px;
+            padding: 20px;
+            margin: 20px 0;
+            font-family: 'Courier New', monospace;
+            overflow-x: auto;
+            overflow-y: auto;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            max-height: 300px;
+        }
+        .claude-section {
+            margin: 30px 0;
+            padding: 25px;
+            border-radius: 8px;
+            border: 2px solid #667eea;
+            background: #f8f9ff;
+            box-shadow: 0 2px 10px rgba(102, 126, 234, 0.1);
+        }
+        .claude-section h3 {
+            margin-top: 0;
+            color: #495057;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+            font-size: 1.3em;
+        }
+        .claude-result {
+            margin: 20px 0;
+            padding: 0;
+            background: white;
+            border-radius: 8px;
+            border: 1px solid #e9ecef;
+            box-shadow: 0 1px 5px rgba(0,0,0,0.05);
+        }
+        .claude-text {
+            background: white;
+            border: 1px solid #e9ecef;
+            border-radius: 4px;
+            padding: 20px;
+            margin: 0;
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            font-size: 14px;
+            line-height: 1.8;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            overflow-x: auto;
+            max-height: 800px;  /* 400px에서 800px로 증가 */
+            overflow-y: auto;
+            min-height: 100px;
+            resize: vertical;  /* 사용자가 수직으로 크기 조절 가능 */
+        }
+        .validation-subsection {
+            margin: 15px 0;
+            padding: 15px;
+            border-radius: 6px;
+            border-left: 4px solid #28a745;
+            background: #f8fff9;
+        }
+        .validation-subsection h4 {
+            margin: 0 0 10px 0;
+            color: #495057;
+            font-size: 1.1em;
+        }
+        .validation-text {
+            background: white;
+            border: 1px solid #e9ecef;
+            border-radius: 4px;
+            padding: 15px;
+            margin: 0;
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            font-size: 13px;
+            line-height: 1.6;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            overflow-x: auto;
+            max-height: 300px;
+            overflow-y: auto;
+        }
+        .success-text {
+            color: #28a745;
+            font-weight: 500;
+            margin: 0;
+        }
+        .footer {
+            background: #f8f9fa;
+            padding: 20px;
+            text-align: center;
+            color: #6c757d;
+            border-top: 1px solid #e9ecef;
+        }
+        @media (max-width: 768px) {
+            .summary-grid {
+                grid-template-columns: 1fr;
+            }
+            .container {
+                margin: 10px;
+            }
+            body {
+                padding: 10px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>$status_icon SQL 검증보고서</h1>
+            <div class="status-badge">$status</div>
+        </div>
+        
+        <div class="content">
+            <div class="summary-grid">
+                <div class="summary-item">
+                    <h4>📄 파일명</h4>
+                    <p>$filename</p>
+                </div>
+                <div class="summary-item">
+                    <h4>🕒 검증 일시</h4>
+                    <p>$generated_at</p>
+                </div>
+                <div class="summary-item">
+                    <h4>🔧 SQL 타입</h4>
+                    <p>$sql_type</p>
+                </div>
+                <div class="summary-item">
+                    <h4>🗄️ 데이터베이스</h4>
+                    <p>$database</p>
+                </div>
+            </div>
+            
+            $db_info_section
+            
+            <div class="info-section">
+                <h3>📝 원본 SQL</h3>
+                <div class="sql-code">$ddl_content</div>
+            </div>
+            
+            <div class="claude-section">
+                <h3>🔍 통합 검증 결과 (스키마 + 쿼리성능)</h3>
+                <div class="claude-result">
+                    $combined_validation_content
+                </div>
+            </div>
+            
+        </div>
+        
+        <div class="footer">
+            <p>Generated by DB Assistant MCP Server</p>
+            <p>Report generated at $generated_at</p>
+        </div>
+    </div>
+</body>
+</html>"""
+
+# 크기가 큰 원본 SQL과 검증 결과는 문자열로 합치지 않고 파일에 바로 쓰도록 앞/중간/뒤로 분리
+_head, _rest = _SQL_VALIDATION_REPORT_HTML.split("$ddl_content", 1)
+_middle, _tail = _rest.split("$combined_validation_content", 1)
+
+SQL_VALIDATION_REPORT_HEAD = Template(_head)
+SQL_VALIDATION_REPORT_MIDDLE = _middle
+SQL_VALIDATION_REPORT_TAIL = Template(_tail)
+
+
+# ============================================================================
+# 통합 검증 보고서 템플릿 (generate_consolidated_report)
+# ============================================================================
+
+# CSS 중괄호를 이스케이프할 필요 없이 골격을 한 번만 컴파일
+CONSOLIDATED_REPORT_HTML = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>통합 검증 보고서</title>
+    <style>
+        body { font-family: 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
+        .container { max-width: 1400px; margin: 0 auto; background: white; border-radius: 10px; box-shadow: 0 0 20px rgba(0,0,0,0.1); }
+        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; text-align: center; }
+        .header h1 { margin: 0; font-size: 2.5em; font-weight: 300; }
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 30px; }
+        .stat-card { background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid #667eea; }
+        .stat-number { font-size: 2em; font-weight: bold; color: #333; }
+        .stat-label { color: #666; margin-top: 5px; }
+        .table-container { margin: 30px; overflow-x: auto; }
+        table { width: 100%; border-collapse: collapse; background: white; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background: #f8f9fa; font-weight: 600; }
+        tr:hover { background: #f8f9fa; }
+        .status-badge { padding: 4px 8px; border-radius: 4px; font-size: 0.8em; font-weight: bold; }
+        .status-badge.pass { background: #d4edda; color: #155724; }
+        .status-badge.fail { background: #f8d7da; color: #721c24; }
+        code { background: #f1f3f4; padding: 2px 4px; border-radius: 3px; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 통합 검증 보고서</h1>
+            <p>생성일시: $generated_at</p>
+        </div>
+        
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-number">$total_reports</div>
+                <div class="stat-label">총 보고서</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">$passed_reports</div>
+                <div class="stat-label">검증 통과</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">$failed_reports</div>
+                <div class="stat-label">검증 실패</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">$pass_rate%</div>
+                <div class="stat-label">성공률</div>
+            </div>
+        </div>
+        
+        <div class="table-container">
+            <h2>📋 보고서 목록 (클릭하여 상세 보기)</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>#</th>
+                        <th>파일명</th>
+                        <th>SQL 미리보기</th>
+                        <th>검증 결과</th>
+                        <th>요약</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    $table_rows
+                </tbody>
+            </table>
+        </div>
+    </div>
+    
+    <script>
+        function openReport(filename) {
+            window.open(filename, '_blank');
+        }
+    </script>
+</body>
+</html>""")
+
+CONSOLIDATED_REPORT_ROW = Template("""
+                <tr onclick="openReport('$html_file')" style="cursor: pointer;">
+                    <td>$index</td>
+                    <td>$status_icon $filename</td>
+                    <td><code>$sql_preview</code></td>
+                    <td><span class="status-badge $status_class">$status</span></td>
+                    <td>$summary</td>
+                </tr>
+                """)
+
+
+# ============================================================================
+# 통합 SQL 검증보고서 템플릿 (generate_consolidated_html_report)
+# ============================================================================
+
+# 호출마다 CSS 중괄호를 이중 이스케이프한 대용량 f-string을 다시 만들지 않도록 한 번만 컴파일
+_CONSOLIDATED_VALIDATION_REPORT_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>통합 SQL 검증보고서</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 10px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.5em;
+            font-weight: 300;
+        }
+        .summary-stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 20px;
+            margin: 30px;
+        }
+        .stat-item {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            border-left: 4px solid #667eea;
+        }
+        .stat-number {
+            font-size: 2em;
+            font-weight: bold;
+            color: #333;
+        }
+        .stat-label {
+            color: #666;
+            margin-top: 5px;
+        }
+        .file-section {
+            margin: 20px 30px;
+            border: 1px solid #e9ecef;
+            border-radius: 8px;
+            overflow: hidden;
+        }
+        .file-section.success {
+            border-left: 4px solid #28a745;
+        }
+        .file-section.error {
+            border-left: 4px solid #dc3545;
+        }
+        .file-section h3 {
+            margin: 0;
+            padding: 15px 20px;
+            background: #f8f9fa;
+            border-bottom: 1px solid #e9ecef;
+        }
+        .file-section h3 a {
+            color: #495057;
+            text-decoration: none;
+        }
+        .file-section h3 a:hover {
+            color: #007bff;
+            text-decoration: underline;
+        }
+        .file-details {
+            padding: 20px;
+        }
+        .file-info {
+            display: flex;
+            gap: 20px;
+            margin-bottom: 15px;
+            flex-wrap: wrap;
+        }
+        .file-info span {
+            background: #e9ecef;
+            padding: 5px 10px;
+            border-radius: 4px;
+            font-size: 0.9em;
+        }
+        .sql-code {
+            background: #f8f9fa;
+            border: 1px solid #e9ecef;
+            border-radius: 6px;
+            padding: 15px;
+            margin: 15px 0;
+            font-family: 'Courier New', monospace;
+            overflow-x: auto;
+            overflow-y: auto;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            max-height: 300px;
+            font-size: 0.9em;
+        }
+        .issues-section {
+            margin-top: 15px;
+            padding: 15px;
+            background: #fff5f5;
+            border: 1px solid #fed7d7;
+            border-radius: 6px;
+        }
+        .issues-section h4 {
+            margin: 0 0 10px 0;
+            color: #c53030;
+        }
+        .issues-list {
+            margin: 0;
+            padding-left: 20px;
+        }
+        .issues-list li {
+            margin: 5px 0;
+            color: #c53030;
+        }
+        .no-issues {
+            color: #38a169;
+            margin: 0;
+            font-weight: 500;
+        }
+        .footer {
+            background: #f8f9fa;
+            padding: 20px;
+            text-align: center;
+            color: #6c757d;
+            border-top: 1px solid #e9ecef;
+        }
+        @media (max-width: 768px) {
+            .summary-stats {
+                grid-template-columns: 1fr;
+                margin: 20px;
+            }
+            .file-section {
+                margin: 20px 15px;
+            }
+            .file-info {
+                flex-direction: column;
+                gap: 10px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 통합 SQL 검증보고서</h1>
+            <p>데이터베이스: $database_secret</p>
+            <p>검증 일시: $generated_at</p>
+        </div>
+        
+        <div class="summary-stats">
+            <div class="stat-item">
+                <div class="stat-number">$total_files</div>
+                <div class="stat-label">총 파일 수</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number" style="color: #28a745;">$passed_files</div>
+                <div class="stat-label">통과</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number" style="color: #dc3545;">$failed_files</div>
+                <div class="stat-label">실패</div>
+            </div>
+            <div class="stat-item">
+                <div class="stat-number">$pass_rate%</div>
+                <div class="stat-label">성공률</div>
+            </div>
+        </div>
+        
+        $file_sections
+        
+        <div class="footer">
+            <p>Generated by DB Assistant MCP Server</p>
+            <p>Report generated at $generated_at</p>
+        </div>
+    </div>
+</body>
+</html>"""
+
+# 파일별 섹션은 하나의 문자열로 합치지 않고 파일에 바로 쓰도록 앞/뒤로 분리
+_head, _tail = _CONSOLIDATED_VALIDATION_REPORT_HTML.split("$file_sections", 1)
+
+CONSOLIDATED_VALIDATION_REPORT_HEAD = Template(_head)
+CONSOLIDATED_VALIDATION_REPORT_TAIL = Template(_tail)
+
+CONSOLIDATED_VALIDATION_FILE_SECTION = Template("""
+                <div class="file-section $status_class">
+                    <h3>$status_icon $index. $filename</h3>
+                    <div class="file-details">
+                        <div class="file-info">
+                            <span><strong>DDL 타입:</strong> $ddl_type</span>
+                            <span><strong>상태:</strong> $status</span>
+                            <span><strong>문제 수:</strong> $issue_count개</span>
+                        </div>
+                        <div class="sql-code">
+$ddl_content
+                        </div>
+                        $issues_section
+                    </div>
+                </div>
+                """)